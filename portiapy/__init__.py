@@ -11,8 +11,11 @@ __emails__ = ['lucas@agrinessedge.com', 'matheus@agrinessedge.com']
 from .version import __version__
 
 
-__all__ = ['axioms', 'describe', 'phases', 'portia', 'profile', 'select',
-		   'specs', 'summary', 'utils']
+__all__ = ['accessors', 'async_portia', 'axioms', 'cache', 'chunking',
+		   'describe', 'fanout', 'fleet', 'history', 'lazy', 'limiter',
+		   'metrics', 'phases', 'plotting', 'poller', 'portia', 'profile',
+		   'select', 'singleflight', 'specs', 'summary', 'transport', 'utils',
+		   'widgets']
 
 
 name = 'portiapy'
@@ -0,0 +1,142 @@
+"""pandas accessor that gives every data frame Portia's tools, so copies,
+slices and concatenations of results keep them:
+
+    dataframe.portia.humanize(locale='pt-br')
+    dataframe.portia.summarize(SummaryStrategies.PER_DAY)
+
+It is registered when the first result is built, or by register, so
+importing portiapy doesn't load pandas.
+
+The humanize method still bound to the data frames portiapy returns is a
+deprecated shim of dataframe.portia.humanize(). JSON results are humanized
+in place, with no copy, by utils.humanize_json.
+"""
+
+import warnings
+import threading
+
+import portiapy.lazy as lazy
+import portiapy.summary as summary
+import portiapy.utils as utils
+
+
+pd = lazy.load('pandas')
+
+
+_registered = False
+_registered_lock = threading.Lock()
+
+
+def register():
+    """Registers the 'portia' accessor of data frames, once.
+    """
+    global _registered
+
+    if _registered == True:
+        return
+
+    with _registered_lock:
+        if _registered == False:
+            pd.api.extensions.register_dataframe_accessor('portia')(
+                PortiaAccessor
+            )
+            _registered = True
+
+
+def deprecated_humanize(
+    dataframe: 'pd.DataFrame',
+    locale: str='en-us',
+    custom_dimension: dict=None,
+    custom_event: dict=None,
+    custom_unity: dict=None
+) -> 'pd.DataFrame':
+    """Humanizes a result, as the humanize method bound to the data frames
+    portiapy returns. It's deprecated, only kept so code calling
+    result.humanize() keeps working; frames derived from results don't have
+    it, while dataframe.portia.humanize() works on all of them.
+
+    Arguments:
+        dataframe {pd.DataFrame} -- data frame to be humanized
+
+    Keyword Arguments:
+        locale {str} -- which language to use when humanizing
+                        (default {'en-us'})
+        custom_dimension {dict} -- custom list of dimension codes
+                                   (default {None})
+        custom_event {dict} -- custom list of event codes (default {None})
+        custom_unity {dict} -- custom list of unity codes (default {None})
+
+    Returns:
+        pd.DataFrame -- humanized data frame
+    """
+    warnings.warn(
+        'dataframe.humanize() is deprecated, use dataframe.portia.humanize()',
+        DeprecationWarning,
+        stacklevel=2
+    )
+
+    return utils.humanize_dataframe(
+        dataframe, locale, custom_dimension, custom_event, custom_unity
+    )
+
+
+class PortiaAccessor(object):
+    """Portia's tools for data frames, as dataframe.portia.
+    """
+    def __init__(self, dataframe: 'pd.DataFrame'):
+        """PortiaAccessor's constructor.
+
+        Arguments:
+            dataframe {pd.DataFrame} -- data frame the accessor belongs to
+        """
+        self._dataframe = dataframe
+
+    def humanize(
+        self,
+        locale: str='en-us',
+        custom_dimension: dict=None,
+        custom_event: dict=None,
+        custom_unity: dict=None
+    ) -> 'pd.DataFrame':
+        """Humanizes the data frame's codes, added as categorical columns.
+
+        Keyword Arguments:
+            locale {str} -- which language to use when humanizing
+                            (default {'en-us'})
+            custom_dimension {dict} -- custom list of dimension codes
+                                       (default {None})
+            custom_event {dict} -- custom list of event codes (default {None})
+            custom_unity {dict} -- custom list of unity codes (default {None})
+
+        Returns:
+            pd.DataFrame -- humanized data frame
+        """
+        return utils.humanize_dataframe(
+            self._dataframe,
+            locale,
+            custom_dimension,
+            custom_event,
+            custom_unity
+        )
+
+    def summarize(
+        self,
+        strategy: summary.SummaryStrategies=summary.SummaryStrategies.PER_HOUR,
+        interval: int=1,
+        params: dict=None
+    ) -> 'pd.DataFrame':
+        """Summarizes the series locally, as the summary endpoints would.
+
+        Keyword Arguments:
+            strategy {SummaryStrategies} -- strategy to summarize with
+                                            (default:
+                                            {SummaryStrategies.PER_HOUR})
+            interval {int} -- number of periods of each interval
+                              (default: {1})
+            params {dict} -- summary params (default: {None})
+
+        Returns:
+            pd.DataFrame -- summarized series
+        """
+        return summary.summarize(self._dataframe, strategy, interval, params)
+
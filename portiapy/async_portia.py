@@ -0,0 +1,943 @@
+"""Asynchronous counterpart of the portia module, where every call that reaches
+the service is a coroutine sharing one pooled connection.
+"""
+
+import time
+import asyncio
+import functools
+
+import portiapy.utils as utils
+import portiapy.portia as portia
+import portiapy.metrics as metrics
+import portiapy.profile as profile
+import portiapy.summary as summary
+import portiapy.describe as describe
+from portiapy.transport import AsyncPortiaTransport
+
+
+SCHEMAS = {
+	'select': utils.SELECT_SCHEMA,
+	'events': utils.EVENTS_SCHEMA
+}
+
+async def http_request(
+	method: str,
+	portia_config: dict,
+	endpoint: str,
+	payload: dict=None,
+	params: dict=None,
+	optional_headers: dict=None
+) -> object:
+	"""Makes an HTTP request through the configuration's asynchronous
+	transport, each of whose attempts waits for the configuration's
+	'limiter', when set, emitting a 'request' event to the configuration's
+	metrics sinks.
+
+	Arguments:
+		method {str} -- HTTP method
+		portia_config {dict} -- Portia's configuration arguments
+		endpoint {str} -- endpoint to make the request to
+
+	Keyword Arguments:
+		payload {dict} -- payload to send to the service (default: {None})
+		params {dict} -- params to send to the service (default: {None})
+		optional_headers {dict} -- dictionary with other headers
+								   (default: {None})
+
+	Returns:
+		object -- response object
+	"""
+	labels = metrics.labels(endpoint)
+	url = '{0}{1}'.format(portia_config.get('baseurl'), endpoint)
+	options = {}
+
+	# only given when set, so transports predating limiters keep working
+	if portia_config.get('limiter') is not None:
+		options['limiter'] = portia_config['limiter']
+
+	start = time.time()
+
+	try:
+		response = await portia_config['async_transport'].request(
+			method,
+			url,
+			headers=utils.request_headers(portia_config, optional_headers),
+			params=params,
+			payload=payload,
+			**options
+		)
+		end = time.time()
+	except Exception as err:
+		metrics.emit(
+			portia_config,
+			'request',
+			method=method,
+			url=url,
+			endpoint=endpoint,
+			seconds=time.time() - start,
+			error=type(err).__name__,
+			**labels
+		)
+		raise
+
+	response.portia_labels = labels
+
+	metrics.emit(
+		portia_config,
+		'request',
+		method=method,
+		url=str(response.url),
+		endpoint=endpoint,
+		status=response.status_code,
+		seconds=end - start,
+		queued=getattr(response, 'portia_queued', 0.0),
+		retries=getattr(response, 'portia_attempts', 1) - 1,
+		**labels
+	)
+
+	return response
+
+async def convert(converter: callable, *args) -> object:
+	"""Runs a synchronous converter on the loop's executor, so parsing large
+	responses doesn't stall other requests in flight.
+
+	Arguments:
+		converter {callable} -- function that converts the response
+		*args -- arguments passed to the converter
+
+	Returns:
+		object -- converted response
+	"""
+	loop = asyncio.get_running_loop()
+	return await loop.run_in_executor(None, functools.partial(converter, *args))
+
+
+class AsyncPortiaApi(object):
+	"""A factory for asynchronous devices that use our Portia API.
+	"""
+	def __init__(
+		self, portia_config: dict, transport: AsyncPortiaTransport=None
+	):
+		"""AsyncPortiaApi's constructor.
+
+		Arguments:
+			portia_config {dict} -- Portia's configuration arguments
+
+		Keyword Arguments:
+			transport {AsyncPortiaTransport} -- pooled asynchronous HTTP
+												transport to use; a new one is
+												created when missing
+												(default: {None})
+		"""
+		if transport is None:
+			transport = AsyncPortiaTransport()
+
+		self.portia_config = {**portia_config, 'async_transport': transport}
+
+	@property
+	def transport(self) -> AsyncPortiaTransport:
+		"""Pooled asynchronous HTTP transport used by every request of this
+		instance.
+
+		Returns:
+			AsyncPortiaTransport -- AsyncPortiaTransport instance
+		"""
+		return self.portia_config['async_transport']
+
+	def device(self, edge_id: str) -> 'AsyncEdgeDevice':
+		"""Builds a new AsyncEdgeDevice instance.
+
+		Arguments:
+			edge_id {str} -- Edge ID that identifies the device
+
+		Returns:
+			AsyncEdgeDevice -- AsyncEdgeDevice instance
+		"""
+		return AsyncEdgeDevice(edge_id, self.portia_config)
+
+	async def aclose(self):
+		"""Closes the transport's pooled connections.
+		"""
+		await self.transport.aclose()
+
+	async def __aenter__(self) -> 'AsyncPortiaApi':
+		return self
+
+	async def __aexit__(self, *args):
+		await self.aclose()
+
+
+class AsyncEdgeHandle(object):
+	"""Common requests of every asynchronous handle, built from the path that
+	identifies it, e.g. 'device/<edge_id>/port/<port>'.
+	"""
+	def __init__(self, path: str, portia_config: dict):
+		"""AsyncEdgeHandle's constructor.
+
+		Arguments:
+			path {str} -- path that identifies the handle
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		self.path = path
+		self.portia_config = portia_config
+
+	@property
+	def accept_header(self) -> str:
+		return self.portia_config.get('Accept') or 'text/csv'
+
+	async def _series(self, family: str, last: bool, params: dict) -> object:
+		endpoint = '/{0}/{1}'.format(family, self.path)
+
+		if last == True:
+			endpoint += '/last'
+
+		response = await http_request(
+			'GET',
+			self.portia_config,
+			endpoint,
+			params=params,
+			optional_headers={'Accept': self.accept_header}
+		)
+
+		return portia.add_humanize_method(await convert(
+			utils.convert,
+			self.accept_header,
+			self.portia_config,
+			response,
+			SCHEMAS[family]
+		))
+
+	async def _summary(
+		self,
+		strategy: 'SummaryStrategies',
+		interval: int,
+		params: dict,
+		payload: dict=None
+	) -> object:
+		endpoint = '/summary/{0}/{1}/{2}'.format(
+			self.path, strategy.endpoint, interval
+		)
+
+		if payload is None:
+			response = await http_request(
+				'GET',
+				self.portia_config,
+				endpoint,
+				params=params,
+				optional_headers={'Accept': self.accept_header}
+			)
+		else:
+			response = await http_request(
+				'POST',
+				self.portia_config,
+				endpoint,
+				payload=payload,
+				params=params,
+				optional_headers={'Accept': self.accept_header}
+			)
+
+		return portia.add_humanize_method(await convert(
+			utils.convert,
+			self.accept_header,
+			self.portia_config,
+			response,
+			utils.SUMMARY_SCHEMA
+		))
+
+	async def _profile(
+		self, strategy: 'ProfileStrategies', interval: int, params: dict
+	) -> dict:
+		endpoint = '/profile/{0}/{1}/{2}'.format(
+			self.path, strategy.endpoint, interval
+		)
+
+		response = await http_request(
+			'GET', self.portia_config, endpoint, params=params
+		)
+
+		return portia.add_humanize_method(await convert(
+			profile.convert_profile, self.portia_config, response
+		))
+
+	async def _describe(
+		self, key: str, columns: list, last: bool, params: dict
+	) -> object:
+		endpoint = '/describe/{0}/{1}'.format(self.path, key)
+
+		if last == True:
+			endpoint += '/last'
+
+		response = await http_request(
+			'GET', self.portia_config, endpoint, params=params
+		)
+
+		return portia.add_humanize_method(await convert(
+			describe.convert_description,
+			self.portia_config,
+			response,
+			key,
+			last,
+			columns
+		))
+
+
+class AsyncEdgeDevice(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDevice.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(self, edge_id: str, portia_config: dict):
+		"""AsyncEdgeDevice's constructor.
+
+		Arguments:
+			edge_id {str} -- Edge ID that identifies the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__('device/{0}'.format(edge_id), portia_config)
+		self.edge_id = edge_id
+
+	def port(self, port: int) -> 'AsyncEdgeDevicePort':
+		"""Builds a new AsyncEdgeDevicePort instance.
+
+		Arguments:
+			port {int} -- port of the device
+
+		Returns:
+			AsyncEdgeDevicePort -- AsyncEdgeDevicePort instance
+		"""
+		return AsyncEdgeDevicePort(self, port, self.portia_config)
+
+	def dimension(self, dimension: int) -> 'AsyncEdgeDeviceDimensionFromDevice':
+		"""Builds a new AsyncEdgeDeviceDimensionFromDevice instance.
+
+		Arguments:
+			dimension {int} -- dimension of the device
+
+		Returns:
+			AsyncEdgeDeviceDimensionFromDevice --
+				AsyncEdgeDeviceDimensionFromDevice instance
+		"""
+		return AsyncEdgeDeviceDimensionFromDevice(
+			self, dimension, self.portia_config
+		)
+
+	async def ports(self, last: bool=False, params: dict=None) -> object:
+		"""Lists a device's ports.
+
+	    Keyword Arguments:
+	        last {bool} -- if the last package of each port should be returned
+	        			   or not (default: {False})
+	        params {dict} -- params to send to the service (default: {None})
+
+	    Returns:
+	        object -- object with the list of ports
+		"""
+		return await self._describe(
+			'ports', describe.PORTS_COLUMNS, last, params
+		)
+
+	async def profile(
+		self,
+		strategy: 'ProfileStrategies'=profile.ProfileStrategies.BY_ZERO_PORT,
+		interval: int=30,
+		params: dict=None
+	) -> dict:
+		"""Retrieves a device's profile.
+
+	    Keyword Arguments:
+	        strategy {ProfileStrategies} -- strategy to use when building the
+	                                        profile (default:
+	                                        {ProfileStrategies.BY_ZERO_PORT})
+	        interval {int} -- interval of time in minutes to build the profile
+	                          (default: {30})
+	        params {dict} -- params to send to the service (default: {None})
+
+	    Returns:
+	        dict -- dictionary with the device's profile
+		"""
+		return await self._profile(strategy, interval, params)
+
+
+class AsyncEdgeDevicePort(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDevicePort.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(
+		self, edge_device: AsyncEdgeDevice, port: int, portia_config: dict
+	):
+		"""AsyncEdgeDevicePort's constructor.
+
+		Arguments:
+			edge_device {AsyncEdgeDevice} -- instance of an Edge device
+			port {int} -- port of the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__(
+			'{0}/port/{1}'.format(edge_device.path, port), portia_config
+		)
+		self.edge_id = edge_device.edge_id
+		self.port = port
+
+	def sensor(self, sensor: int) -> 'AsyncEdgeDeviceSensor':
+		"""Builds a new AsyncEdgeDeviceSensor instance.
+
+		Arguments:
+			sensor {int} -- sensor of the device
+
+		Returns:
+			AsyncEdgeDeviceSensor -- AsyncEdgeDeviceSensor instance
+		"""
+		return AsyncEdgeDeviceSensor(self, sensor, self.portia_config)
+
+	def dimension(self, dimension: int) -> 'AsyncEdgeDeviceDimensionFromPort':
+		"""Builds a new AsyncEdgeDeviceDimensionFromPort instance.
+
+		Arguments:
+			dimension {int} -- dimension code of the device
+
+		Returns:
+			AsyncEdgeDeviceDimensionFromPort --
+				AsyncEdgeDeviceDimensionFromPort instance
+		"""
+		return AsyncEdgeDeviceDimensionFromPort(
+			self, dimension, self.portia_config
+		)
+
+	async def sensors(self, last: bool=False, params: dict=None) -> object:
+		"""Lists a device's sensors.
+
+	    Keyword Arguments:
+	        last {bool} -- if the last package of each sensor should be
+	        			   returned or not (default: {False})
+	        params {dict} -- params to send to the service (default: {None})
+
+	    Returns:
+	        object -- object with the list of sensors
+		"""
+		return await self._describe(
+			'sensors', describe.SENSORS_COLUMNS, last, params
+		)
+
+	async def dimensions(self, last: bool=False, params: dict=None) -> object:
+		"""Lists a device's dimensions.
+
+	    Keyword Arguments:
+	        last {bool} -- if the last package of each dimension should be
+	        			   returned or not (default: {False})
+	        params {dict} -- params to send to the service (default: {None})
+
+	    Returns:
+	        object -- object with the list of dimensions
+		"""
+		return await self._describe(
+			'dimensions', describe.PORT_DIMENSIONS_COLUMNS, last, params
+		)
+
+	async def profile(
+		self,
+		strategy: 'ProfileStrategies'=profile.ProfileStrategies.BY_ZERO_PORT,
+		interval: int=30,
+		params: dict=None
+	) -> dict:
+		"""Retrieves a port's profile.
+
+	    Keyword Arguments:
+	        strategy {ProfileStrategies} -- strategy to use when building the
+	                                        profile (default:
+	                                        {ProfileStrategies.BY_ZERO_PORT})
+	        interval {int} -- interval of time in minutes to build the profile
+	                          (default: {30})
+	        params {dict} -- params to send to the service (default: {None})
+
+	    Returns:
+	        dict -- dictionary with the port's profile
+		"""
+		return await self._profile(strategy, interval, params)
+
+
+class AsyncEdgeDeviceSensor(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDeviceSensor.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(
+		self,
+		edge_device_port: AsyncEdgeDevicePort,
+		sensor: int,
+		portia_config: dict
+	):
+		"""AsyncEdgeDeviceSensor's constructor.
+
+		Arguments:
+			edge_device_port {AsyncEdgeDevicePort} -- instance of an Edge
+													  device port
+			sensor {int} -- sensor of the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__(
+			'{0}/sensor/{1}'.format(edge_device_port.path, sensor),
+			portia_config
+		)
+		self.edge_id = edge_device_port.edge_id
+		self.port = edge_device_port.port
+		self.sensor = sensor
+
+	def dimension(self, dimension: int) -> 'AsyncEdgeDeviceDimensionFromSensor':
+		"""Builds a new AsyncEdgeDeviceDimensionFromSensor instance.
+
+		Arguments:
+			dimension {int} -- dimension code of the device
+
+		Returns:
+			AsyncEdgeDeviceDimensionFromSensor --
+				AsyncEdgeDeviceDimensionFromSensor instance
+		"""
+		return AsyncEdgeDeviceDimensionFromSensor(
+			self, dimension, self.portia_config
+		)
+
+	def event(self, event: int) -> 'AsyncEdgeDeviceEventFromSensor':
+		"""Builds a new AsyncEdgeDeviceEventFromSensor instance.
+
+		Arguments:
+			event {int} -- event code of the device
+
+		Returns:
+			AsyncEdgeDeviceEventFromSensor -- AsyncEdgeDeviceEventFromSensor
+											  instance
+		"""
+		return AsyncEdgeDeviceEventFromSensor(self, event, self.portia_config)
+
+	async def dimensions(self, last: bool=False, params: dict=None) -> object:
+		"""Lists a device's dimensions.
+
+	    Keyword Arguments:
+	        last {bool} -- if the last package of each dimension should be
+	        			   returned or not (default: {False})
+	        params {dict} -- params to send to the service (default: {None})
+
+	    Returns:
+	        object -- object with the list of dimensions
+		"""
+		return await self._describe(
+			'dimensions', describe.SENSOR_DIMENSIONS_COLUMNS, last, params
+		)
+
+	async def profile(
+		self,
+		strategy: 'ProfileStrategies'=profile.ProfileStrategies.BY_ZERO_PORT,
+		interval: int=30,
+		params: dict=None
+	) -> dict:
+		"""Retrieves a sensor's profile.
+
+	    Keyword Arguments:
+	        strategy {ProfileStrategies} -- strategy to use when building the
+	                                        profile (default:
+	                                        {ProfileStrategies.BY_ZERO_PORT})
+	        interval {int} -- interval of time in minutes to build the profile
+	                          (default: {30})
+	        params {dict} -- params to send to the service (default: {None})
+
+	    Returns:
+	        dict -- dictionary with the sensor's profile
+		"""
+		return await self._profile(strategy, interval, params)
+
+	async def select(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's series by its port and sensor.
+
+		Keyword Arguments:
+			last {bool} -- if the last package should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's dimensions
+		"""
+		return await self._series('select', last, params)
+
+	async def summary(
+		self,
+		strategy: 'SummaryStrategies'=summary.SummaryStrategies.PER_HOUR,
+		interval=1,
+		params=None
+	) -> object:
+		"""Summarizes a device by port and sensor.
+
+		Keyword Arguments:
+			strategy {SummaryStrategies} -- strategy to use when summarizing
+											(default:
+											{SummaryStrategies.PER_HOUR})
+			interval {int} -- interval of time to summarize (default: {1})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's summarized dimensions
+		"""
+		return await self._summary(strategy, interval, params)
+
+	async def events(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's events by its port and sensor.
+
+		Keyword Arguments:
+			last {bool} -- if the last event should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's events
+		"""
+		return await self._series('events', last, params)
+
+
+class AsyncEdgeDeviceDimensionFromDevice(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDeviceDimensionFromDevice.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(
+		self,
+		edge_device: AsyncEdgeDevice,
+		dimension: int,
+		portia_config: dict
+	):
+		"""AsyncEdgeDeviceDimensionFromDevice's constructor.
+
+		Arguments:
+			edge_device {AsyncEdgeDevice} -- instance of an Edge device
+			dimension {int} -- dimension code of the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__(
+			'{0}/dimension/{1}'.format(edge_device.path, dimension),
+			portia_config
+		)
+		self.edge_id = edge_device.edge_id
+		self.dimension = dimension
+
+	async def summary(
+		self,
+		series: list=None,
+		strategy: 'SummaryStrategies'=summary.SummaryStrategies.PER_HOUR,
+		interval=1,
+		params=None
+	) -> object:
+		"""Summarizes a device by dimension code.
+
+		Keyword Arguments:
+			series {list} -- list of series to summarize (default: {None})
+			strategy {SummaryStrategies} -- strategy to use when summarizing
+											(default:
+											{SummaryStrategies.PER_HOUR})
+			interval {int} -- interval of time to summarize (default: {1})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's summarized dimensions
+		"""
+		return await self._summary(
+			strategy, interval, params, payload={'series': series}
+		)
+
+
+class AsyncEdgeDeviceDimensionFromPort(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDeviceDimensionFromPort.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(
+		self,
+		edge_device_port: AsyncEdgeDevicePort,
+		dimension: int,
+		portia_config: dict
+	):
+		"""AsyncEdgeDeviceDimensionFromPort's constructor.
+
+		Arguments:
+			edge_device_port {AsyncEdgeDevicePort} -- instance of an Edge
+													  device port
+			dimension {int} -- dimension code of the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__(
+			'{0}/dimension/{1}'.format(edge_device_port.path, dimension),
+			portia_config
+		)
+		self.edge_id = edge_device_port.edge_id
+		self.port = edge_device_port.port
+		self.dimension = dimension
+
+	def event(self, event: int) -> 'AsyncEdgeDeviceEventFromDimension':
+		"""Builds a new AsyncEdgeDeviceEventFromDimension instance.
+
+		Arguments:
+			event {int} -- event code of the device
+
+		Returns:
+			AsyncEdgeDeviceEventFromDimension --
+				AsyncEdgeDeviceEventFromDimension instance
+		"""
+		return AsyncEdgeDeviceEventFromDimension(
+			self, event, self.portia_config
+		)
+
+	async def select(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's series by its port and dimension code.
+
+		Keyword Arguments:
+			last {bool} -- if the last package should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's dimensions
+		"""
+		return await self._series('select', last, params)
+
+	async def events(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's events by its port and dimension code.
+
+		Keyword Arguments:
+			last {bool} -- if the last event should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's events
+		"""
+		return await self._series('events', last, params)
+
+
+class AsyncEdgeDeviceDimensionFromSensor(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDeviceDimensionFromSensor.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(
+		self,
+		edge_device_sensor: AsyncEdgeDeviceSensor,
+		dimension: int,
+		portia_config: dict
+	):
+		"""AsyncEdgeDeviceDimensionFromSensor's constructor.
+
+		Arguments:
+			edge_device_sensor {AsyncEdgeDeviceSensor} -- instance of an Edge
+														  device sensor
+			dimension {int} -- dimension code of the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__(
+			'{0}/dimension/{1}'.format(edge_device_sensor.path, dimension),
+			portia_config
+		)
+		self.edge_id = edge_device_sensor.edge_id
+		self.port = edge_device_sensor.port
+		self.sensor = edge_device_sensor.sensor
+		self.dimension = dimension
+
+	def event(self, event: int) -> 'AsyncEdgeDeviceEventFromSensorDimension':
+		"""Builds a new AsyncEdgeDeviceEventFromSensorDimension instance.
+
+		Arguments:
+			event {int} -- event code of the device
+
+		Returns:
+			AsyncEdgeDeviceEventFromSensorDimension --
+				AsyncEdgeDeviceEventFromSensorDimension instance
+		"""
+		return AsyncEdgeDeviceEventFromSensorDimension(
+			self, event, self.portia_config
+		)
+
+	async def select(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's series by its port, sensor and dimension code.
+
+		Keyword Arguments:
+			last {bool} -- if the last package should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's dimensions
+		"""
+		return await self._series('select', last, params)
+
+	async def summary(
+		self,
+		strategy: 'SummaryStrategies'=summary.SummaryStrategies.PER_HOUR,
+		interval=1,
+		params=None
+	) -> object:
+		"""Summarizes a device by port, sensor and dimension code.
+
+		Keyword Arguments:
+			strategy {SummaryStrategies} -- strategy to use when summarizing
+											(default:
+											{SummaryStrategies.PER_HOUR})
+			interval {int} -- interval of time to summarize (default: {1})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's summarized dimensions
+		"""
+		return await self._summary(strategy, interval, params)
+
+	async def events(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's events by its port, sensor and dimension code.
+
+		Keyword Arguments:
+			last {bool} -- if the last event should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's events
+		"""
+		return await self._series('events', last, params)
+
+
+class AsyncEdgeDeviceEventFromSensor(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDeviceEventFromSensor.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(
+		self,
+		edge_device_sensor: AsyncEdgeDeviceSensor,
+		event: int,
+		portia_config: dict
+	):
+		"""AsyncEdgeDeviceEventFromSensor's constructor.
+
+		Arguments:
+			edge_device_sensor {AsyncEdgeDeviceSensor} -- instance of an Edge
+														  device sensor
+			event {int} -- event code of the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__(
+			'{0}/event/{1}'.format(edge_device_sensor.path, event),
+			portia_config
+		)
+		self.edge_id = edge_device_sensor.edge_id
+		self.port = edge_device_sensor.port
+		self.sensor = edge_device_sensor.sensor
+		self.event = event
+
+	async def events(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's events by its port, sensor and event code.
+
+		Keyword Arguments:
+			last {bool} -- if the last event should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's events
+		"""
+		return await self._series('events', last, params)
+
+
+class AsyncEdgeDeviceEventFromDimension(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDeviceEventFromDimension.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(
+		self,
+		edge_device_dimension_from_port: AsyncEdgeDeviceDimensionFromPort,
+		event: int,
+		portia_config: dict
+	):
+		"""AsyncEdgeDeviceEventFromDimension's constructor.
+
+		Arguments:
+			edge_device_dimension_from_port
+				{AsyncEdgeDeviceDimensionFromPort} -- instance of an Edge
+													  device dimension from
+													  port
+			event {int} -- event code of the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__(
+			'{0}/event/{1}'.format(edge_device_dimension_from_port.path, event),
+			portia_config
+		)
+		self.edge_id = edge_device_dimension_from_port.edge_id
+		self.port = edge_device_dimension_from_port.port
+		self.dimension = edge_device_dimension_from_port.dimension
+		self.event = event
+
+	async def events(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's events by its port, dimension code and event
+		code.
+
+		Keyword Arguments:
+			last {bool} -- if the last event should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's events
+		"""
+		return await self._series('events', last, params)
+
+
+class AsyncEdgeDeviceEventFromSensorDimension(AsyncEdgeHandle):
+	"""Asynchronous version of EdgeDeviceEventFromSensorDimension.
+
+	Extends:
+		AsyncEdgeHandle
+	"""
+	def __init__(
+		self,
+		edge_device_dimension_from_sensor: AsyncEdgeDeviceDimensionFromSensor,
+		event: int,
+		portia_config: dict
+	):
+		"""AsyncEdgeDeviceEventFromSensorDimension's constructor.
+
+		Arguments:
+			edge_device_dimension_from_sensor
+				{AsyncEdgeDeviceDimensionFromSensor} -- instance of an Edge
+														device dimension from
+														sensor
+			event {int} -- event code of the device
+			portia_config {dict} -- Portia's configuration arguments
+		"""
+		super().__init__(
+			'{0}/event/{1}'.format(
+				edge_device_dimension_from_sensor.path, event
+			),
+			portia_config
+		)
+		self.edge_id = edge_device_dimension_from_sensor.edge_id
+		self.port = edge_device_dimension_from_sensor.port
+		self.sensor = edge_device_dimension_from_sensor.sensor
+		self.dimension = edge_device_dimension_from_sensor.dimension
+		self.event = event
+
+	async def events(self, last: bool=False, params: dict=None) -> object:
+		"""Retrieves a device's events by its port, sensor, dimension code and
+		event code.
+
+		Keyword Arguments:
+			last {bool} -- if the last event should be returned or not
+						   (default: {False})
+			params {dict} -- params to send to the service (default: {None})
+
+		Returns:
+			object -- object with the device's events
+		"""
+		return await self._series('events', last, params)
@@ -0,0 +1,160 @@
+"""In-process cache of HTTP responses, with per endpoint family TTLs and LRU
+eviction.
+"""
+
+import time
+import threading
+from collections import OrderedDict
+
+
+class ResponseCache(object):
+    """Caches successful GET responses of the endpoint families it has a TTL
+    for, e.g. {'describe': 300} caches every '/describe/...' response for five
+    minutes.
+
+    Set it as portia_config['cache'] to be used by every request made with
+    that configuration.
+    """
+    def __init__(
+        self,
+        ttl: dict={'describe': 300},
+        maxsize: int=1024,
+        clock: callable=time.monotonic
+    ):
+        """ResponseCache's constructor.
+
+        Keyword Arguments:
+            ttl {dict} -- seconds each endpoint family is kept for
+                          (default: {{'describe': 300}})
+            maxsize {int} -- maximum number of cached responses, the least
+                             recently used being evicted first
+                             (default: {1024})
+            clock {callable} -- function returning the current time in seconds
+                                (default: {time.monotonic})
+        """
+        self.ttl = dict(ttl)
+        self.maxsize = maxsize
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def family(endpoint: str) -> str:
+        """Retrieves the family of an endpoint, i.e. its first path segment.
+
+        Arguments:
+            endpoint {str} -- endpoint of the request
+
+        Returns:
+            str -- endpoint family, e.g. 'describe'
+        """
+        return endpoint.lstrip('/').split('/', 1)[0]
+
+    @staticmethod
+    def key(
+        portia_config: dict, endpoint: str, params: dict, accept: str
+    ) -> tuple:
+        """Builds the key of a request. Params are normalized the way they
+        are sent, so equivalent requests share the same key; the token is
+        part of the key, so users never share each other's responses.
+
+        Arguments:
+            portia_config {dict} -- Portia's configuration arguments
+            endpoint {str} -- endpoint of the request
+            params {dict} -- params sent to the service
+            accept {str} -- Accept header of the request
+
+        Returns:
+            tuple -- hashable key
+        """
+        if params is None:
+            params = {}
+
+        return (
+            portia_config.get('baseurl'),
+            portia_config.get('authorization'),
+            endpoint,
+            tuple(sorted(
+                (key, str(value)) for key, value in params.items()
+                if value is not None
+            )),
+            accept
+        )
+
+    def caches(self, endpoint: str) -> bool:
+        """Checks if responses of an endpoint are cached.
+
+        Arguments:
+            endpoint {str} -- endpoint of the request
+
+        Returns:
+            bool -- if the endpoint's family has a TTL
+        """
+        return self.ttl.get(self.family(endpoint)) is not None
+
+    def get(self, key: tuple) -> object:
+        """Retrieves a cached response.
+
+        Arguments:
+            key {tuple} -- key of the request
+
+        Returns:
+            object -- cached response, or None when missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] > self.clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+
+            if entry is not None:
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def set(self, key: tuple, endpoint: str, response: object):
+        """Caches a response for its endpoint family's TTL.
+
+        Arguments:
+            key {tuple} -- key of the request
+            endpoint {str} -- endpoint of the request
+            response {object} -- response to be cached
+        """
+        expires_at = self.clock() + self.ttl[self.family(endpoint)]
+
+        with self._lock:
+            self._entries[key] = (expires_at, response)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes every cached response and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """Retrieves the cache's counters.
+
+        Returns:
+            dict -- number of hits, misses and cached responses
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries)
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
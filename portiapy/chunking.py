@@ -0,0 +1,207 @@
+"""Chunking tools to split long time windows into slices that are fetched
+concurrently and stitched back together.
+"""
+
+import portiapy.lazy as lazy
+import portiapy.fanout as fanout
+
+
+pd = lazy.load('pandas')
+
+
+PRECISION_UNITS = {'s': 's', 'ms': 'ms', 'us': 'us', 'ns': 'ns'}
+
+
+def is_epoch_string(value: object) -> bool:
+    """Checks if a param is an epoch number written as a string, which the
+    service accepts as well.
+
+    Arguments:
+        value {object} -- 'from' or 'to' param
+
+    Returns:
+        bool -- if the param is a string of digits
+    """
+    return isinstance(value, str) and value.strip().lstrip('-').isdigit()
+
+def to_timestamp(value: object, precision: str='ms') -> 'pd.Timestamp':
+    """Converts a 'from' or 'to' param into a timestamp.
+
+    Arguments:
+        value {object} -- epoch number in the given precision, as a number or
+                          a string of digits, or date string
+
+    Keyword Arguments:
+        precision {str} -- precision of epoch numbers (default: {'ms'})
+
+    Returns:
+        pd.Timestamp -- UTC timestamp
+    """
+    if is_epoch_string(value):
+        value = int(value)
+
+    if isinstance(value, (int, float)):
+        return pd.Timestamp(
+            value, unit=PRECISION_UNITS.get(precision, 'ms'), tz='UTC'
+        )
+
+    timestamp = pd.Timestamp(value)
+
+    if timestamp.tzinfo is None:
+        return timestamp.tz_localize('UTC')
+
+    return timestamp.tz_convert('UTC')
+
+def from_timestamp(
+    timestamp: 'pd.Timestamp', like: object, precision: str='ms'
+) -> object:
+    """Converts a timestamp back into the representation of a param.
+
+    Arguments:
+        timestamp {pd.Timestamp} -- UTC timestamp
+        like {object} -- original param, whose type is kept
+
+    Keyword Arguments:
+        precision {str} -- precision of epoch numbers (default: {'ms'})
+
+    Returns:
+        object -- epoch number, as a number or a string, or ISO 8601 string
+    """
+    if isinstance(like, (int, float)) or is_epoch_string(like):
+        epoch = timestamp.value // pd.Timedelta(
+            1, unit=PRECISION_UNITS.get(precision, 'ms')
+        ).value
+
+        return str(epoch) if isinstance(like, str) else epoch
+
+    return timestamp.isoformat()
+
+def split_window(params: dict, chunk: str) -> list:
+    """Splits the params' 'from'/'to' window into slices.
+
+    Arguments:
+        params {dict} -- params to send to the service
+        chunk {str} -- size of each slice, e.g. '7d' or '12h'
+
+    Returns:
+        list -- params of each slice, in chronological order
+    """
+    if params is None or params.get('from') is None:
+        return [params]
+
+    precision = params.get('precision') or 'ms'
+    step = pd.Timedelta(chunk)
+
+    if step <= pd.Timedelta(0):
+        raise ValueError('chunk must be a positive duration: {0}'.format(chunk))
+
+    start = to_timestamp(params['from'], precision)
+
+    if params.get('to') is None:
+        end = pd.Timestamp.now(tz='UTC')
+    else:
+        end = to_timestamp(params['to'], precision)
+
+    slices = []
+
+    while start < end:
+        stop = min(start + step, end)
+        slices.append({
+            **params,
+            'from': from_timestamp(start, params['from'], precision),
+            'to': from_timestamp(stop, params['from'], precision)
+        })
+        start = stop
+
+    return slices or [params]
+
+def stitch(dataframes: list, params: dict) -> 'pd.DataFrame':
+    """Stitches slices back in timestamp order, dropping rows repeated on
+    the slices' boundaries: adjacent slices share their boundary, so the
+    rows of a slice that aren't newer than every row before it can only be
+    the boundary's, returned again.
+
+    Arguments:
+        dataframes {list} -- data frames of each slice, in chronological
+                             order
+        params {dict} -- params sent to the service
+
+    Returns:
+        pd.DataFrame -- stitched data frame
+    """
+    params = params or {}
+    slices = []
+    newest = None
+
+    for dataframe in dataframes:
+        if 'header_timestamp' in dataframe.columns \
+           and len(dataframe.index) > 0:
+            timestamps = dataframe['header_timestamp']
+            latest = timestamps.max()
+
+            if newest is not None:
+                dataframe = dataframe[timestamps > newest]
+                latest = max(latest, newest)
+
+            newest = latest
+
+        slices.append(dataframe)
+
+    dataframe = pd.concat(slices, ignore_index=True)
+
+    if 'header_timestamp' in dataframe.columns:
+        dataframe = dataframe.sort_values(
+            'header_timestamp',
+            ascending=str(params.get('order')).lower() != 'desc',
+            kind='stable'
+        )
+
+    if params.get('limit') is not None:
+        dataframe = dataframe.head(int(params['limit']))
+
+    return dataframe.reset_index(drop=True)
+
+def query_chunked(
+    portia_config: dict, query: callable, params: dict, chunk: str
+) -> 'pd.DataFrame':
+    """Runs a query once per slice of its time window, concurrently, and
+    stitches the results. The configuration's 'max_workers', 8 when
+    missing, bounds how many slices are fetched at once.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        query {callable} -- function receiving the params of a slice
+        params {dict} -- params to send to the service
+        chunk {str} -- size of each slice, e.g. '7d' or '12h'
+
+    Returns:
+        pd.DataFrame -- stitched data frame
+
+    Raises:
+        ValueError -- when the response type can't be stitched
+        Exception -- the first error among the slices
+    """
+    if (portia_config.get('Accept') or 'text/csv') != 'text/csv':
+        raise ValueError('chunked queries require the text/csv Accept type')
+
+    if portia_config.get('chunksize') is not None:
+        raise ValueError('chunked queries can\'t be combined with chunksize')
+
+    if portia_config.get('output') == 'arrow':
+        raise ValueError('chunked queries can\'t be combined with arrow output')
+
+    slices = split_window(params, chunk)
+
+    if len(slices) == 1:
+        return query(slices[0])
+
+    results, errors = fanout.fan_out(
+        lambda index: query(slices[index]),
+        range(len(slices)),
+        portia_config.get('max_workers', 8)
+    )
+
+    if len(errors) > 0:
+        raise errors[min(errors)]
+
+    return stitch([results[index] for index in sorted(results)], params)
@@ -2,11 +2,80 @@
 dimensions.
 """
 
-import json
+import portiapy.lazy as lazy
+import portiapy.metrics as metrics
+import portiapy.utils as utils
 
-import pandas as pd
 
-import portiapy.utils as utils
+pd = lazy.load('pandas')
+
+
+PORTS_COLUMNS = ['header_timestamp', 'port', 'dimension_thing_code']
+
+SENSORS_COLUMNS = [
+    'header_timestamp',
+    'sensor',
+    'dimension_value',
+    'dimension_code',
+    'dimension_unity_code',
+    'dimension_thing_code'
+]
+
+PORT_DIMENSIONS_COLUMNS = [
+    'header_timestamp',
+    'dimension_code',
+    'sensor',
+    'dimension_thing_code'
+]
+
+SENSOR_DIMENSIONS_COLUMNS = [
+    'header_timestamp',
+    'dimension_value',
+    'dimension_code',
+    'dimension_unity_code',
+    'dimension_thing_code'
+]
+
+
+def convert_description(
+    portia_config: dict,
+    response: object,
+    key: str,
+    last: bool,
+    columns: list
+) -> object:
+    """Converts a description response into a list or a data frame.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        response {object} -- HTTP response object
+        key {str} -- key of the response holding the description
+        last {bool} -- if the response holds the last package of each item
+        columns {list} -- data frame columns when last packages are returned
+
+    Returns:
+        object -- list of codes or data frame with the last packages
+
+    Raises:
+        Exception -- when the request goes wrong
+    """
+    if response.status_code == 200:
+
+        d = utils.loads(response.content).get(key)
+        metrics.document(portia_config, response, d)
+
+        if last == True:
+            d = pd.DataFrame(d, columns=columns).astype({
+                column: utils.DESCRIBE_SCHEMA[column] for column in columns
+                if column not in ('header_timestamp', 'dimension_value')
+            })
+        else:
+            d = list(map(int, d))
+
+        return d
+
+    else:
+        raise Exception("couldn't retrieve data")
 
 
 def device_ports(
@@ -46,28 +115,9 @@ def device_ports(
 
     response = utils.http_get_request(portia_config, endpoint, params)
 
-    if response.status_code == 200:
-
-        d = json.loads(response.text).get('ports')
-
-        if portia_config.get('debug'):
-            print('[portia-debug]: {0}'.format(d))
-
-        if last == True:
-            d = pd.DataFrame(
-                d,
-                columns=['header_timestamp', 'port', 'dimension_thing_code']
-            )
-
-            d['port'] = d['port'].map(int)
-            d['dimension_thing_code'] = d['dimension_thing_code'].map(int)
-        else:
-            d = list(map(int, d))
-
-        return d
-
-    else:
-        raise Exception("couldn't retrieve data")
+    return convert_description(
+        portia_config, response, 'ports', last, PORTS_COLUMNS
+    )
 
 def device_port_sensors(
     portia_config: dict,
@@ -110,36 +160,9 @@ def device_port_sensors(
 
     response = utils.http_get_request(portia_config, endpoint, params)
 
-    if response.status_code == 200:
-
-        d = json.loads(response.text).get('sensors')
-        if portia_config.get('debug'):
-            print('[portia-debug]: {0}'.format(d))
-
-        if last == True:
-            d = pd.DataFrame(
-                d,
-                columns=[
-                    'header_timestamp',
-                    'sensor',
-                    'dimension_value',
-                    'dimension_code',
-                    'dimension_unity_code',
-                    'dimension_thing_code'
-                ]
-            )
-
-            d['sensor'] = d['sensor'].map(int)
-            d['dimension_code'] = d['dimension_code'].map(int)
-            d['dimension_unity_code'] = d['dimension_unity_code'].map(int)
-            d['dimension_thing_code'] = d['dimension_thing_code'].map(int)
-        else:
-            d = list(map(int, d))
-
-        return d
-
-    else:
-        raise Exception("couldn't retrieve data")
+    return convert_description(
+        portia_config, response, 'sensors', last, SENSORS_COLUMNS
+    )
 
 def device_port_dimensions(
     portia_config: dict,
@@ -182,33 +205,9 @@ def device_port_dimensions(
 
     response = utils.http_get_request(portia_config, endpoint, params)
 
-    if response.status_code == 200:
-
-        d = json.loads(response.text).get('dimensions')
-        if portia_config.get('debug'):
-            print('[portia-debug]: {0}'.format(d))
-
-        if last == True:
-            d = pd.DataFrame(
-                d,
-                columns=[
-                    'header_timestamp',
-                    'dimension_code',
-                    'sensor',
-                    'dimension_thing_code'
-                ]
-            )
-
-            d['sensor'] = d['sensor'].map(int)
-            d['dimension_code'] = d['dimension_code'].map(int)
-            d['dimension_thing_code'] = d['dimension_thing_code'].map(int)
-        else:
-            d = list(map(int, d))
-
-        return d
-
-    else:
-        raise Exception("couldn't retrieve data")
+    return convert_description(
+        portia_config, response, 'dimensions', last, PORT_DIMENSIONS_COLUMNS
+    )
 
 def device_port_sensor_dimensions(
     portia_config: dict,
@@ -253,31 +252,6 @@ def device_port_sensor_dimensions(
 
     response = utils.http_get_request(portia_config, endpoint, params)
 
-    if response.status_code == 200:
-
-        d = json.loads(response.text).get('dimensions')
-        if portia_config.get('debug'):
-            print('[portia-debug]: {0}'.format(d))
-
-        if last == True:
-            d = pd.DataFrame(
-                d,
-                columns=[
-                    'header_timestamp',
-                    'dimension_value',
-                    'dimension_code',
-                    'dimension_unity_code',
-                    'dimension_thing_code'
-                ]
-            )
-
-            d['dimension_code'] = d['dimension_code'].map(int)
-            d['dimension_unity_code'] = d['dimension_unity_code'].map(int)
-            d['dimension_thing_code'] = d['dimension_thing_code'].map(int)
-        else:
-            d = list(map(int, d))
-
-        return d
-
-    else:
-        raise Exception("couldn't retrieve data")
+    return convert_description(
+        portia_config, response, 'dimensions', last, SENSOR_DIMENSIONS_COLUMNS
+    )
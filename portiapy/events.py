@@ -2,6 +2,7 @@
 """
 
 import portiapy.utils as utils
+import portiapy.chunking as chunking
 
 
 def query_by_port_sensor(
@@ -17,7 +18,8 @@ def query_by_port_sensor(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's events by its port and sensor.
     
     Arguments:
@@ -32,10 +34,22 @@ def query_by_port_sensor(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', 'order', 'limit', 'precision': 'ms',
                          'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's events
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_sensor(
+                portia_config, edge_id, port, sensor, last, params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -53,10 +67,16 @@ def query_by_port_sensor(
         )
 
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.EVENTS_SCHEMA
+    )
 
 
 def query_by_port_dimension(
@@ -72,7 +92,8 @@ def query_by_port_dimension(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's events by its port and dimension code.
     
     Arguments:
@@ -87,10 +108,22 @@ def query_by_port_dimension(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', order', 'limit', 'precision': 'ms',
                          'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's events
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_dimension(
+                portia_config, edge_id, port, dimension_code, last, params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -108,10 +141,16 @@ def query_by_port_dimension(
         )
 
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.EVENTS_SCHEMA
+    )
 
 
 def query_by_port_sensor_dimension(
@@ -128,7 +167,8 @@ def query_by_port_sensor_dimension(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's events by its port, sensor and dimension code.
     
     Arguments:
@@ -144,10 +184,28 @@ def query_by_port_sensor_dimension(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', 'order', 'lower_bound', 'upper_bound', 'order',
                          'limit', 'precision': 'ms', 'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's events
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_sensor_dimension(
+                portia_config,
+                edge_id,
+                port,
+                sensor,
+                dimension_code,
+                last,
+                params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -163,10 +221,16 @@ def query_by_port_sensor_dimension(
                     '/last'.format(edge_id, port, sensor, dimension_code))
 
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.EVENTS_SCHEMA
+    )
 
 
 def query_by_port_sensor_event(
@@ -183,7 +247,8 @@ def query_by_port_sensor_event(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's events by its port and sensor.
     
     Arguments:
@@ -199,10 +264,22 @@ def query_by_port_sensor_event(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', 'order', 'limit', 'precision': 'ms',
                          'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's events
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_sensor_event(
+                portia_config, edge_id, port, sensor, event_code, last, params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -219,10 +296,16 @@ def query_by_port_sensor_event(
         		   .format(edge_id, port, sensor, event_code)
 
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.EVENTS_SCHEMA
+    )
 
 
 def query_by_port_dimension_event(
@@ -239,7 +322,8 @@ def query_by_port_dimension_event(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's events by its port and dimension code.
     
     Arguments:
@@ -255,10 +339,28 @@ def query_by_port_dimension_event(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', order', 'limit', 'precision': 'ms',
                          'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's events
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_dimension_event(
+                portia_config,
+                edge_id,
+                port,
+                dimension_code,
+                event_code,
+                last,
+                params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -274,10 +376,16 @@ def query_by_port_dimension_event(
         		   .format(edge_id, port, dimension_code, event_code)
 
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.EVENTS_SCHEMA
+    )
 
 
 def query_by_port_sensor_dimension_event(
@@ -295,7 +403,8 @@ def query_by_port_sensor_dimension_event(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's events by its port, sensor and dimension code.
     
     Arguments:
@@ -312,10 +421,29 @@ def query_by_port_sensor_dimension_event(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', 'order', 'lower_bound', 'upper_bound', 'order',
                          'limit', 'precision': 'ms', 'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's events
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_sensor_dimension_event(
+                portia_config,
+                edge_id,
+                port,
+                sensor,
+                dimension_code,
+                event_code,
+                last,
+                params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -335,7 +463,13 @@ def query_by_port_sensor_dimension_event(
         		   ))
 
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.EVENTS_SCHEMA
+    )
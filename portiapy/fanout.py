@@ -0,0 +1,261 @@
+"""Fan-out tools to query many devices, ports, sensors and dimensions
+concurrently in one call.
+"""
+
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import portiapy.lazy as lazy
+import portiapy.select as select
+import portiapy.summary as summary
+
+
+pd = lazy.load('pandas')
+
+
+Target = namedtuple(
+    'Target', ['edge_id', 'port', 'sensor', 'dimension_code'], defaults=[None]
+)
+Target.__doc__ = """Series to be queried, identified by its device, port,
+sensor and, optionally, dimension code.
+"""
+
+
+def to_target(target: object) -> Target:
+    """Normalizes a target given as a tuple, a dictionary or a Target.
+
+    Arguments:
+        target {object} -- (edge_id, port, sensor[, dimension_code]) tuple or
+                           dictionary with the same keys
+
+    Returns:
+        Target -- normalized target
+    """
+    if isinstance(target, Target):
+        return target
+    elif isinstance(target, dict):
+        return Target(**target)
+    else:
+        return Target(*target)
+
+def fan_out(function: callable, items: list, max_workers: int=8) -> tuple:
+    """Calls a function for every item in a bounded thread pool, collecting
+    errors instead of aborting the whole batch.
+
+    Arguments:
+        function {callable} -- function to be called with each item
+        items {list} -- list of hashable items
+
+    Keyword Arguments:
+        max_workers {int} -- maximum number of concurrent calls (default: {8})
+
+    Returns:
+        tuple -- dictionary of results and dictionary of errors, both keyed by
+                 item and following the items' order
+    """
+    results = {}
+    errors = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [(item, executor.submit(function, item)) for item in items]
+
+        for item, future in futures:
+            try:
+                results[item] = future.result()
+            except Exception as err:
+                errors[item] = err
+
+    return results, errors
+
+def is_table(result: object) -> bool:
+    """Checks if a result is a data frame or an Arrow table.
+
+    Arguments:
+        result {object} -- result of a query
+
+    Returns:
+        bool -- if the result can be concatenated
+    """
+    if lazy.loaded(pd) and isinstance(result, pd.DataFrame):
+        return True
+
+    # Arrow tables can only exist once pyarrow was imported
+    pyarrow = sys.modules.get('pyarrow')
+
+    return pyarrow is not None and isinstance(result, pyarrow.Table)
+
+def concat_results(results: dict) -> object:
+    """Concatenates data frames, or Arrow tables, keyed by target, adding the
+    target's fields as key columns when they are not already part of the
+    data. Other results, such as JSON documents or iterators of chunks, are
+    returned unchanged.
+
+    Arguments:
+        results {dict} -- dictionary of data frames keyed by target
+
+    Returns:
+        object -- concatenated data frame or Arrow table, or the results
+    """
+    if not all(is_table(result) for result in results.values()):
+        return results
+
+    dataframes = []
+
+    for target, dataframe in results.items():
+        if isinstance(dataframe, pd.DataFrame):
+            columns = dataframe.columns
+        else:
+            columns = dataframe.column_names
+
+        keys = {
+            field: value for field, value in target._asdict().items()
+            if value is not None and field not in columns
+        }
+
+        if isinstance(dataframe, pd.DataFrame):
+            dataframe = dataframe.assign(**keys)[
+                list(keys) + [c for c in dataframe.columns if c not in keys]
+            ]
+        else:
+            for position, (field, value) in enumerate(keys.items()):
+                dataframe = dataframe.add_column(
+                    position, field, [[value] * dataframe.num_rows]
+                )
+
+        dataframes.append(dataframe)
+
+    if len(dataframes) == 0:
+        return pd.DataFrame()
+
+    if not isinstance(dataframes[0], pd.DataFrame):
+        import pyarrow
+
+        return pyarrow.concat_tables(dataframes, promote_options='default')
+
+    return pd.concat(dataframes, ignore_index=True)
+
+
+def select_many(
+    portia_config: dict,
+    targets: list,
+    last: bool=False,
+    params: dict=None,
+    max_workers: int=8,
+    concat: bool=False
+) -> tuple:
+    """Retrieves the series of many targets concurrently.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        targets {list} -- list of (edge_id, port, sensor[, dimension_code])
+                          targets
+
+    Keyword Arguments:
+        last {bool} -- if the last package should be returned or not
+                       (default: {False})
+        params {dict} -- params shared by all requests (default: {None})
+        max_workers {int} -- maximum number of concurrent requests, which
+                             should not exceed the transport's pool size
+                             (default: {8})
+        concat {bool} -- if results should be concatenated into a single
+                         data frame with key columns, when they're data
+                         frames or Arrow tables (default: {False})
+
+    Returns:
+        tuple -- results, as a dictionary keyed by Target or a concatenated
+                 data frame, and dictionary of errors keyed by Target
+    """
+    def query(target: Target) -> object:
+        if target.dimension_code is None:
+            return select.query_by_port_sensor(
+                portia_config,
+                target.edge_id,
+                target.port,
+                target.sensor,
+                last,
+                params
+            )
+        else:
+            return select.query_by_port_sensor_dimension(
+                portia_config,
+                target.edge_id,
+                target.port,
+                target.sensor,
+                target.dimension_code,
+                last,
+                params
+            )
+
+    results, errors = fan_out(
+        query, [to_target(target) for target in targets], max_workers
+    )
+
+    if concat == True:
+        results = concat_results(results)
+
+    return results, errors
+
+def summary_many(
+    portia_config: dict,
+    targets: list,
+    strategy: summary.SummaryStrategies=summary.SummaryStrategies.PER_HOUR,
+    interval: int=1,
+    params: dict=None,
+    max_workers: int=8,
+    concat: bool=False
+) -> tuple:
+    """Summarizes many targets concurrently.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        targets {list} -- list of (edge_id, port, sensor[, dimension_code])
+                          targets
+
+    Keyword Arguments:
+        strategy {SummaryStrategies} -- strategy to use when summarizing
+                                        (default: {SummaryStrategies.PER_HOUR})
+        interval {int} -- interval of time to summarize (default: {1})
+        params {dict} -- params shared by all requests (default: {None})
+        max_workers {int} -- maximum number of concurrent requests, which
+                             should not exceed the transport's pool size
+                             (default: {8})
+        concat {bool} -- if results should be concatenated into a single
+                         data frame with key columns, when they're data
+                         frames or Arrow tables (default: {False})
+
+    Returns:
+        tuple -- results, as a dictionary keyed by Target or a concatenated
+                 data frame, and dictionary of errors keyed by Target
+    """
+    def query(target: Target) -> object:
+        if target.dimension_code is None:
+            return summary.query_by_port_sensor(
+                portia_config,
+                target.edge_id,
+                target.port,
+                target.sensor,
+                strategy,
+                interval,
+                params
+            )
+        else:
+            return summary.query_by_port_sensor_dimension(
+                portia_config,
+                target.edge_id,
+                target.port,
+                target.sensor,
+                target.dimension_code,
+                strategy,
+                interval,
+                params
+            )
+
+    results, errors = fan_out(
+        query, [to_target(target) for target in targets], max_workers
+    )
+
+    if concat == True:
+        results = concat_results(results)
+
+    return results, errors
@@ -0,0 +1,296 @@
+"""Topology crawler that indexes every dimension of a fleet's devices, so
+fan-out queries can be planned without describing devices again.
+"""
+
+import os
+import tempfile
+
+import portiapy.describe as describe
+import portiapy.fanout as fanout
+import portiapy.lazy as lazy
+import portiapy.utils as utils
+
+
+pd = lazy.load('pandas')
+
+
+INDEX = ['edge_id', 'port', 'sensor', 'dimension_code']
+
+COLUMNS = [
+    'dimension_unity_code',
+    'dimension_thing_code',
+    'header_timestamp',
+    'dimension_value'
+]
+
+
+def empty_index() -> 'pd.DataFrame':
+    """Builds an index without any dimension.
+
+    Returns:
+        pd.DataFrame -- empty data frame indexed by INDEX, with COLUMNS
+    """
+    dataframe = pd.DataFrame(columns=INDEX + COLUMNS).astype({
+        column: utils.SELECT_SCHEMA.get(column, 'object')
+        for column in INDEX + COLUMNS
+    })
+
+    return dataframe.set_index(INDEX)
+
+def crawl(
+    portia_config: dict,
+    edge_ids: list,
+    params: dict=None,
+    max_workers: int=8
+) -> tuple:
+    """Crawls devices breadth-first: the ports of every device are described
+    concurrently, then the sensors of every port and, at last, the dimensions
+    of every sensor, each level in one bounded fan-out.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        edge_ids {list} -- Edge IDs of the devices
+
+    Keyword Arguments:
+        params {dict} -- params of the describe requests, such as 'from' to
+                         only find what was active since then
+                         (default: {None})
+        max_workers {int} -- maximum number of concurrent requests
+                             (default: {8})
+
+    Returns:
+        tuple -- index data frame, and dictionary of errors keyed by the
+                 (edge_id[, port[, sensor]]) tuple of the node that failed
+    """
+    params = {'sort': True, 'precision': 'ms', **(params or {})}
+    errors = {}
+
+    def ports(node):
+        return describe.device_ports(portia_config, *node, params=params)
+
+    def sensors(node):
+        return describe.device_port_sensors(
+            portia_config, *node, params=params
+        )
+
+    def dimensions(node):
+        return describe.device_port_sensor_dimensions(
+            portia_config, *node, last=True, params=params
+        )
+
+    nodes = [(edge_id,) for edge_id in dict.fromkeys(edge_ids)]
+
+    for level in (ports, sensors):
+        results, failed = fanout.fan_out(level, nodes, max_workers)
+        errors.update(failed)
+
+        nodes = [
+            node + (code,) for node, codes in results.items()
+            for code in codes
+        ]
+
+    results, failed = fanout.fan_out(dimensions, nodes, max_workers)
+    errors.update(failed)
+
+    dataframes = [
+        dataframe.assign(edge_id=node[0], port=node[1], sensor=node[2])
+        for node, dataframe in results.items() if len(dataframe.index) > 0
+    ]
+
+    if len(dataframes) == 0:
+        return empty_index(), errors
+
+    index = pd.concat(dataframes, ignore_index=True)[INDEX + COLUMNS]
+    index = index.astype({
+        column: utils.SELECT_SCHEMA[column] for column in INDEX[1:]
+    })
+
+    return index.set_index(INDEX).sort_index(), errors
+
+
+class Fleet(object):
+    """Index of a fleet's dimensions, keyed by edge_id, port, sensor and
+    dimension_code, with their unity and thing codes and their last package.
+    """
+    def __init__(self, portia_config: dict, index: 'pd.DataFrame'=None):
+        """Fleet's constructor.
+
+        Arguments:
+            portia_config {dict} -- Portia's configuration arguments
+
+        Keyword Arguments:
+            index {pd.DataFrame} -- index built before, such as by crawl
+                                    (default: {None})
+        """
+        self.portia_config = portia_config
+        self.index = empty_index() if index is None else index
+        self.errors = {}
+
+    def __len__(self) -> int:
+        return len(self.index.index)
+
+    @property
+    def edge_ids(self) -> list:
+        """Edge IDs of the indexed devices.
+
+        Returns:
+            list -- sorted Edge IDs
+        """
+        return self.index.index.unique(level='edge_id').tolist()
+
+    def crawl(
+        self,
+        edge_ids: list,
+        params: dict=None,
+        max_workers: int=8
+    ) -> 'Fleet':
+        """Crawls devices, replacing whatever was indexed of them. Nodes that
+        fail are kept in errors.
+
+        Arguments:
+            edge_ids {list} -- Edge IDs of the devices
+
+        Keyword Arguments:
+            params {dict} -- params of the describe requests
+                             (default: {None})
+            max_workers {int} -- maximum number of concurrent requests
+                                 (default: {8})
+
+        Returns:
+            Fleet -- this instance
+        """
+        index, self.errors = crawl(
+            self.portia_config, edge_ids, params, max_workers
+        )
+        kept = self.index[
+            ~self.index.index.get_level_values('edge_id').isin(edge_ids)
+        ]
+
+        self.index = pd.concat([kept, index]).sort_index()
+
+        return self
+
+    def refresh(
+        self,
+        edge_ids: list=None,
+        since: int=None,
+        max_workers: int=8
+    ) -> 'Fleet':
+        """Refreshes the index incrementally: only what was active since a
+        timestamp is described, its last packages are updated and new ports,
+        sensors and dimensions are added, while the rest is kept.
+
+        Keyword Arguments:
+            edge_ids {list} -- Edge IDs of the devices, the indexed ones when
+                               missing (default: {None})
+            since {int} -- timestamp, in milliseconds, the newest indexed
+                           package of the least recent device when missing
+                           (default: {None})
+            max_workers {int} -- maximum number of concurrent requests
+                                 (default: {8})
+
+        Returns:
+            Fleet -- this instance
+        """
+        if edge_ids is None:
+            edge_ids = self.edge_ids
+
+        if since is None and len(self.index.index) > 0:
+            since = int(self.index['header_timestamp'].groupby(
+                level='edge_id'
+            ).max().min())
+
+        index, self.errors = crawl(
+            self.portia_config, edge_ids, {'from': since}, max_workers
+        )
+        kept = self.index[~self.index.index.isin(index.index)]
+
+        self.index = pd.concat([kept, index]).sort_index()
+
+        return self
+
+    def targets(self, dimension: bool=True, **filters) -> list:
+        """Plans the targets of fan-out queries, such as select_many's.
+
+        Keyword Arguments:
+            dimension {bool} -- if each dimension should be a target, or each
+                                sensor (default: {True})
+            **filters -- values, or lists of values, that index levels or
+                         columns must have, e.g. dimension_thing_code=15
+
+        Returns:
+            list -- list of Target, in index order
+        """
+        index = self.index.reset_index()
+
+        for column, value in filters.items():
+            if isinstance(value, (list, tuple, set)):
+                index = index[index[column].isin(value)]
+            else:
+                index = index[index[column] == value]
+
+        keys = INDEX if dimension == True else INDEX[:-1]
+
+        return [
+            fanout.Target(*target)
+            for target in index[keys].drop_duplicates().itertuples(
+                index=False, name=None
+            )
+        ]
+
+    def save(self, path: str, format: str='parquet'):
+        """Saves the index atomically.
+
+        Arguments:
+            path {str} -- path of the file
+
+        Keyword Arguments:
+            format {str} -- 'parquet', which requires pyarrow, or 'pickle'
+                            (default: {'parquet'})
+
+        Raises:
+            ValueError -- when the format isn't valid
+        """
+        if format not in ('parquet', 'pickle'):
+            raise ValueError('unknown fleet format: {0}'.format(format))
+
+        directory = os.path.dirname(os.path.abspath(path))
+        descriptor, temporary = tempfile.mkstemp(dir=directory)
+        os.close(descriptor)
+
+        try:
+            if format == 'parquet':
+                self.index.to_parquet(temporary)
+            else:
+                self.index.to_pickle(temporary)
+
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    @classmethod
+    def load(
+        cls,
+        portia_config: dict,
+        path: str,
+        format: str='parquet'
+    ) -> 'Fleet':
+        """Loads an index saved before.
+
+        Arguments:
+            portia_config {dict} -- Portia's configuration arguments
+            path {str} -- path of the file
+
+        Keyword Arguments:
+            format {str} -- 'parquet' or 'pickle' (default: {'parquet'})
+
+        Returns:
+            Fleet -- Fleet instance
+        """
+        if format == 'parquet':
+            index = pd.read_parquet(path)
+        else:
+            index = pd.read_pickle(path)
+
+        return cls(portia_config, index)
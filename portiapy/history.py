@@ -0,0 +1,329 @@
+"""On-disk cache of historical windows, which never change once they are
+older than a horizon, so reruns only fetch the recent tail of a window.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+import portiapy.lazy as lazy
+
+
+pd = lazy.load('pandas')
+
+
+UNCACHED_PARAMS = ('from', 'to', 'order', 'limit')
+UTC_TIMEZONES = (None, 'UTC', 'Etc/UTC')
+UNFILLED = (None, 'none', 'null')
+
+
+class HistoryCache(object):
+    """Stores each closed time bucket of a query in its own columnar file,
+    under '<directory>/<endpoint>/<params digest>/<bucket start>.<format>'.
+
+    Set it as portia_config['history'] to be used by the select and summary
+    queries of a single device made with that configuration.
+    """
+    def __init__(
+        self,
+        directory: str,
+        horizon: str='48h',
+        bucket: str='1d',
+        format: str='parquet',
+        clock: callable=None
+    ):
+        """HistoryCache's constructor.
+
+        Arguments:
+            directory {str} -- directory where buckets are stored
+
+        Keyword Arguments:
+            horizon {str} -- age after which data never changes
+                             (default: {'48h'})
+            bucket {str} -- size of each stored bucket (default: {'1d'})
+            format {str} -- 'parquet', which requires pyarrow, or 'pickle'
+                            (default: {'parquet'})
+            clock {callable} -- function returning the current UTC timestamp
+                                (default: {None})
+
+        Raises:
+            ImportError -- when parquet is chosen and pyarrow is missing
+            ValueError -- when the format or bucket aren't valid
+        """
+        if format == 'parquet':
+            try:
+                import pyarrow
+            except ImportError:
+                raise ImportError(
+                    'the parquet format requires pyarrow, install it with '
+                    '`pip install portiapy[history]` or use format=\'pickle\''
+                )
+        elif format != 'pickle':
+            raise ValueError('unknown history format: {0}'.format(format))
+
+        self.directory = directory
+        self.horizon = pd.Timedelta(horizon)
+        self.bucket = pd.Timedelta(bucket)
+        self.format = format
+        self.clock = clock or (lambda: pd.Timestamp.now(tz='UTC'))
+
+        if self.bucket <= pd.Timedelta(0):
+            raise ValueError('bucket must be a positive duration: {0}' \
+                             .format(bucket))
+
+    def path(
+        self,
+        portia_config: dict,
+        endpoint: str,
+        params: dict,
+        start: 'pd.Timestamp'
+    ) -> str:
+        """Builds the path of a bucket. Its digest covers the server, the
+        token, hashed, and the options changing the frame's dtypes, so
+        configurations never read each other's buckets.
+
+        Arguments:
+            portia_config {dict} -- Portia's configuration arguments
+            endpoint {str} -- endpoint of the request
+            params {dict} -- params sent to the service
+            start {pd.Timestamp} -- start of the bucket
+
+        Returns:
+            str -- path of the bucket's file
+        """
+        token = hashlib.sha256(
+            str(portia_config.get('authorization')).encode()
+        ).hexdigest()
+
+        digest = hashlib.sha1(json.dumps(
+            {
+                'baseurl': portia_config.get('baseurl'),
+                'token': token,
+                'float32': portia_config.get('float32') == True,
+                'params': {
+                    key: str(value) for key, value in params.items()
+                    if value is not None and key not in UNCACHED_PARAMS
+                }
+            },
+            sort_keys=True
+        ).encode()).hexdigest()
+
+        return os.path.join(
+            self.directory,
+            endpoint.strip('/'),
+            '{0}-{1}'.format(digest, int(self.bucket.total_seconds())),
+            '{0}.{1}'.format(start.value, self.format)
+        )
+
+    def load(self, path: str) -> 'pd.DataFrame':
+        """Loads a bucket.
+
+        Arguments:
+            path {str} -- path of the bucket's file
+
+        Returns:
+            pd.DataFrame -- stored data frame, or None when missing
+        """
+        if not os.path.exists(path):
+            return None
+
+        if self.format == 'parquet':
+            return pd.read_parquet(path)
+
+        return pd.read_pickle(path)
+
+    def save(self, path: str, dataframe: 'pd.DataFrame'):
+        """Saves a bucket atomically, so concurrent readers never see a
+        partial file.
+
+        Arguments:
+            path {str} -- path of the bucket's file
+            dataframe {pd.DataFrame} -- data frame to be stored
+        """
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(path))
+        os.close(descriptor)
+
+        try:
+            if self.format == 'parquet':
+                dataframe.to_parquet(temporary, index=False)
+            else:
+                dataframe.to_pickle(temporary)
+
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+
+    def buckets(
+        self, start: 'pd.Timestamp', end: 'pd.Timestamp'
+    ) -> list:
+        """Lists the closed buckets overlapping a window.
+
+        Arguments:
+            start {pd.Timestamp} -- start of the window
+            end {pd.Timestamp} -- end of the window
+
+        Returns:
+            list -- start of each bucket, in chronological order
+        """
+        cutoff = self.clock() - self.horizon
+        bucket = pd.Timestamp(
+            start.value // self.bucket.value * self.bucket.value, tz='UTC'
+        )
+        buckets = []
+
+        while bucket < end and bucket + self.bucket <= cutoff:
+            buckets.append(bucket)
+            bucket += self.bucket
+
+        return buckets
+
+    def query(
+        self,
+        portia_config: dict,
+        query: callable,
+        endpoint: str,
+        params: dict
+    ) -> 'pd.DataFrame':
+        """Serves the closed part of a query's window from disk, fetching
+        missing buckets once, and only the open tail from the service. The
+        configuration's 'max_workers', 8 when missing, bounds how many
+        missing buckets are fetched at once.
+
+        Arguments:
+            portia_config {dict} -- Portia's configuration arguments
+            query {callable} -- function receiving the params of a window
+            endpoint {str} -- endpoint of the request
+            params {dict} -- params to send to the service
+
+        Returns:
+            pd.DataFrame -- data frame of the whole window
+        """
+        # imported here, as fanout depends on the modules using this cache
+        import portiapy.chunking as chunking
+        import portiapy.fanout as fanout
+
+        precision = params.get('precision') or 'ms'
+        start = chunking.to_timestamp(params['from'], precision)
+
+        if params.get('to') is None:
+            end = self.clock()
+        else:
+            end = chunking.to_timestamp(params['to'], precision)
+
+        buckets = self.buckets(start, end)
+
+        if len(buckets) == 0:
+            return query(params)
+
+        window = {**params, 'order': None, 'limit': None}
+
+        def fetch(bucket):
+            path = self.path(portia_config, endpoint, params, bucket)
+            dataframe = self.load(path)
+
+            if dataframe is None:
+                lower = chunking.from_timestamp(bucket, 0, precision)
+                upper = chunking.from_timestamp(
+                    bucket + self.bucket, 0, precision
+                )
+                dataframe = query({**window, 'from': lower, 'to': upper})
+
+                if 'header_timestamp' in dataframe.columns:
+                    dataframe = dataframe[
+                        (dataframe['header_timestamp'] >= lower) &
+                        (dataframe['header_timestamp'] < upper)
+                    ].reset_index(drop=True)
+
+                self.save(path, dataframe)
+
+            return dataframe
+
+        results, errors = fanout.fan_out(
+            fetch, buckets, portia_config.get('max_workers', 8)
+        )
+
+        if len(errors) > 0:
+            raise errors[min(errors)]
+
+        dataframes = [results[bucket] for bucket in buckets]
+        closed = buckets[-1] + self.bucket
+
+        if closed < end:
+            dataframes.append(query({
+                **window,
+                'from': chunking.from_timestamp(closed, params['from'], precision)
+            }))
+
+        dataframe = pd.concat(dataframes, ignore_index=True)
+
+        if 'header_timestamp' in dataframe.columns:
+            lower = chunking.from_timestamp(start, 0, precision)
+            upper = chunking.from_timestamp(end, 0, precision)
+            dataframe = dataframe[
+                (dataframe['header_timestamp'] >= lower) &
+                (dataframe['header_timestamp'] <= upper)
+            ]
+
+        return chunking.stitch([dataframe], params)
+
+
+def query_cached(
+    portia_config: dict,
+    query: callable,
+    endpoint: str,
+    params: dict,
+    period: 'pd.Timedelta'=None
+) -> object:
+    """Runs a query through the configuration's 'history' cache when it can
+    be served from buckets, otherwise straight from the service.
+
+    Summaries are only cached when their period divides the bucket, they're
+    computed in UTC and their gaps aren't filled, so no summarized interval
+    spans two buckets or depends on the bucket before it.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        query {callable} -- function receiving a configuration and the params
+                            of a window
+        endpoint {str} -- endpoint of the request
+        params {dict} -- params to send to the service
+
+    Keyword Arguments:
+        period {pd.Timedelta} -- period of each summarized interval, or None
+                                 for raw series (default: {None})
+
+    Returns:
+        object -- object with the device's dimensions
+    """
+    history = portia_config['history']
+    uncached_config = {**portia_config, 'history': None}
+    params = params or {}
+
+    cacheable = (
+        params.get('from') is not None
+        and (portia_config.get('Accept') or 'text/csv') == 'text/csv'
+        and portia_config.get('chunksize') is None
+        and portia_config.get('output') != 'arrow'
+    )
+
+    if period is not None:
+        cacheable = (
+            cacheable
+            and history.bucket % period == pd.Timedelta(0)
+            and params.get('timezone') in UTC_TIMEZONES
+            and not params.get('offset')
+            and params.get('fill') in UNFILLED
+        )
+
+    if not cacheable:
+        return query(uncached_config, params)
+
+    return history.query(
+        portia_config,
+        lambda params: query(uncached_config, params),
+        endpoint,
+        params
+    )
@@ -0,0 +1,93 @@
+"""Lazy imports, so heavy dependencies are only loaded on first use and a
+call that never needs them, such as a JSON description, doesn't pay for them.
+"""
+
+import sys
+import threading
+import importlib
+
+
+_lock = threading.RLock()
+
+
+class LazyModule(object):
+    """Stand-in for a module that imports it, under a lock, when one of its
+    attributes is first accessed. Unlike importlib's LazyLoader, it never
+    registers a half-executed module in sys.modules, so threads that touch it
+    concurrently all wait for the import to finish.
+    """
+    __slots__ = ('_name', '_module')
+
+    def __init__(self, name: str):
+        """LazyModule's constructor.
+
+        Arguments:
+            name {str} -- absolute name of the module
+        """
+        self._name = name
+        self._module = None
+
+    def _load(self) -> object:
+        """Imports the module, once.
+
+        Returns:
+            module -- imported module
+        """
+        module = self._module
+
+        if module is None:
+            with _lock:
+                module = self._module
+
+                if module is None:
+                    module = self._module = importlib.import_module(
+                        self._name
+                    )
+
+        return module
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        if self._module is None:
+            return '<lazy module {0!r}>'.format(self._name)
+
+        return repr(self._module)
+
+
+def load(name: str) -> object:
+    """Imports a module lazily: the module itself when it was imported
+    already, or a LazyModule that imports it on first use.
+
+    Arguments:
+        name {str} -- absolute name of the module
+
+    Returns:
+        object -- module, or LazyModule standing in for it
+    """
+    module = sys.modules.get(name)
+
+    if module is not None:
+        return module
+
+    return LazyModule(name)
+
+def loaded(module: object) -> bool:
+    """Checks if a lazily imported module was imported already, by anyone.
+    Objects of its classes can only exist once it was, so isinstance checks
+    against it can be skipped until then.
+
+    Arguments:
+        module {object} -- module returned by load
+
+    Returns:
+        bool -- if the module was imported
+    """
+    if isinstance(module, LazyModule):
+        return module._module is not None or module._name in sys.modules
+
+    return True
@@ -0,0 +1,275 @@
+"""Client-side rate limiter and concurrency governor, so parallel workers
+sharing an API token stay under the throughput Portia allows.
+"""
+
+import json
+import time
+import asyncio
+import threading
+import contextvars
+
+
+POLL_INTERVAL = 0.01
+
+
+class RateLimiter(object):
+    """Token bucket refilled at rate requests per second, holding up to burst
+    tokens, combined with a cap of max_in_flight concurrent requests.
+
+    It's shared by every thread using it. When a path is given, its state
+    lives in files locked with fcntl, so it's shared by every process on the
+    host using the same path too.
+
+    Set it as portia_config['limiter'] to be acquired by every attempt of
+    the requests made with that configuration, retries included. A streamed
+    response keeps its slot until it's closed.
+    """
+    def __init__(
+        self,
+        rate: float=None,
+        burst: int=None,
+        max_in_flight: int=None,
+        path: str=None,
+        clock: callable=time.time,
+        sleep: callable=time.sleep
+    ):
+        """RateLimiter's constructor.
+
+        Keyword Arguments:
+            rate {float} -- requests per second, or None for no rate limit
+                            (default: {None})
+            burst {int} -- requests that may be sent at once after an idle
+                           period (default: {max(1, rate)})
+            max_in_flight {int} -- concurrent requests, or None for no cap
+                                   (default: {None})
+            path {str} -- file where the state is shared across processes
+                          (default: {None})
+            clock {callable} -- function returning the current time in seconds,
+                                which must be the wall clock across processes
+                                (default: {time.time})
+            sleep {callable} -- function sleeping for some seconds
+                                (default: {time.sleep})
+
+        Raises:
+            ValueError -- when the rate isn't positive, or the burst or
+                          max_in_flight are below 1
+            ImportError -- when a path is given where fcntl isn't available
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError('rate must be positive: {0}'.format(rate))
+
+        if burst is not None and burst < 1:
+            raise ValueError('burst must be at least 1: {0}'.format(burst))
+
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1: {0}' \
+                             .format(max_in_flight))
+
+        if path is not None:
+            try:
+                import fcntl
+            except ImportError:
+                raise ImportError(
+                    'sharing a RateLimiter across processes requires fcntl'
+                )
+
+            self._fcntl = fcntl
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, rate or 1)
+        self.max_in_flight = max_in_flight
+        self.path = path
+        self.clock = clock
+        self.sleep = sleep
+
+        self._tokens = float(self.burst)
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+        # slots taken by with statements, stacked per thread and per task
+        self._entered = contextvars.ContextVar('slots', default=())
+
+        if max_in_flight is not None and path is None:
+            self._semaphore = threading.BoundedSemaphore(max_in_flight)
+
+    def _refill(self, tokens: float, updated_at: float) -> tuple:
+        now = self.clock()
+        tokens = min(
+            float(self.burst),
+            tokens + max(0.0, now - updated_at) * self.rate
+        )
+
+        if tokens >= 1:
+            return tokens - 1, now, 0.0
+
+        return tokens, now, (1 - tokens) / self.rate
+
+    def _take_token(self) -> float:
+        """Takes a token from the bucket when there's one.
+
+        Returns:
+            float -- 0 when a token was taken, otherwise seconds until the
+                     next one
+        """
+        if self.rate is None:
+            return 0.0
+
+        if self.path is None:
+            with self._lock:
+                self._tokens, self._updated_at, wait = self._refill(
+                    self._tokens, self._updated_at
+                )
+                return wait
+
+        with open(self.path, 'a+') as file:
+            self._fcntl.flock(file, self._fcntl.LOCK_EX)
+
+            try:
+                file.seek(0)
+                state = json.loads(file.read() or 'null') or {
+                    'tokens': float(self.burst),
+                    'updated_at': self.clock()
+                }
+                tokens, updated_at, wait = self._refill(
+                    state['tokens'], state['updated_at']
+                )
+
+                file.seek(0)
+                file.truncate()
+                file.write(json.dumps({
+                    'tokens': tokens, 'updated_at': updated_at
+                }))
+                file.flush()
+
+                return wait
+            finally:
+                self._fcntl.flock(file, self._fcntl.LOCK_UN)
+
+    def _take_slot(self) -> object:
+        """Takes an in-flight slot when there's one free.
+
+        Returns:
+            object -- slot, to be given back to release, or None when none
+                      was free
+        """
+        if self.max_in_flight is None:
+            return True
+
+        if self.path is None:
+            return self._semaphore.acquire(blocking=False) or None
+
+        for index in range(self.max_in_flight):
+            file = open('{0}.slot{1}'.format(self.path, index), 'a')
+
+            try:
+                self._fcntl.flock(
+                    file, self._fcntl.LOCK_EX | self._fcntl.LOCK_NB
+                )
+            except OSError:
+                file.close()
+                continue
+
+            return file
+
+        return None
+
+    def acquire(self) -> object:
+        """Waits for an in-flight slot, then for a token.
+
+        Returns:
+            object -- slot, to be given back to release
+        """
+        slot = self._take_slot()
+
+        while slot is None:
+            self.sleep(POLL_INTERVAL)
+            slot = self._take_slot()
+
+        wait = self._take_token()
+
+        while wait > 0:
+            self.sleep(wait)
+            wait = self._take_token()
+
+        return slot
+
+    async def acquire_async(self) -> object:
+        """Waits for an in-flight slot, then for a token, without blocking
+        the event loop.
+
+        Returns:
+            object -- slot, to be given back to release
+        """
+        slot = self._take_slot()
+
+        while slot is None:
+            await asyncio.sleep(POLL_INTERVAL)
+            slot = self._take_slot()
+
+        wait = self._take_token()
+
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._take_token()
+
+        return slot
+
+    def release(self, slot: object):
+        """Frees an in-flight slot.
+
+        Arguments:
+            slot {object} -- slot returned by acquire
+        """
+        if self.max_in_flight is None:
+            return
+
+        if self.path is None:
+            self._semaphore.release()
+        else:
+            self._fcntl.flock(slot, self._fcntl.LOCK_UN)
+            slot.close()
+
+    def _enter(self, slot: object):
+        self._entered.set(self._entered.get() + (slot,))
+
+    def _exit(self):
+        slots = self._entered.get()
+        self._entered.set(slots[:-1])
+        self.release(slots[-1])
+
+    def __enter__(self) -> 'RateLimiter':
+        self._enter(self.acquire())
+        return self
+
+    def __exit__(self, *args):
+        self._exit()
+
+    async def __aenter__(self) -> 'RateLimiter':
+        self._enter(await self.acquire_async())
+        return self
+
+    async def __aexit__(self, *args):
+        self._exit()
+
+
+_token_limiters = {}
+_token_limiters_lock = threading.Lock()
+
+
+def for_token(authorization: str, **kwargs) -> RateLimiter:
+    """Retrieves the process-wide limiter of an API token, creating it with
+    the given arguments on first use.
+
+    Arguments:
+        authorization {str} -- API token
+
+    Keyword Arguments:
+        **kwargs -- arguments of RateLimiter's constructor
+
+    Returns:
+        RateLimiter -- limiter shared by every user of the token
+    """
+    with _token_limiters_lock:
+        if authorization not in _token_limiters:
+            _token_limiters[authorization] = RateLimiter(**kwargs)
+
+        return _token_limiters[authorization]
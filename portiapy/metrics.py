@@ -0,0 +1,485 @@
+"""Instrumentation of the request lifecycle, emitted as events to pluggable
+sinks, so latency hot spots can be told apart by endpoint family and device.
+
+Every event is a dictionary with its 'event' name, the 'timestamp' it ended
+at and the fields below, when known:
+
+    request -- one HTTP exchange: method, url, endpoint, family, edge_id,
+               status, seconds until the transport returned, ttfb (seconds
+               until the response's headers), queued (seconds waiting for
+               the limiter) and retries
+    parse -- conversion of a response's body, which also downloads it when
+             streamed: format, family, edge_id, rows, seconds, chunk,
+             received and decoded bytes and their encoding
+    humanize -- humanization of a data frame: rows and seconds
+    document -- parsed JSON document, in debug mode only: family, edge_id
+                and document, abbreviated
+
+A sink is any callable receiving events. Set one, or a list of them, as
+portia_config['metrics'], or register it for every configuration. Debug mode
+adds a PrintSink.
+"""
+
+import bisect
+import contextlib
+import logging
+import reprlib
+import threading
+import time
+import warnings
+
+
+_registered = []
+_registered_lock = threading.Lock()
+
+
+def register(sink: callable):
+    """Registers a sink receiving the events of every configuration, and
+    those not tied to one, such as humanize.
+
+    Arguments:
+        sink {callable} -- function receiving each event
+    """
+    with _registered_lock:
+        _registered.append(sink)
+
+def unregister(sink: callable):
+    """Unregisters a sink registered before.
+
+    Arguments:
+        sink {callable} -- registered sink
+    """
+    with _registered_lock:
+        _registered.remove(sink)
+
+def sinks(portia_config: dict=None) -> list:
+    """Lists the sinks receiving a configuration's events.
+
+    Keyword Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+                                (default: {None})
+
+    Returns:
+        list -- sinks, empty when nobody listens
+    """
+    targets = list(_registered)
+
+    if portia_config is not None:
+        configured = portia_config.get('metrics')
+
+        if callable(configured):
+            targets.append(configured)
+        elif configured is not None:
+            targets.extend(configured)
+
+        if portia_config.get('debug') == True:
+            targets.append(DEBUG_SINK)
+
+    return targets
+
+def dispatch(targets: list, event: str, fields: dict):
+    """Sends an event to sinks. A failing sink is warned about instead of
+    failing the query being measured.
+
+    Arguments:
+        targets {list} -- sinks returned by sinks
+        event {str} -- name of the event
+        fields {dict} -- fields of the event
+    """
+    event = {'event': event, 'timestamp': time.time(), **fields}
+
+    for sink in targets:
+        try:
+            sink(event)
+        except Exception as err:
+            warnings.warn('metrics sink failed: {0!r}'.format(err))
+
+def emit(portia_config: dict, event: str, **fields):
+    """Emits an event to a configuration's sinks.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments, or None
+        event {str} -- name of the event
+
+    Keyword Arguments:
+        **fields -- fields of the event
+    """
+    targets = sinks(portia_config)
+
+    if len(targets) > 0:
+        dispatch(targets, event, fields)
+
+@contextlib.contextmanager
+def measure(portia_config: dict, event: str, **fields):
+    """Times a block, emitting an event with its 'seconds' when it exits,
+    and its 'error' when it raises. The block may add fields to the yielded
+    dictionary.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments, or None
+        event {str} -- name of the event
+
+    Keyword Arguments:
+        **fields -- fields of the event
+
+    Yields:
+        dict -- fields of the event
+    """
+    targets = sinks(portia_config)
+
+    if len(targets) == 0:
+        yield fields
+        return
+
+    start = time.perf_counter()
+
+    try:
+        yield fields
+    except BaseException as err:
+        fields['error'] = type(err).__name__
+        raise
+    finally:
+        fields['seconds'] = time.perf_counter() - start
+        dispatch(targets, event, fields)
+
+def labels(endpoint: str) -> dict:
+    """Extracts the labels of an endpoint: its family, such as 'select' or
+    'describe', and the device it addresses.
+
+    Arguments:
+        endpoint {str} -- endpoint of the request
+
+    Returns:
+        dict -- family and edge_id, which is None for fleet-wide endpoints
+    """
+    segments = endpoint.strip('/').split('/')
+    edge_id = None
+
+    if 'device' in segments[:-1]:
+        edge_id = segments[segments.index('device') + 1]
+
+    return {'family': segments[0], 'edge_id': edge_id}
+
+_debug_repr = reprlib.Repr()
+_debug_repr.maxlevel = 3
+_debug_repr.maxdict = 8
+_debug_repr.maxlist = 8
+_debug_repr.maxstring = 60
+
+def debug_repr(value: object) -> str:
+    """Builds a bounded representation of a parsed document for debug
+    output, so large payloads are never stringified as a whole.
+
+    Arguments:
+        value {object} -- parsed document
+
+    Returns:
+        str -- abbreviated representation
+    """
+    return _debug_repr.repr(value)
+
+def document(portia_config: dict, response: object, value: object):
+    """Emits a 'document' event with a parsed JSON document, in debug mode
+    only, so it's shown along with the request that fetched it.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        response {object} -- HTTP response object the document came from
+        value {object} -- parsed document
+    """
+    if portia_config.get('debug') == True:
+        emit(
+            portia_config,
+            'document',
+            **getattr(response, 'portia_labels', {}),
+            document=debug_repr(value)
+        )
+
+
+class PrintSink(object):
+    """Prints events the way debug mode always did.
+    """
+    def __call__(self, event: dict):
+        if event['event'] == 'request':
+            print('[portia-debug]: status: {0} | {1:.4f} sec. | {2}' \
+                  .format(
+                      event.get('status', event.get('error')),
+                      event['seconds'],
+                      event['url']
+                  ))
+
+        elif event['event'] == 'document':
+            print('[portia-debug]: {0}'.format(event['document']))
+
+        elif event['event'] == 'parse':
+            if event.get('rows') is not None:
+                print('[portia-debug]: {0} rows'.format(event['rows']))
+
+            if event.get('decoded') is not None:
+                print('[portia-debug]: {0} bytes received, {1} bytes decoded '
+                      '({2})'.format(
+                          event['received'],
+                          event['decoded'],
+                          event['encoding']
+                      ))
+
+
+DEBUG_SINK = PrintSink()
+
+
+class LoggingSink(object):
+    """Logs events, with the whole event as the record's 'portia' attribute
+    for structured handlers.
+    """
+    def __init__(self, logger: logging.Logger=None, level: int=logging.INFO):
+        """LoggingSink's constructor.
+
+        Keyword Arguments:
+            logger {logging.Logger} -- logger to log to, the 'portiapy'
+                                       one when missing (default: {None})
+            level {int} -- level of the records (default: {logging.INFO})
+        """
+        self.logger = logger or logging.getLogger('portiapy')
+        self.level = level
+
+    def __call__(self, event: dict):
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        self.logger.log(
+            self.level,
+            'portia %s %s',
+            event['event'],
+            ' '.join(
+                '{0}={1}'.format(key, value) for key, value in event.items()
+                if key not in ('event', 'timestamp') and value is not None
+            ),
+            extra={'portia': event}
+        )
+
+
+class StatsSink(object):
+    """Aggregates events in memory into Prometheus-style counters and
+    histograms, labelled by event, endpoint family, device and status.
+    """
+    BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+    COUNTERS = ('bytes', 'rows', 'retries', 'errors')
+
+    def __init__(
+        self,
+        buckets: tuple=BUCKETS,
+        labels: tuple=('family', 'edge_id', 'status')
+    ):
+        """StatsSink's constructor.
+
+        Keyword Arguments:
+            buckets {tuple} -- upper bounds, in seconds, of the histograms'
+                               buckets (default: {StatsSink.BUCKETS})
+            labels {tuple} -- event fields series are labelled by; drop
+                              'edge_id' to keep their number bounded in
+                              large fleets
+                              (default: {('family', 'edge_id', 'status')})
+        """
+        self.buckets = tuple(sorted(buckets))
+        self.labels = tuple(labels)
+
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: dict):
+        key = (event['event'],) + tuple(
+            event.get(label) for label in self.labels
+        )
+        seconds = event.get('seconds') or 0.0
+        status = event.get('status')
+
+        with self._lock:
+            series = self._series.get(key)
+
+            if series is None:
+                series = self._series[key] = {
+                    'count': 0,
+                    'seconds': 0.0,
+                    'buckets': [0] * len(self.buckets),
+                    **{counter: 0 for counter in self.COUNTERS}
+                }
+
+            series['count'] += 1
+            series['seconds'] += seconds
+            series['bytes'] += event.get('received') or 0
+            series['rows'] += event.get('rows') or 0
+            series['retries'] += event.get('retries') or 0
+            series['errors'] += int(
+                event.get('error') is not None
+                or (status is not None and status >= 400)
+            )
+
+            index = bisect.bisect_left(self.buckets, seconds)
+            if index < len(self.buckets):
+                series['buckets'][index] += 1
+
+    def snapshot(self) -> list:
+        """Lists every series, e.g. to be loaded into a data frame.
+
+        Returns:
+            list -- dictionary of each series' labels and totals
+        """
+        with self._lock:
+            return [
+                {
+                    'event': key[0],
+                    **dict(zip(self.labels, key[1:])),
+                    **{
+                        name: value for name, value in series.items()
+                        if name != 'buckets'
+                    }
+                }
+                for key, series in self._series.items()
+            ]
+
+    def hot_spots(
+        self, event: str='request', by: str='family', top: int=10
+    ) -> list:
+        """Ranks the values of a label by the time their events took.
+
+        Keyword Arguments:
+            event {str} -- name of the events (default: {'request'})
+            by {str} -- label to group by, e.g. 'edge_id' (default: {'family'})
+            top {int} -- number of values to list (default: {10})
+
+        Returns:
+            list -- (value, total seconds, count) tuples, slowest first
+        """
+        totals = {}
+
+        for series in self.snapshot():
+            if series['event'] != event:
+                continue
+
+            seconds, count = totals.get(series.get(by), (0.0, 0))
+            totals[series.get(by)] = (
+                seconds + series['seconds'], count + series['count']
+            )
+
+        return sorted(
+            (
+                (value, seconds, count)
+                for value, (seconds, count) in totals.items()
+            ),
+            key=lambda item: item[1],
+            reverse=True
+        )[:top]
+
+    def exposition(self, prefix: str='portia') -> str:
+        """Renders the series in Prometheus' text exposition format, to be
+        served on a scrape endpoint.
+
+        Keyword Arguments:
+            prefix {str} -- prefix of the metrics' names (default: {'portia'})
+
+        Returns:
+            str -- metrics in Prometheus' text format
+        """
+        def render(labels):
+            return '{' + ','.join(
+                '{0}="{1}"'.format(name, str(value).replace('"', '\\"'))
+                for name, value in labels if value is not None
+            ) + '}'
+
+        lines = []
+
+        with self._lock:
+            items = sorted(self._series.items(), key=lambda item: str(item[0]))
+
+            for key, series in items:
+                name = '{0}_{1}'.format(prefix, key[0])
+                labels = list(zip(self.labels, key[1:]))
+                cumulative = 0
+
+                for bound, count in zip(self.buckets, series['buckets']):
+                    cumulative += count
+                    lines.append('{0}_seconds_bucket{1} {2}'.format(
+                        name, render(labels + [('le', bound)]), cumulative
+                    ))
+
+                lines.append('{0}_seconds_bucket{1} {2}'.format(
+                    name, render(labels + [('le', '+Inf')]), series['count']
+                ))
+                lines.append('{0}_seconds_sum{1} {2}'.format(
+                    name, render(labels), series['seconds']
+                ))
+                lines.append('{0}_seconds_count{1} {2}'.format(
+                    name, render(labels), series['count']
+                ))
+
+                for counter in self.COUNTERS:
+                    if series[counter] > 0:
+                        lines.append('{0}_{1}_total{2} {3}'.format(
+                            name, counter, render(labels), series[counter]
+                        ))
+
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        """Drops every series.
+        """
+        with self._lock:
+            self._series.clear()
+
+
+class OpenTelemetrySink(object):
+    """Records events as OpenTelemetry spans, backdated to when they
+    started.
+
+    It requires the optional opentelemetry-api dependency, installable with
+    `pip install portiapy[otel]`.
+    """
+    ATTRIBUTES = {
+        'method': 'http.request.method',
+        'status': 'http.response.status_code',
+        'url': 'url.full'
+    }
+
+    def __init__(self, tracer: object=None):
+        """OpenTelemetrySink's constructor.
+
+        Keyword Arguments:
+            tracer {object} -- tracer creating the spans
+                               (default: {trace.get_tracer('portiapy')})
+
+        Raises:
+            ImportError -- when opentelemetry-api is not installed
+        """
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                'the OpenTelemetry sink requires opentelemetry-api, install '
+                'it with `pip install portiapy[otel]`'
+            )
+
+        self._status = trace.Status
+        self._error = trace.StatusCode.ERROR
+        self.tracer = tracer or trace.get_tracer('portiapy')
+
+    def __call__(self, event: dict):
+        end = int(event['timestamp'] * 1e9)
+        start = end - int((event.get('seconds') or 0.0) * 1e9)
+
+        span = self.tracer.start_span(
+            'portia.{0}'.format(event['event']),
+            start_time=start,
+            attributes={
+                self.ATTRIBUTES.get(key, 'portia.{0}'.format(key)): value
+                for key, value in event.items()
+                if key not in ('event', 'timestamp')
+                and isinstance(value, (str, bool, int, float))
+            }
+        )
+
+        status = event.get('status')
+        if event.get('error') is not None or \
+           (status is not None and status >= 400):
+            span.set_status(self._status(self._error))
+
+        span.end(end_time=end)
@@ -0,0 +1,741 @@
+"""Plotting tools to chart a device's selections and summaries with Plotly,
+kept apart from utils so plotly is only imported when a chart is drawn.
+
+Long series are downsampled to a budget of points per pixel of the chart's
+width, with a shape-preserving algorithm, and drawn with WebGL when they
+still hold many points.
+"""
+
+import threading
+import weakref
+
+import numpy as np
+import pandas as pd
+import plotly.offline as plotly
+import plotly.graph_objs as plotlygo
+
+
+WIDTH = 1100
+HEIGHT = 650
+
+POINTS_PER_PIXEL = 2
+MAX_POINTS = WIDTH * POINTS_PER_PIXEL
+
+WEBGL_THRESHOLD = 5000
+
+# columns telling apart the series of a data frame holding many of them
+SERIES_KEYS = ['edge_id', 'port', 'sensor', 'dimension_code']
+
+# columns drawn of each series, and the arguments of their traces
+SELECTION_TRACES = [
+    ('dimension_value', {'mode': 'lines+markers'})
+]
+
+SUMMARY_TRACES = [
+    ('number_of_packages', {'name': 'Packages', 'opacity': 0.1}),
+    ('max', {'name': 'Max', 'mode': 'lines+markers', 'yaxis': 'y2'}),
+    ('avg', {'name': 'Avg', 'mode': 'lines+markers', 'yaxis': 'y2'}),
+    ('min', {'name': 'Min', 'mode': 'lines+markers', 'yaxis': 'y2'}),
+    ('median', {'name': 'Median', 'mode': 'lines+markers', 'yaxis': 'y2'}),
+    ('mode', {'name': 'Mode', 'mode': 'lines+markers', 'yaxis': 'y2'}),
+    ('sum', {'name': 'Sum', 'mode': 'lines+markers', 'yaxis': 'y2',
+             'visible': 'legendonly'}),
+    ('stddev', {'name': 'Stddev', 'mode': 'lines+markers', 'yaxis': 'y2',
+                'visible': 'legendonly'}),
+    ('spread', {'name': 'Spread', 'mode': 'lines+markers', 'yaxis': 'y2',
+                'visible': 'legendonly'})
+]
+
+_axes = {}
+_axes_lock = threading.Lock()
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Selects the points of a series to keep with the Largest Triangle Three
+    Buckets algorithm, which keeps its visual shape.
+
+    Arguments:
+        x {np.ndarray} -- numeric x values, sorted
+        y {np.ndarray} -- y values, without NaNs
+        threshold {int} -- number of points to keep
+
+    Returns:
+        np.ndarray -- sorted positions of the points to keep
+    """
+    length = len(x)
+
+    if threshold >= length or threshold < 3:
+        return np.arange(length)
+
+    x = x.astype('float64')
+    y = y.astype('float64')
+
+    # the first and last points are kept, the others split into buckets
+    edges = np.linspace(1, length - 1, threshold - 1).astype('int64')
+    starts = edges[:-1]
+    counts = np.diff(edges)
+
+    # each bucket is weighed against the average of the next one
+    averages_x = np.append(
+        (np.add.reduceat(x[:length - 1], starts) / counts)[1:], x[-1]
+    )
+    averages_y = np.append(
+        (np.add.reduceat(y[:length - 1], starts) / counts)[1:], y[-1]
+    )
+
+    positions = np.empty(threshold, dtype='int64')
+    positions[0] = 0
+    positions[-1] = length - 1
+    selected = 0
+
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+
+        areas = np.abs(
+            (x[selected] - averages_x[bucket])
+            * (y[start:end] - y[selected])
+            - (x[selected] - x[start:end])
+            * (averages_y[bucket] - y[selected])
+        )
+
+        selected = start + int(areas.argmax())
+        positions[bucket + 1] = selected
+
+    return positions
+
+def min_max(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+    """Selects the points of a series to keep by splitting it into buckets of
+    equal size and keeping the lowest and highest point of each, so no peak
+    is lost.
+
+    Arguments:
+        x {np.ndarray} -- numeric x values, sorted
+        y {np.ndarray} -- y values, without NaNs
+        threshold {int} -- number of points to keep
+
+    Returns:
+        np.ndarray -- sorted positions of the points to keep
+    """
+    length = len(x)
+
+    if threshold >= length or threshold < 4:
+        return np.arange(length)
+
+    size = -(-length // (threshold // 2))
+    buckets = -(-length // size)
+    padding = buckets * size - length
+
+    lowest = np.append(y, np.full(padding, np.inf)).reshape(buckets, size)
+    highest = np.append(y, np.full(padding, -np.inf)).reshape(buckets, size)
+    offsets = np.arange(buckets) * size
+
+    return np.unique(np.concatenate([
+        [0, length - 1],
+        offsets + lowest.argmin(axis=1),
+        offsets + highest.argmax(axis=1)
+    ]))
+
+
+DOWNSAMPLERS = {
+    'lttb': lttb,
+    'minmax': min_max
+}
+
+
+def to_milliseconds(timestamps: object) -> np.ndarray:
+    """Converts timestamps to milliseconds since the epoch.
+
+    Arguments:
+        timestamps {object} -- column of timestamps in milliseconds, or of
+                               datetimes
+
+    Returns:
+        np.ndarray -- timestamps in milliseconds
+    """
+    timestamps = pd.Series(timestamps, copy=False)
+
+    if pd.api.types.is_datetime64_any_dtype(timestamps):
+        if timestamps.dt.tz is not None:
+            timestamps = timestamps.dt.tz_localize(None)
+
+        return timestamps.values.astype('datetime64[ms]').astype('int64')
+
+    return timestamps.to_numpy(dtype='int64')
+
+def downsample(
+    x: np.ndarray,
+    y: np.ndarray,
+    max_points: int=MAX_POINTS,
+    method: str='lttb'
+) -> np.ndarray:
+    """Selects the points of a series to plot, skipping missing values.
+
+    Arguments:
+        x {np.ndarray} -- numeric x values, sorted
+        y {np.ndarray} -- y values
+
+    Keyword Arguments:
+        max_points {int} -- maximum number of points, or None to keep them
+                            all (default: {MAX_POINTS})
+        method {str} -- 'lttb' or 'minmax' (default: {'lttb'})
+
+    Returns:
+        np.ndarray -- sorted positions of the points to plot
+
+    Raises:
+        ValueError -- when the method is unknown
+    """
+    if method not in DOWNSAMPLERS:
+        raise ValueError('unknown downsampling method: {0}'.format(method))
+
+    y = np.asarray(y, dtype='float64')
+    valid = ~np.isnan(y)
+    positions = np.flatnonzero(valid)
+
+    if max_points is None or len(positions) <= max_points:
+        return positions
+
+    if len(positions) < len(y):
+        x, y = x[valid], y[valid]
+
+    return positions[DOWNSAMPLERS[method](x, y, max_points)]
+
+def resample(
+    x: np.ndarray,
+    y: np.ndarray,
+    start: int=None,
+    end: int=None,
+    max_points: int=MAX_POINTS,
+    method: str='lttb'
+) -> tuple:
+    """Downsamples the part of a series within a range, e.g. the one a chart
+    was zoomed to.
+
+    Arguments:
+        x {np.ndarray} -- timestamps in milliseconds, sorted
+        y {np.ndarray} -- y values
+
+    Keyword Arguments:
+        start {int} -- start of the range, in milliseconds (default: {None})
+        end {int} -- end of the range, in milliseconds (default: {None})
+        max_points {int} -- maximum number of points (default: {MAX_POINTS})
+        method {str} -- 'lttb' or 'minmax' (default: {'lttb'})
+
+    Returns:
+        tuple -- timestamps and y values of the points to plot
+    """
+    first = 0 if start is None else np.searchsorted(x, start, 'left')
+    last = len(x) if end is None else np.searchsorted(x, end, 'right')
+
+    # a point on each side keeps the lines running to the chart's edges
+    first, last = max(first - 1, 0), min(last + 1, len(x))
+    x, y = x[first:last], np.asarray(y)[first:last]
+
+    positions = downsample(x, y, max_points, method)
+
+    return x[positions], y[positions]
+
+def to_datetimes(
+    milliseconds: np.ndarray,
+    timezone: str
+) -> 'pd.DatetimeIndex':
+    """Converts timestamps in milliseconds to datetimes in a timezone.
+
+    Arguments:
+        milliseconds {np.ndarray} -- timestamps in milliseconds
+        timezone {str} -- timezone to convert the timestamp to
+
+    Returns:
+        pd.DatetimeIndex -- datetimes
+    """
+    return pd.to_datetime(milliseconds, unit='ms').tz_localize(timezone)
+
+def to_range_milliseconds(value: object) -> int:
+    """Converts a bound of a chart's x axis range to milliseconds, in the
+    same clock as the timestamps the chart was drawn from.
+
+    Arguments:
+        value {object} -- bound, as Plotly reports it
+
+    Returns:
+        int -- bound in milliseconds
+    """
+    value = pd.Timestamp(value)
+
+    if value.tz is not None:
+        value = value.tz_localize(None)
+
+    return value.value // 1000000
+
+def buffer_token(series: 'pd.Series') -> tuple:
+    """Identifies the buffer holding a column's values, which changes when
+    the column is replaced.
+
+    Arguments:
+        series {pd.Series} -- column of a data frame
+
+    Returns:
+        tuple -- address, length and dtype of the buffer
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = series.cat.codes.to_numpy()
+    else:
+        values = series.to_numpy()
+
+    return (
+        values.__array_interface__['data'][0], len(values), values.dtype.str
+    )
+
+def frame_axis(dataframe: 'pd.DataFrame', keys: list=()) -> dict:
+    """Builds the x axis of a data frame without modifying it: its timestamps
+    in milliseconds, sorted by series and time, the order sorting its rows,
+    and the bounds and labels of each series. The axis is cached until the
+    data frame is collected or its timestamps or key columns are replaced,
+    along with its datetimes in each timezone.
+
+    Values changed in place, e.g. by dataframe.loc[i, 'header_timestamp'],
+    keep the columns' buffers, so they aren't noticed: assign the column
+    anew, or plot a copy, after editing a frame that was already plotted.
+
+    Arguments:
+        dataframe {pd.DataFrame} -- data frame with header_timestamp
+
+    Keyword Arguments:
+        keys {list} -- columns telling its series apart (default: {()})
+
+    Returns:
+        dict -- 'milliseconds', 'order' (None when already sorted),
+                'bounds', 'labels' and 'datetimes' keyed by timezone
+    """
+    column = dataframe['header_timestamp']
+    cache_key = (id(dataframe), tuple(keys))
+    token = tuple(
+        buffer_token(series)
+        for series in [column] + [dataframe[key] for key in keys]
+    )
+
+    axis = _axes.get(cache_key)
+    if axis is not None and axis['token'] == token:
+        return axis
+
+    milliseconds = to_milliseconds(column)
+    order = None
+
+    if len(keys) > 0:
+        codes = [pd.factorize(dataframe[key], sort=True)[0] for key in keys]
+        order = np.lexsort([milliseconds] + codes[::-1])
+        milliseconds = milliseconds[order]
+
+        changed = np.zeros(max(len(order) - 1, 0), dtype=bool)
+        for code in codes:
+            changed |= np.diff(code[order]) != 0
+
+        starts = np.concatenate([[0], np.flatnonzero(changed) + 1])
+        labels = [
+            tuple(dataframe[key].iat[order[start]] for key in keys)
+            for start in starts
+        ]
+    else:
+        if len(milliseconds) > 1 and (np.diff(milliseconds) < 0).any():
+            order = np.argsort(milliseconds, kind='stable')
+            milliseconds = milliseconds[order]
+
+        starts = np.zeros(1, dtype='int64')
+        labels = [()]
+
+    axis = {
+        'token': token,
+        'milliseconds': milliseconds,
+        'order': order,
+        'bounds': np.append(starts, len(milliseconds)),
+        'labels': labels,
+        'datetimes': {}
+    }
+
+    with _axes_lock:
+        if cache_key not in _axes:
+            weakref.finalize(dataframe, _axes.pop, cache_key, None)
+
+        _axes[cache_key] = axis
+
+    return axis
+
+def axis_datetimes(axis: dict, timezone: str) -> 'pd.DatetimeIndex':
+    """Converts an axis' timestamps to datetimes in a timezone, once.
+
+    Arguments:
+        axis {dict} -- axis built by frame_axis
+        timezone {str} -- timezone to convert the timestamp to
+
+    Returns:
+        pd.DatetimeIndex -- datetimes of the axis
+    """
+    datetimes = axis['datetimes'].get(timezone)
+
+    if datetimes is None:
+        datetimes = axis['datetimes'][timezone] = to_datetimes(
+            axis['milliseconds'], timezone
+        )
+
+    return datetimes
+
+def series_arrays(dataframe: 'pd.DataFrame', column: str) -> tuple:
+    """Extracts a series of a data frame, sorted by timestamp.
+
+    Arguments:
+        dataframe {pd.DataFrame} -- data frame with header_timestamp
+        column {str} -- column of the y values
+
+    Returns:
+        tuple -- timestamps in milliseconds and y values
+    """
+    axis = frame_axis(dataframe)
+    y = dataframe[column].to_numpy()
+
+    if axis['order'] is not None:
+        y = y[axis['order']]
+
+    return axis['milliseconds'], y
+
+def build_trace(
+    x: np.ndarray,
+    y: np.ndarray,
+    timezone: str,
+    max_points: int=MAX_POINTS,
+    method: str='lttb',
+    webgl_threshold: int=WEBGL_THRESHOLD,
+    trace: type=None,
+    datetimes: callable=None,
+    **kwargs
+) -> object:
+    """Builds the trace of a downsampled series.
+
+    Arguments:
+        x {np.ndarray} -- timestamps in milliseconds, sorted
+        y {np.ndarray} -- y values
+        timezone {str} -- timezone to convert the timestamp to
+
+    Keyword Arguments:
+        max_points {int} -- maximum number of points (default: {MAX_POINTS})
+        method {str} -- 'lttb' or 'minmax' (default: {'lttb'})
+        webgl_threshold {int} -- number of points above which the trace is
+                                 drawn with WebGL (default: {WEBGL_THRESHOLD})
+        trace {type} -- class of the trace, a Scatter or a Scattergl by the
+                        number of points when missing (default: {None})
+        datetimes {callable} -- function returning x's datetimes, e.g. from
+                                a cache, used when most points are kept
+                                (default: {None})
+        **kwargs -- arguments of the trace
+
+    Returns:
+        object -- Plotly trace
+    """
+    positions = downsample(x, y, max_points, method)
+
+    if trace is None:
+        if len(positions) > webgl_threshold:
+            trace = plotlygo.Scattergl
+        else:
+            trace = plotlygo.Scatter
+
+    if datetimes is not None and 2 * len(positions) > len(x):
+        x = datetimes().take(positions)
+    else:
+        x = to_datetimes(x[positions], timezone)
+
+    return trace(x=x, y=np.asarray(y)[positions], **kwargs)
+
+def series_label(value: object) -> str:
+    """Labels a series after its key.
+
+    Arguments:
+        value {object} -- key of the series, such as a Target
+
+    Returns:
+        str -- label of the series
+    """
+    if isinstance(value, tuple):
+        return ' '.join(str(field) for field in value if field is not None)
+
+    return '' if value is None else str(value)
+
+def build_figure(
+    dataframes: object,
+    traces: list=None,
+    keys: list=None,
+    timezone: str='Etc/GMT-3',
+    max_points: int=MAX_POINTS,
+    method: str='lttb',
+    webgl_threshold: int=WEBGL_THRESHOLD
+) -> 'plotlygo.Figure':
+    """Builds a single chart of many series, without modifying their data
+    frames, whose x axes are cached for charts built later.
+
+    Arguments:
+        dataframes {object} -- list of data frames, dictionary of data
+                               frames keyed by series, such as fan-out
+                               results, or a single data frame holding many
+                               series, such as concatenated fan-out results
+
+    Keyword Arguments:
+        traces {list} -- (column, trace arguments) pairs of the columns to
+                         draw of each series, SELECTION_TRACES or
+                         SUMMARY_TRACES by the columns when missing
+                         (default: {None})
+        keys {list} -- columns telling apart the series of a single data
+                       frame, those of SERIES_KEYS it has when missing
+                       (default: {None})
+        timezone {str} -- timezone to convert the timestamp to
+                          (default: {'Etc/GMT-3'})
+        max_points {int} -- maximum number of points of each series, or None
+                            to plot them all (default: {MAX_POINTS})
+        method {str} -- 'lttb' or 'minmax' (default: {'lttb'})
+        webgl_threshold {int} -- number of points above which a series is
+                                 drawn with WebGL (default: {WEBGL_THRESHOLD})
+
+    Returns:
+        plotlygo.Figure -- Plotly figure
+    """
+    if isinstance(dataframes, pd.DataFrame):
+        if keys is None:
+            keys = [key for key in SERIES_KEYS if key in dataframes.columns]
+
+        frames = [(None, dataframes)]
+    elif isinstance(dataframes, dict):
+        frames = list(dataframes.items())
+    else:
+        frames = [
+            ('Sensor {0}'.format(i), dataframe)
+            for i, dataframe in enumerate(dataframes)
+        ]
+
+    if traces is None:
+        if any('dimension_value' in frame.columns for _, frame in frames):
+            traces = SELECTION_TRACES
+        else:
+            traces = SUMMARY_TRACES
+
+    axes = [
+        (label, dataframe, frame_axis(dataframe, keys or ()))
+        for label, dataframe in frames
+    ]
+    many = sum(len(axis['labels']) for _, _, axis in axes) > 1
+    lines = []
+
+    for label, dataframe, axis in axes:
+        columns = [
+            (column, arguments) for column, arguments in traces
+            if column in dataframe.columns
+        ]
+        values = {
+            column: dataframe[column].to_numpy() for column, _ in columns
+        }
+
+        if axis['order'] is not None:
+            values = {
+                column: value[axis['order']]
+                for column, value in values.items()
+            }
+
+        bounds = axis['bounds']
+
+        for group, series in enumerate(axis['labels']):
+            start, end = bounds[group], bounds[group + 1]
+            name = ' '.join(filter(None, [
+                series_label(label), series_label(series)
+            ]))
+
+            for column, arguments in columns:
+                arguments = dict(arguments)
+
+                if 'name' not in arguments:
+                    arguments['name'] = name or column
+                elif many == True:
+                    arguments['name'] = '{0} {1}'.format(
+                        name, arguments['name']
+                    ).strip()
+
+                if column == 'number_of_packages':
+                    arguments.setdefault('trace', plotlygo.Bar)
+
+                lines.append(build_trace(
+                    axis['milliseconds'][start:end],
+                    values[column][start:end],
+                    timezone,
+                    max_points,
+                    method,
+                    webgl_threshold,
+                    datetimes=lambda axis=axis, start=start, end=end: \
+                        axis_datetimes(axis, timezone)[start:end],
+                    **arguments
+                ))
+
+    if any(line.yaxis == 'y2' for line in lines):
+        layout = plotlygo.Layout(
+            width=WIDTH,
+            height=HEIGHT,
+            yaxis=dict(title='Number of Packages', side='right'),
+            yaxis2=dict(title='Dimension Value',
+            overlaying='y',
+            side='left'
+        ))
+    else:
+        layout = plotlygo.Layout(width=WIDTH, height=HEIGHT)
+
+    return plotlygo.Figure(data=lines, layout=layout)
+
+def build_selection_figure(
+    dataframes: list,
+    timezone: str='Etc/GMT-3',
+    max_points: int=MAX_POINTS,
+    method: str='lttb',
+    webgl_threshold: int=WEBGL_THRESHOLD
+) -> 'plotlygo.Figure':
+    """Builds a chart of a set of selections, downsampled.
+
+    Arguments:
+        dataframes {list} -- list of dataframes
+
+    Keyword Arguments:
+        timezone {str} -- timezone to convert the timestamp to
+                          (default: {'Etc/GMT-3'})
+        max_points {int} -- maximum number of points of each series, or None
+                            to plot them all (default: {MAX_POINTS})
+        method {str} -- 'lttb' or 'minmax' (default: {'lttb'})
+        webgl_threshold {int} -- number of points above which a series is
+                                 drawn with WebGL (default: {WEBGL_THRESHOLD})
+
+    Returns:
+        plotlygo.Figure -- Plotly figure
+    """
+    return build_figure(
+        dataframes,
+        SELECTION_TRACES,
+        None,
+        timezone,
+        max_points,
+        method,
+        webgl_threshold
+    )
+
+def plot_selection_from_dataframes(
+    dataframes: list,
+    timezone: str='Etc/GMT-3',
+    max_points: int=MAX_POINTS,
+    method: str='lttb'
+):
+    """Uses Plotly to plot a chart from a set of dataframes.
+
+    Arguments:
+        dataframes {list} -- list of dataframes
+
+    Keyword Arguments:
+        timezone {str} -- timezone to convert the timestamp to
+                          (default: {'Etc/GMT-3'})
+        max_points {int} -- maximum number of points of each series, or None
+                            to plot them all (default: {MAX_POINTS})
+        method {str} -- 'lttb' or 'minmax' (default: {'lttb'})
+    """
+    plotly.iplot(build_selection_figure(
+        dataframes, timezone, max_points, method
+    ))
+
+def plot_selection_widget(
+    dataframes: list,
+    timezone: str='Etc/GMT-3',
+    max_points: int=MAX_POINTS,
+    method: str='lttb',
+    fetch: callable=None
+) -> 'plotlygo.FigureWidget':
+    """Builds an interactive chart of a set of selections, which resamples
+    its series at a higher resolution whenever it's zoomed.
+
+    It requires the optional ipywidgets dependency, installable with
+    `pip install portiapy[widgets]`.
+
+    Arguments:
+        dataframes {list} -- list of dataframes
+
+    Keyword Arguments:
+        timezone {str} -- timezone to convert the timestamp to
+                          (default: {'Etc/GMT-3'})
+        max_points {int} -- maximum number of points of each series
+                            (default: {MAX_POINTS})
+        method {str} -- 'lttb' or 'minmax' (default: {'lttb'})
+        fetch {callable} -- function receiving a series' index and the
+                            zoomed range's start and end, in milliseconds,
+                            returning its data frame in that range, e.g. to
+                            select it again when the data frames were
+                            summaries (default: {None})
+
+    Returns:
+        plotlygo.FigureWidget -- Plotly figure widget, to be displayed
+
+    Raises:
+        ImportError -- when ipywidgets is not installed
+    """
+    series = [
+        series_arrays(dataframe, 'dimension_value')
+        for dataframe in dataframes
+    ]
+    figure = build_selection_figure(
+        dataframes, timezone, max_points, method, webgl_threshold=0
+    )
+
+    try:
+        widget = plotlygo.FigureWidget(figure)
+    except ImportError:
+        raise ImportError(
+            'zoomable charts require ipywidgets, install it with '
+            '`pip install portiapy[widgets]`'
+        )
+
+    def zoom(layout, x_range):
+        start, end = None, None
+
+        if x_range is not None:
+            start, end = map(to_range_milliseconds, x_range)
+
+        with widget.batch_update():
+            for i, trace in enumerate(widget.data):
+                x, y = series[i]
+
+                if fetch is not None and x_range is not None:
+                    x, y = series_arrays(
+                        fetch(i, start, end), 'dimension_value'
+                    )
+
+                x, y = resample(x, y, start, end, max_points, method)
+                trace.x = to_datetimes(x, timezone)
+                trace.y = y
+
+    widget.layout.on_change(zoom, 'xaxis.range')
+
+    return widget
+
+def plot_summary_from_dataframes(
+    dataframes: list,
+    timezone: str='Etc/GMT-3',
+    max_points: int=MAX_POINTS,
+    method: str='minmax'
+):
+    """Uses Plotly to plot a chart from a set of dataframes.
+
+    Arguments:
+        dataframes {list} -- list of dataframes
+
+    Keyword Arguments:
+        timezone {str} -- timezone to convert the timestamp to
+                          (default: {'Etc/GMT-3'})
+        max_points {int} -- maximum number of points of each series, or None
+                            to plot them all (default: {MAX_POINTS})
+        method {str} -- 'lttb' or 'minmax' (default: {'minmax'})
+    """
+    plotly.iplot(build_figure(
+        dataframes,
+        SUMMARY_TRACES,
+        None,
+        timezone,
+        max_points,
+        method
+    ))
@@ -0,0 +1,169 @@
+"""Incremental polling of a series, which only fetches the packages newer
+than the last one seen and keeps them in a rolling buffer.
+"""
+
+import time
+
+import portiapy.lazy as lazy
+import portiapy.chunking as chunking
+
+
+pd = lazy.load('pandas')
+
+
+class Poller(object):
+    """Polls a query, such as a sensor's select or events, from the last
+    'header_timestamp' it has seen on, so each poll only downloads and parses
+    the new packages.
+    """
+    def __init__(
+        self,
+        query: callable,
+        params: dict=None,
+        since: object=None,
+        max_age: str='1h',
+        callback: callable=None,
+        clock: callable=None
+    ):
+        """Poller's constructor.
+
+        Arguments:
+            query {callable} -- function receiving the params of a window and
+                                returning a data frame
+
+        Keyword Arguments:
+            params {dict} -- params to send to the service (default: {None})
+            since {object} -- 'from' of the first poll, defaulting to max_age
+                              ago (default: {None})
+            max_age {str} -- age of the oldest package kept in the buffer,
+                             or None to keep every package (default: {'1h'})
+            callback {callable} -- function receiving the new packages of
+                                   each poll that has any (default: {None})
+            clock {callable} -- function returning the current UTC timestamp
+                                (default: {None})
+        """
+        self.query = query
+        self.params = dict(params or {})
+        self.precision = self.params.get('precision') or 'ms'
+        self.max_age = pd.Timedelta(max_age) if max_age is not None else None
+        self.callback = callback
+        self.clock = clock or (lambda: pd.Timestamp.now(tz='UTC'))
+
+        self.buffer = None
+        self.last_timestamp = None
+        self.since = since
+
+        if self.since is None and self.max_age is not None:
+            self.since = self.to_epoch(self.clock() - self.max_age)
+
+    def to_epoch(self, timestamp: 'pd.Timestamp') -> int:
+        """Converts a timestamp into an epoch number in the poller's
+        precision, as found in 'header_timestamp'.
+
+        Arguments:
+            timestamp {pd.Timestamp} -- UTC timestamp
+
+        Returns:
+            int -- epoch number
+        """
+        return chunking.from_timestamp(timestamp, 0, self.precision)
+
+    def fresh(self, dataframe: 'pd.DataFrame') -> 'pd.DataFrame':
+        """Filters the packages that weren't seen yet. As 'from' is
+        inclusive, packages at the last timestamp come back on every poll and
+        are only kept when they aren't in the buffer already.
+
+        Arguments:
+            dataframe {pd.DataFrame} -- packages returned by a poll
+
+        Returns:
+            pd.DataFrame -- new packages, in timestamp order
+        """
+        dataframe = dataframe.sort_values('header_timestamp', kind='stable')
+
+        if self.last_timestamp is None:
+            return dataframe.reset_index(drop=True)
+
+        dataframe = dataframe[
+            dataframe['header_timestamp'] >= self.last_timestamp
+        ]
+        boundary = dataframe['header_timestamp'] == self.last_timestamp
+        seen = self.buffer[
+            self.buffer['header_timestamp'] == self.last_timestamp
+        ]
+        duplicated = pd.concat([seen, dataframe[boundary]]) \
+                       .duplicated().iloc[len(seen.index):]
+
+        dataframe = dataframe[~boundary.values | ~duplicated.reindex(
+            dataframe.index, fill_value=False
+        ).values]
+
+        return dataframe.reset_index(drop=True)
+
+    def poll(self) -> 'pd.DataFrame':
+        """Fetches the packages newer than the last one seen, merges them
+        into the buffer and drops the ones older than max_age.
+
+        Returns:
+            pd.DataFrame -- new packages, in timestamp order
+        """
+        since = self.last_timestamp
+        if since is None:
+            since = self.since
+
+        dataframe = self.query({
+            **self.params,
+            'from': since,
+            'to': None,
+            'order': None,
+            'limit': None
+        })
+        fresh = self.fresh(dataframe)
+
+        if len(fresh.index) == 0:
+            if self.buffer is None:
+                self.buffer = fresh
+            return fresh
+
+        if self.buffer is None:
+            self.buffer = fresh
+        else:
+            self.buffer = pd.concat([self.buffer, fresh], ignore_index=True)
+
+        self.last_timestamp = int(fresh['header_timestamp'].iloc[-1])
+
+        if self.max_age is not None:
+            oldest = self.last_timestamp - self.to_epoch(
+                pd.Timestamp(0, tz='UTC') + self.max_age
+            )
+            self.buffer = self.buffer[
+                self.buffer['header_timestamp'] >= oldest
+            ].reset_index(drop=True)
+
+        if self.callback is not None:
+            self.callback(fresh)
+
+        return fresh
+
+    def stream(self, interval: float=60, count: int=None) -> 'iterator':
+        """Polls every interval seconds, yielding each poll's new packages.
+
+        Keyword Arguments:
+            interval {float} -- seconds between polls (default: {60})
+            count {int} -- number of polls, or None to poll forever
+                           (default: {None})
+
+        Returns:
+            iterator -- new packages of each poll
+        """
+        polls = 0
+
+        while count is None or polls < count:
+            if polls > 0:
+                time.sleep(interval)
+
+            yield self.poll()
+            polls += 1
+
+    def __iter__(self):
+        return self.stream()
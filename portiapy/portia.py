@@ -3,22 +3,50 @@
 
 import types
 import builtins
+import threading
 
-import pandas as pd
-
+import portiapy.lazy as lazy
+import portiapy.accessors as accessors
 import portiapy.specs as specs
 import portiapy.utils as utils
 import portiapy.axioms as axioms
 import portiapy.events as events
+import portiapy.fanout as fanout
+import portiapy.fleet as fleet
 import portiapy.phases as phases
+import portiapy.poller as poller
 import portiapy.select as select
 import portiapy.profile as profile
 import portiapy.summary as summary
 import portiapy.describe as describe
+import portiapy.transport as transport
+
+
+pd = lazy.load('pandas')
+
+
+# configuration keys holding live resources, rather than plain settings
+RESOURCES = (
+	'transport',
+	'async_transport',
+	'limiter',
+	'cache',
+	'singleflight',
+	'history',
+	'metrics'
+)
+
+# bounds of the memoized handles, the oldest being dropped past them
+MAX_DEVICES = 4096
+MAX_CHILDREN = 256
+
+_memo_lock = threading.Lock()
 
 
 class CustomDict(dict):
-	"""Custom dictionary with an humanization method.
+	"""Custom dictionary with an humanization method. JSON results aren't
+	wrapped in it anymore, which copied them, but humanized in place by
+	utils.humanize_json; it's kept for code building it.
 	
 	Extends:
 		dict
@@ -49,32 +77,74 @@ class CustomDict(dict):
 
 
 def add_humanize_method(obj: object) -> object:
-	"""Adds humanize method to an object's instance.
+	"""Prepares a result to be humanized. Data frames get the 'portia'
+	accessor, registered once, and, for backward compatibility, the
+	deprecated humanize method bound; dictionaries are returned as they
+	are, to be humanized in place by utils.humanize_json.
 	
 	Arguments:
-		obj {object} -- object to have the method added
+		obj {object} -- result to be prepared
 	
 	Returns:
-		object -- object with the humanize method
+		object -- the same result
 	"""
-	if isinstance(obj, pd.DataFrame):
-		obj.humanize = types.MethodType(utils.humanize_dataframe, obj)
-	elif isinstance(obj, dict):
-		obj = CustomDict(obj)
+	if lazy.loaded(pd) and isinstance(obj, pd.DataFrame):
+		accessors.register()
+		obj.humanize = types.MethodType(accessors.deprecated_humanize, obj)
 
 	return obj
 
+def add_humanize_method_to_results(results: object) -> object:
+	"""Adds humanize method to a fan-out's results.
+	
+	Arguments:
+		results {object} -- dictionary of results or concatenated data frame
+	
+	Returns:
+		object -- results with the humanize method
+	"""
+	if isinstance(results, dict):
+		return {
+			target: add_humanize_method(result)
+			for target, result in results.items()
+		}
+
+	return add_humanize_method(results)
+
 
 class PortiaApi(object):
 	"""A factory for devices that use our Portia API.
 	"""
-	def __init__(self, portia_config: dict):
+	def __init__(
+		self,
+		portia_config: dict,
+		transport: 'transport.PortiaTransport'=None
+	):
 		"""PortiaApi's constructor.
 		
 		Arguments:
 			portia_config {dict} -- Portia's configuration arguments
+
+		Keyword Arguments:
+			transport {PortiaTransport} -- pooled HTTP transport to use; when
+										   missing, the one in the
+										   configuration or the shared one
+										   is used (default: {None})
 		"""
+		if transport is not None:
+			portia_config = {**portia_config, 'transport': transport}
+
 		self.portia_config = portia_config
+		self._devices = {}
+
+	@property
+	def transport(self) -> 'transport.PortiaTransport':
+		"""Pooled HTTP transport used by every request of this instance.
+		
+		Returns:
+			PortiaTransport -- PortiaTransport instance
+		"""
+		return transport.get_transport(self.portia_config)
 
 	def pipeline(self) -> 'EdgePipeline':
 		"""Builds a new EdgePipeline instance.
@@ -85,7 +155,7 @@ class PortiaApi(object):
 		return EdgePipeline(self.portia_config)
 
 	def device(self, edge_id: str) -> 'EdgeDevice':
-		"""Builds a new EdgeDevice instance.
+		"""Builds an EdgeDevice instance, or reuses the one built before.
 		
 		Arguments:
 			edge_id {str} -- Edge ID that identifies the device
@@ -93,7 +163,113 @@ class PortiaApi(object):
 		Returns:
 			EdgeDevice -- EdgeDevice instance
 		"""
-		return EdgeDevice(edge_id, self.portia_config)
+		return memoize(
+			self._devices,
+			edge_id,
+			lambda: EdgeDevice(edge_id, self.portia_config),
+			MAX_DEVICES
+		)
+
+	def fleet(
+		self,
+		edge_ids: list,
+		params: dict=None,
+		max_workers: int=8
+	) -> 'fleet.Fleet':
+		"""Crawls devices into an index of their ports, sensors and
+		dimensions, from which fan-out queries can be planned.
+
+		Arguments:
+			edge_ids {list} -- Edge IDs of the devices
+
+		Keyword Arguments:
+			params {dict} -- params of the describe requests (default: {None})
+			max_workers {int} -- maximum number of concurrent requests
+								 (default: {8})
+
+		Returns:
+			Fleet -- Fleet instance
+		"""
+		return fleet.Fleet(self.portia_config).crawl(
+			edge_ids, params, max_workers
+		)
+
+	def select_many(
+		self,
+		targets: list,
+		last: bool=False,
+		params: dict=None,
+		max_workers: int=8,
+		concat: bool=False
+	) -> tuple:
+		"""Retrieves the series of many targets concurrently.
+
+		Arguments:
+			targets {list} -- list of (edge_id, port, sensor[, dimension_code])
+							  targets
+
+		Keyword Arguments:
+			last {bool} -- if the last package should be returned or not
+						   (default: {False})
+			params {dict} -- params shared by all requests (default: {None})
+			max_workers {int} -- maximum number of concurrent requests
+								 (default: {8})
+			concat {bool} -- if results should be concatenated into a single
+							 data frame with key columns (default: {False})
+
+		Returns:
+			tuple -- results, as a dictionary keyed by Target or a
+					 concatenated data frame, and dictionary of errors keyed
+					 by Target
+		"""
+		results, errors = fanout.select_many(
+			self.portia_config, targets, last, params, max_workers, concat
+		)
+
+		return add_humanize_method_to_results(results), errors
+
+	def summary_many(
+		self,
+		targets: list,
+		strategy: 'SummaryStrategies'=summary.SummaryStrategies.PER_HOUR,
+		interval: int=1,
+		params: dict=None,
+		max_workers: int=8,
+		concat: bool=False
+	) -> tuple:
+		"""Summarizes many targets concurrently.
+
+		Arguments:
+			targets {list} -- list of (edge_id, port, sensor[, dimension_code])
+							  targets
+
+		Keyword Arguments:
+			strategy {SummaryStrategies} -- strategy to use when summarizing
+											(default:
+											{SummaryStrategies.PER_HOUR})
+			interval {int} -- interval of time to summarize (default: {1})
+			params {dict} -- params shared by all requests (default: {None})
+			max_workers {int} -- maximum number of concurrent requests
+								 (default: {8})
+			concat {bool} -- if results should be concatenated into a single
+							 data frame with key columns (default: {False})
+
+		Returns:
+			tuple -- results, as a dictionary keyed by Target or a
+					 concatenated data frame, and dictionary of errors keyed
+					 by Target
+		"""
+		results, errors = fanout.summary_many(
+			self.portia_config,
+			targets,
+			strategy,
+			interval,
+			params,
+			max_workers,
+			concat
+		)
+
+		return add_humanize_method_to_results(results), errors
 
 
 class EdgePipeline(object):
@@ -210,10 +386,147 @@ class EdgePipelineSpecification(object):
 		return specs.destroy(self.portia_config, specName)
 
 
-class EdgeDevice(object):
+def settings(portia_config: dict) -> dict:
+	"""Picks a configuration's plain settings, leaving out its RESOURCES.
+
+	Arguments:
+		portia_config {dict} -- Portia's configuration arguments
+
+	Returns:
+		dict -- configuration without transports, limiters, caches, etc.
+	"""
+	return {
+		name: value for name, value in portia_config.items()
+		if name not in RESOURCES
+	}
+
+def memoize(memo: dict, key: object, build: callable, limit: int) -> object:
+	"""Gets a value from a memo, building it when missing. Past the limit,
+	the oldest values are dropped, so memos of long-running crawls stay
+	bounded.
+
+	Arguments:
+		memo {dict} -- values built before
+		key {object} -- hashable key of the value
+		build {callable} -- function building the value
+		limit {int} -- maximum number of values
+
+	Returns:
+		object -- memoized value
+	"""
+	value = memo.get(key)
+
+	if value is None:
+		value = build()
+
+		with _memo_lock:
+			value = memo.setdefault(key, value)
+
+			while len(memo) > limit:
+				memo.pop(next(iter(memo)))
+
+	return value
+
+def restore_handle(cls: type, key: tuple, portia_config: dict) -> 'EdgeHandle':
+	"""Rebuilds a handle from its key, e.g. when it's unpickled. Handles are
+	pickled with their configuration's settings only, so the restored one
+	uses the shared transport.
+
+	Arguments:
+		cls {type} -- class of the handle
+		key {tuple} -- values of the handle's KEYS
+		portia_config {dict} -- Portia's configuration arguments
+
+	Returns:
+		EdgeHandle -- handle instance
+	"""
+	handle = object.__new__(cls)
+	EdgeHandle.__init__(handle, portia_config, *key)
+
+	return handle
+
+
+class EdgeHandle(object):
+	"""Immutable and hashable handle of a device's node, identified by the
+	values of its KEYS and its configuration's settings. Handles don't keep
+	their parents, and they memoize their children, so navigating to the
+	same node again allocates nothing.
+	"""
+	__slots__ = ('portia_config', '_children')
+	KEYS = ()
+
+	def __init__(self, portia_config: dict, *key):
+		"""EdgeHandle's constructor.
+
+		Arguments:
+			portia_config {dict} -- Portia's configuration arguments
+			*key -- values of the handle's KEYS
+		"""
+		for name, value in zip(self.KEYS, key):
+			object.__setattr__(self, name, value)
+
+		object.__setattr__(self, 'portia_config', portia_config)
+		object.__setattr__(self, '_children', None)
+
+	@property
+	def key(self) -> tuple:
+		"""Values that identify the handle, e.g. (edge_id, port, sensor).
+
+		Returns:
+			tuple -- values of the handle's KEYS
+		"""
+		return tuple(getattr(self, name) for name in self.KEYS)
+
+	def __setattr__(self, name: str, value: object):
+		raise AttributeError('{0} is immutable'.format(type(self).__name__))
+
+	def __delattr__(self, name: str):
+		raise AttributeError('{0} is immutable'.format(type(self).__name__))
+
+	def __eq__(self, other: object) -> bool:
+		if type(self) is not type(other):
+			return NotImplemented
+
+		return self.key == other.key and (
+			self.portia_config is other.portia_config
+			or settings(self.portia_config) == settings(other.portia_config)
+		)
+
+	def __hash__(self) -> int:
+		return hash((type(self), self.key))
+
+	def __repr__(self) -> str:
+		return '{0}{1!r}'.format(type(self).__name__, self.key)
+
+	def __reduce__(self) -> tuple:
+		return restore_handle, (
+			type(self), self.key, settings(self.portia_config)
+		)
+
+	def _child(self, cls: type, code: int) -> 'EdgeHandle':
+		children = self._children
+
+		if children is None:
+			children = {}
+			object.__setattr__(self, '_children', children)
+
+		return memoize(
+			children,
+			(cls, code),
+			lambda: cls(self, code, self.portia_config),
+			MAX_CHILDREN
+		)
+
+
+class EdgeDevice(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id',)
+
 	def __init__(self, edge_id: str, portia_config: dict):
 		"""EdgeDevice's constructor.
 		
@@ -221,11 +534,10 @@ class EdgeDevice(object):
 			edge_id {str} -- Edge ID that identifies the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_id
-		self.portia_config = portia_config
+		super().__init__(portia_config, edge_id)
 
 	def port(self, port: int) -> 'EdgeDevicePort':
-		"""Builds a new EdgeDevicePort instance.
+		"""Builds an EdgeDevicePort instance, reused by later calls.
 		
 		Arguments:
 			port {int} -- port of the device
@@ -233,10 +545,11 @@ class EdgeDevice(object):
 		Returns:
 			EdgeDevicePort -- EdgeDevicePort instance
 		"""
-		return EdgeDevicePort(self, port, self.portia_config)
+		return self._child(EdgeDevicePort, port)
 
 	def dimension(self, dimension: int) -> 'EdgeDeviceDimensionFromDevice':
-		"""Builds a new EdgeDeviceDimensionFromDevice instance.
+		"""Builds an EdgeDeviceDimensionFromDevice instance, reused by later
+		calls.
 		
 		Arguments:
 			dimension {int} -- dimension of the device
@@ -245,9 +558,7 @@ class EdgeDevice(object):
 			EdgeDeviceDimensionFromDevice -- EdgeDeviceDimensionFromDevice
 											 instance
 		"""
-		return EdgeDeviceDimensionFromDevice(
-			self, dimension, self.portia_config
-		)
+		return self._child(EdgeDeviceDimensionFromDevice, dimension)
 
 	def ports(self, last: bool=False, params: dict=None) -> object:
 		"""Lists a device's ports.
@@ -288,10 +599,15 @@ class EdgeDevice(object):
 		))
 
 
-class EdgeDevicePort(object):
+class EdgeDevicePort(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID and a port.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id', 'port')
+
 	def __init__(
 		self, edge_device: EdgeDevice, port: int, portia_config: dict
 	):
@@ -302,12 +618,10 @@ class EdgeDevicePort(object):
 			port {int} -- port of the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_device.edge_id
-		self.port = port
-		self.portia_config = portia_config
+		super().__init__(portia_config, edge_device.edge_id, port)
 
 	def sensor(self, sensor: int) -> 'EdgeDeviceSensor':
-		"""Builds a new EdgeDeviceSensor instance.
+		"""Builds an EdgeDeviceSensor instance, reused by later calls.
 		
 		Arguments:
 			sensor {int} -- sensor of the device
@@ -315,10 +629,11 @@ class EdgeDevicePort(object):
 		Returns:
 			EdgeDeviceSensor -- EdgeDeviceSensor instance
 		"""
-		return EdgeDeviceSensor(self, sensor, self.portia_config)
+		return self._child(EdgeDeviceSensor, sensor)
 
 	def dimension(self, dimension: int) -> 'EdgeDeviceDimensionFromPort':
-		"""Builds a new EdgeDeviceDimensionFromPort instance.
+		"""Builds an EdgeDeviceDimensionFromPort instance, reused by later
+		calls.
 		
 		Arguments:
 			dimension {int} -- dimension code of the device
@@ -326,7 +641,7 @@ class EdgeDevicePort(object):
 		Returns:
 			EdgeDeviceDimensionFromPort -- EdgeDeviceDimensionFromPort instance
 		"""
-		return EdgeDeviceDimensionFromPort(self, dimension, self.portia_config)
+		return self._child(EdgeDeviceDimensionFromPort, dimension)
 
 	def sensors(self, last: bool=False, params: dict=None) -> object:
 		"""Lists a device's sensors.
@@ -387,10 +702,15 @@ class EdgeDevicePort(object):
 		))
 
 
-class EdgeDeviceSensor(object):
+class EdgeDeviceSensor(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID, a port and a sensor.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id', 'port', 'sensor')
+
 	def __init__(
 		self,
 		edge_device_port: EdgeDevicePort,
@@ -405,13 +725,16 @@ class EdgeDeviceSensor(object):
 			sensor {int} -- sensor of the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_device_port.edge_id
-		self.port = edge_device_port.port
-		self.sensor = sensor
-		self.portia_config = portia_config
+		super().__init__(
+			portia_config,
+			edge_device_port.edge_id,
+			edge_device_port.port,
+			sensor
+		)
 
 	def dimension(self, dimension: int) -> 'EdgeDeviceDimensionFromSensor':
-		"""Builds a new EdgeDeviceDimensionFromSensor instance.
+		"""Builds an EdgeDeviceDimensionFromSensor instance, reused by later
+		calls.
 		
 		Arguments:
 			dimension {int} -- dimension code of the device
@@ -420,12 +743,10 @@ class EdgeDeviceSensor(object):
 			EdgeDeviceDimensionFromSensor -- EdgeDeviceDimensionFromSensor
 											 instance
 		"""
-		return EdgeDeviceDimensionFromSensor(
-			self, dimension, self.portia_config
-		)
+		return self._child(EdgeDeviceDimensionFromSensor, dimension)
 
 	def event(self, event: int) -> 'EdgeDeviceEventFromSensor':
-		"""Builds a new EdgeDeviceEventFromSensor instance.
+		"""Builds an EdgeDeviceEventFromSensor instance, reused by later calls.
 		
 		Arguments:
 			event {int} -- event code of the device
@@ -433,7 +754,7 @@ class EdgeDeviceSensor(object):
 		Returns:
 			EdgeDeviceEventFromSensor -- EdgeDeviceEventFromSensor instance
 		"""
-		return EdgeDeviceEventFromSensor(self, event, self.portia_config)
+		return self._child(EdgeDeviceEventFromSensor, event)
 
 	def dimensions(self, last: bool=False, params: dict=None) -> object:
 		"""Lists a device's dimensions.
@@ -484,13 +805,18 @@ class EdgeDeviceSensor(object):
 			params
 		))
 
-	def select(self, last: bool=False, params: dict=None) -> object:
+	def select(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's series by its port and sensor.
 
 		Keyword Arguments:
 			last {bool} -- if the last package should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's dimensions
@@ -501,7 +827,8 @@ class EdgeDeviceSensor(object):
 			self.port,
 			self.sensor,
 			last,
-			params
+			params,
+			chunk
 		))
 
 	def summary(
@@ -532,13 +859,18 @@ class EdgeDeviceSensor(object):
 			params
 		))
 
-	def events(self, last: bool=False, params: dict=None) -> object:
+	def events(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's events by its port and sensor.
 
 		Keyword Arguments:
 			last {bool} -- if the last event should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's events
@@ -549,14 +881,60 @@ class EdgeDeviceSensor(object):
 			self.port,
 			self.sensor,
 			last,
-			params
+			params,
+			chunk
 		))
 
+	def poller(
+		self,
+		family: str='select',
+		params: dict=None,
+		since: object=None,
+		max_age: str='1h',
+		callback: callable=None
+	) -> 'poller.Poller':
+		"""Builds a poller that only fetches the packages newer than the
+		last one it has seen.
+
+		Keyword Arguments:
+			family {str} -- 'select' or 'events' (default: {'select'})
+			params {dict} -- params to send to the service (default: {None})
+			since {object} -- 'from' of the first poll, defaulting to max_age
+							  ago (default: {None})
+			max_age {str} -- age of the oldest package kept in the buffer
+							 (default: {'1h'})
+			callback {callable} -- function receiving the new packages of
+								   each poll (default: {None})
+
+		Returns:
+			Poller -- Poller instance
+
+		Raises:
+			ValueError -- when the family isn't select or events
+		"""
+		if family not in ('select', 'events'):
+			raise ValueError('unknown poller family: {0}'.format(family))
+
+		query = getattr(self, family)
 
-class EdgeDeviceDimensionFromDevice(object):
+		return poller.Poller(
+			lambda params: query(params=params),
+			params,
+			since,
+			max_age,
+			callback
+		)
+
+
+class EdgeDeviceDimensionFromDevice(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID and a dimension code.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id', 'dimension')
+
 	def __init__(
 		self,
 		edge_device: EdgeDevice,
@@ -570,9 +948,7 @@ class EdgeDeviceDimensionFromDevice(object):
 			dimension {int} -- dimension code of the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_device.edge_id
-		self.dimension = dimension
-		self.portia_config = portia_config
+		super().__init__(portia_config, edge_device.edge_id, dimension)
 
 	def summary(
 		self,
@@ -605,10 +981,15 @@ class EdgeDeviceDimensionFromDevice(object):
 		))
 
 
-class EdgeDeviceDimensionFromPort(object):
+class EdgeDeviceDimensionFromPort(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID, a port and a dimension code.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id', 'port', 'dimension')
+
 	def __init__(
 		self,
 		edge_device_port: EdgeDevicePort,
@@ -623,13 +1004,16 @@ class EdgeDeviceDimensionFromPort(object):
 			dimension {int} -- dimension code of the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_device_port.edge_id
-		self.port = edge_device_port.port
-		self.dimension = dimension
-		self.portia_config = portia_config
+		super().__init__(
+			portia_config,
+			edge_device_port.edge_id,
+			edge_device_port.port,
+			dimension
+		)
 
 	def event(self, event: int) -> 'EdgeDeviceEventFromDimension':
-		"""Builds a new EdgeDeviceEventFromDimension instance.
+		"""Builds an EdgeDeviceEventFromDimension instance, reused by later
+		calls.
 		
 		Arguments:
 			event {int} -- event code of the device
@@ -638,15 +1022,20 @@ class EdgeDeviceDimensionFromPort(object):
 			EdgeDeviceEventFromDimension -- EdgeDeviceEventFromDimension
 											instance
 		"""
-		return EdgeDeviceEventFromDimension(self, event, self.portia_config)
+		return self._child(EdgeDeviceEventFromDimension, event)
 
-	def select(self, last: bool=False, params: dict=None) -> object:
+	def select(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's series by its port and dimension code.
 
 		Keyword Arguments:
 			last {bool} -- if the last package should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's dimensions
@@ -657,16 +1046,22 @@ class EdgeDeviceDimensionFromPort(object):
 			self.port,
 			self.dimension,
 			last,
-			params
+			params,
+			chunk
 		))
 
-	def events(self, last: bool=False, params: dict=None) -> object:
+	def events(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's events by its port and dimension code.
 
 		Keyword Arguments:
 			last {bool} -- if the last event should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's events
@@ -677,14 +1072,60 @@ class EdgeDeviceDimensionFromPort(object):
 			self.port,
 			self.dimension,
 			last,
-			params
+			params,
+			chunk
 		))
 
+	def poller(
+		self,
+		family: str='select',
+		params: dict=None,
+		since: object=None,
+		max_age: str='1h',
+		callback: callable=None
+	) -> 'poller.Poller':
+		"""Builds a poller that only fetches the packages newer than the
+		last one it has seen.
+
+		Keyword Arguments:
+			family {str} -- 'select' or 'events' (default: {'select'})
+			params {dict} -- params to send to the service (default: {None})
+			since {object} -- 'from' of the first poll, defaulting to max_age
+							  ago (default: {None})
+			max_age {str} -- age of the oldest package kept in the buffer
+							 (default: {'1h'})
+			callback {callable} -- function receiving the new packages of
+								   each poll (default: {None})
+
+		Returns:
+			Poller -- Poller instance
+
+		Raises:
+			ValueError -- when the family isn't select or events
+		"""
+		if family not in ('select', 'events'):
+			raise ValueError('unknown poller family: {0}'.format(family))
+
+		query = getattr(self, family)
+
+		return poller.Poller(
+			lambda params: query(params=params),
+			params,
+			since,
+			max_age,
+			callback
+		)
+
 
-class EdgeDeviceDimensionFromSensor(object):
+class EdgeDeviceDimensionFromSensor(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID, a port, a sensor and a dimension code.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id', 'port', 'sensor', 'dimension')
+
 	def __init__(
 		self,
 		edge_device_sensor: EdgeDeviceSensor,
@@ -699,14 +1140,17 @@ class EdgeDeviceDimensionFromSensor(object):
 			dimension {int} -- dimension code of the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_device_sensor.edge_id
-		self.port = edge_device_sensor.port
-		self.sensor = edge_device_sensor.sensor
-		self.dimension = dimension
-		self.portia_config = portia_config
+		super().__init__(
+			portia_config,
+			edge_device_sensor.edge_id,
+			edge_device_sensor.port,
+			edge_device_sensor.sensor,
+			dimension
+		)
 
 	def event(self, event: int) -> 'EdgeDeviceEventFromSensorDimension':
-		"""Builds a new EdgeDeviceEventFromSensorDimension instance.
+		"""Builds an EdgeDeviceEventFromSensorDimension instance, reused by
+		later calls.
 		
 		Arguments:
 			event {int} -- event code of the device
@@ -715,17 +1159,20 @@ class EdgeDeviceDimensionFromSensor(object):
 			EdgeDeviceEventFromSensorDimension -- 
 				EdgeDeviceEventFromSensorDimension instance
 		"""
-		return EdgeDeviceEventFromSensorDimension(
-			self, event, self.portia_config
-		)
+		return self._child(EdgeDeviceEventFromSensorDimension, event)
 
-	def select(self, last: bool=False, params: dict=None) -> object:
+	def select(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's series by its port, sensor and dimension code.
 
 		Keyword Arguments:
 			last {bool} -- if the last package should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's dimensions
@@ -737,7 +1184,8 @@ class EdgeDeviceDimensionFromSensor(object):
 			self.sensor,
 			self.dimension,
 			last,
-			params
+			params,
+			chunk
 		))
 
 	def summary(
@@ -769,13 +1217,18 @@ class EdgeDeviceDimensionFromSensor(object):
 			params
 		))
 
-	def events(self, last: bool=False, params: dict=None) -> object:
+	def events(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's events by its port, sensor and dimension code.
 
 		Keyword Arguments:
 			last {bool} -- if the last event should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's events
@@ -787,14 +1240,60 @@ class EdgeDeviceDimensionFromSensor(object):
 			self.sensor,
 			self.dimension,
 			last,
-			params
+			params,
+			chunk
 		))
 
+	def poller(
+		self,
+		family: str='select',
+		params: dict=None,
+		since: object=None,
+		max_age: str='1h',
+		callback: callable=None
+	) -> 'poller.Poller':
+		"""Builds a poller that only fetches the packages newer than the
+		last one it has seen.
+
+		Keyword Arguments:
+			family {str} -- 'select' or 'events' (default: {'select'})
+			params {dict} -- params to send to the service (default: {None})
+			since {object} -- 'from' of the first poll, defaulting to max_age
+							  ago (default: {None})
+			max_age {str} -- age of the oldest package kept in the buffer
+							 (default: {'1h'})
+			callback {callable} -- function receiving the new packages of
+								   each poll (default: {None})
+
+		Returns:
+			Poller -- Poller instance
+
+		Raises:
+			ValueError -- when the family isn't select or events
+		"""
+		if family not in ('select', 'events'):
+			raise ValueError('unknown poller family: {0}'.format(family))
+
+		query = getattr(self, family)
 
-class EdgeDeviceEventFromSensor(object):
+		return poller.Poller(
+			lambda params: query(params=params),
+			params,
+			since,
+			max_age,
+			callback
+		)
+
+
+class EdgeDeviceEventFromSensor(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID, a port a sensor and an event code.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id', 'port', 'sensor', 'event')
+
 	def __init__(
 		self,
 		edge_device_sensor: EdgeDeviceSensor,
@@ -809,19 +1308,26 @@ class EdgeDeviceEventFromSensor(object):
 			event {int} -- event code of the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_device_sensor.edge_id
-		self.port = edge_device_sensor.port
-		self.sensor = edge_device_sensor.sensor
-		self.event = event
-		self.portia_config = portia_config
+		super().__init__(
+			portia_config,
+			edge_device_sensor.edge_id,
+			edge_device_sensor.port,
+			edge_device_sensor.sensor,
+			event
+		)
 
-	def events(self, last: bool=False, params: dict=None) -> object:
+	def events(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's events by its port, sensor and event code.
 
 		Keyword Arguments:
 			last {bool} -- if the last event should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's events
@@ -833,14 +1339,20 @@ class EdgeDeviceEventFromSensor(object):
 			self.sensor,
 			self.event,
 			last,
-			params
+			params,
+			chunk
 		))
 
 
-class EdgeDeviceEventFromDimension(object):
+class EdgeDeviceEventFromDimension(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID, a port a dimension code and an event code.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id', 'port', 'dimension', 'event')
+
 	def __init__(
 		self,
 		edge_device_dimension_from_port: EdgeDeviceDimensionFromPort,
@@ -855,13 +1367,17 @@ class EdgeDeviceEventFromDimension(object):
 			event {int} -- event code of the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_device_dimension_from_port.edge_id
-		self.port = edge_device_dimension_from_port.port
-		self.dimension = edge_device_dimension_from_port.dimension
-		self.event = event
-		self.portia_config = portia_config
+		super().__init__(
+			portia_config,
+			edge_device_dimension_from_port.edge_id,
+			edge_device_dimension_from_port.port,
+			edge_device_dimension_from_port.dimension,
+			event
+		)
 
-	def events(self, last: bool=False, params: dict=None) -> object:
+	def events(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's events by its port, dimension code and event
 		code.
 
@@ -869,6 +1385,9 @@ class EdgeDeviceEventFromDimension(object):
 			last {bool} -- if the last event should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's events
@@ -880,14 +1399,20 @@ class EdgeDeviceEventFromDimension(object):
 			self.dimension,
 			self.event,
 			last,
-			params
+			params,
+			chunk
 		))
 
 
-class EdgeDeviceEventFromSensorDimension(object):
+class EdgeDeviceEventFromSensorDimension(EdgeHandle):
 	"""Abstracts usage of all Portia endpoints concerning data that only need
 	an Edge ID, a port, sensor, dimension code and an event code.
+
+	Extends:
+		EdgeHandle
 	"""
+	__slots__ = KEYS = ('edge_id', 'port', 'sensor', 'dimension', 'event')
+
 	def __init__(
 		self,
 		edge_device_dimension_from_sensor: EdgeDeviceDimensionFromSensor,
@@ -902,14 +1427,18 @@ class EdgeDeviceEventFromSensorDimension(object):
 			event {int} -- event code of the device
 			portia_config {dict} -- Portia's configuration arguments
 		"""
-		self.edge_id = edge_device_dimension_from_sensor.edge_id
-		self.port = edge_device_dimension_from_sensor.port
-		self.sensor = edge_device_dimension_from_sensor.sensor
-		self.dimension = edge_device_dimension_from_sensor.dimension
-		self.event = event
-		self.portia_config = portia_config
+		super().__init__(
+			portia_config,
+			edge_device_dimension_from_sensor.edge_id,
+			edge_device_dimension_from_sensor.port,
+			edge_device_dimension_from_sensor.sensor,
+			edge_device_dimension_from_sensor.dimension,
+			event
+		)
 
-	def events(self, last: bool=False, params: dict=None) -> object:
+	def events(
+		self, last: bool=False, params: dict=None, chunk: str=None
+	) -> object:
 		"""Retrieves a device's events by its port, sensor, dimension code and
 		event code.
 
@@ -917,6 +1446,9 @@ class EdgeDeviceEventFromSensorDimension(object):
 			last {bool} -- if the last event should be returned or not
 						   (default: {False})
 			params {dict} -- params to send to the service (default: {None})
+			chunk {str} -- when set, e.g. '7d', the window is split into
+						   slices of this size, fetched concurrently
+						   (default: {None})
 
 		Returns:
 			object -- object with the device's events
@@ -929,5 +1461,6 @@ class EdgeDeviceEventFromSensorDimension(object):
 			self.dimension,
 			self.event,
 			last,
-			params
+			params,
+			chunk
 		))
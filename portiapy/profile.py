@@ -2,9 +2,9 @@
 on any given time.
 """
 
-import json
 from enum import Enum
 
+import portiapy.metrics as metrics
 import portiapy.utils as utils
 
 
@@ -17,6 +17,30 @@ class ProfileStrategies(Enum):
         return self.name.lower().replace('_', '')
 
 
+def convert_profile(portia_config: dict, response: object) -> dict:
+    """Converts a profile response into a dictionary.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        response {object} -- HTTP response object
+
+    Returns:
+        dict -- dictionary with the profile
+
+    Raises:
+        Exception -- when the request goes wrong
+    """
+    if response.status_code == 200:
+
+        d = utils.loads(response.content)
+        metrics.document(portia_config, response, d.get('ports'))
+
+        return d
+
+    else:
+        raise Exception("couldn't retrieve data")
+
+
 def device_profile(
     portia_config: dict,
     edge_id: str,
@@ -49,16 +73,7 @@ def device_profile(
 
     response = utils.http_get_request(portia_config, endpoint, params)
 
-    if response.status_code == 200:
-
-        d = json.loads(response.text)
-        if portia_config['debug']:
-            print('[portia-debug]: {0}'.format(d.get('ports')))
-
-        return d
-
-    else:
-        raise Exception("couldn't retrieve data")
+    return convert_profile(portia_config, response)
 
 
 def port_profile(
@@ -95,16 +110,7 @@ def port_profile(
 
     response = utils.http_get_request(portia_config, endpoint, params)
 
-    if response.status_code == 200:
-
-        d = json.loads(response.text)
-        if portia_config['debug']:
-            print('[portia-debug]: {0}'.format(d.get('ports')))
-
-        return d
-
-    else:
-        raise Exception("couldn't retrieve data")
+    return convert_profile(portia_config, response)
 
 
 def sensor_profile(
@@ -143,13 +149,4 @@ def sensor_profile(
 
     response = utils.http_get_request(portia_config, endpoint, params)
 
-    if response.status_code == 200:
-
-        d = json.loads(response.text)
-        if portia_config['debug']:
-            print('[portia-debug]: {0}'.format(d.get('ports')))
-
-        return d
-
-    else:
-        raise Exception("couldn't retrieve data")
+    return convert_profile(portia_config, response)
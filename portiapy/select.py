@@ -2,6 +2,8 @@
 """
 
 import portiapy.utils as utils
+import portiapy.chunking as chunking
+import portiapy.history as history
 
 
 def query_by_port_sensor(
@@ -19,7 +21,8 @@ def query_by_port_sensor(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's series by its port and sensor.
     
     Arguments:
@@ -34,10 +37,22 @@ def query_by_port_sensor(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', 'order', 'lower_bound', 'upper_bound', 'order',
                          'limit', 'precision': 'ms', 'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's dimensions
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_sensor(
+                portia_config, edge_id, port, sensor, last, params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -54,11 +69,27 @@ def query_by_port_sensor(
             edge_id, port, sensor
         )
 
+    if portia_config.get('history') is not None and last == False:
+        return history.query_cached(
+            portia_config,
+            lambda portia_config, params: query_by_port_sensor(
+                portia_config, edge_id, port, sensor, last, params
+            ),
+            endpoint,
+            params
+        )
+
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.SELECT_SCHEMA
+    )
 
 
 def query_by_port_dimension(
@@ -76,7 +107,8 @@ def query_by_port_dimension(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's series by its port and dimension code.
     
     Arguments:
@@ -91,10 +123,22 @@ def query_by_port_dimension(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', 'order', 'lower_bound', 'upper_bound', 'order',
                          'limit', 'precision': 'ms', 'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's dimensions
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_dimension(
+                portia_config, edge_id, port, dimension_code, last, params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -111,11 +155,27 @@ def query_by_port_dimension(
             edge_id, port, dimension_code
         )
 
+    if portia_config.get('history') is not None and last == False:
+        return history.query_cached(
+            portia_config,
+            lambda portia_config, params: query_by_port_dimension(
+                portia_config, edge_id, port, dimension_code, last, params
+            ),
+            endpoint,
+            params
+        )
+
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.SELECT_SCHEMA
+    )
 
 
 def query_by_port_sensor_dimension(
@@ -134,7 +194,8 @@ def query_by_port_sensor_dimension(
         'limit': None,
         'precision': 'ms',
         'timezone': 'Etc/UTC'
-    }) -> object:
+    },
+    chunk: str=None) -> object:
     """Retrieves a device's series by its port, sensor and dimension code.
     
     Arguments:
@@ -150,10 +211,28 @@ def query_by_port_sensor_dimension(
         params {dict} -- params to send to the service (default: {{ 'from',
                          'to', 'order', 'lower_bound', 'upper_bound', 'order',
                          'limit', 'precision': 'ms', 'timezone': 'Etc/UTC' }})
+        chunk {str} -- when set, e.g. '7d', the window is split into slices
+                       of this size, fetched concurrently (default: {None})
 
     Returns:
         object -- object with the device's dimensions
     """
+    if chunk is not None and last == False:
+        return chunking.query_chunked(
+            portia_config,
+            lambda params: query_by_port_sensor_dimension(
+                portia_config,
+                edge_id,
+                port,
+                sensor,
+                dimension_code,
+                last,
+                params
+            ),
+            params,
+            chunk
+        )
+
     accept_header = portia_config.get('Accept')
 
     if accept_header is None:
@@ -168,8 +247,30 @@ def query_by_port_sensor_dimension(
         endpoint = ('/select/device/{0}/port/{1}/sensor/{2}/dimension/{3}'
                     '/last'.format(edge_id, port, sensor, dimension_code))
 
+    if portia_config.get('history') is not None and last == False:
+        return history.query_cached(
+            portia_config,
+            lambda portia_config, params: query_by_port_sensor_dimension(
+                portia_config,
+                edge_id,
+                port,
+                sensor,
+                dimension_code,
+                last,
+                params
+            ),
+            endpoint,
+            params
+        )
+
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.SELECT_SCHEMA
+    )
@@ -0,0 +1,182 @@
+"""Request coalescing, so identical concurrent queries share a single call to
+the service and a single parse of its response.
+"""
+
+import copy
+import threading
+
+import portiapy.lazy as lazy
+from portiapy.cache import ResponseCache
+
+
+pd = lazy.load('pandas')
+
+
+class _Call(object):
+    """Call in flight, whose outcome is awaited by every caller sharing it.
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+        self.copies = []
+
+
+class SingleFlight(object):
+    """Runs a function once per key among concurrent callers; callers
+    arriving while it runs wait for it and get the same outcome.
+
+    Set it as portia_config['singleflight'] to coalesce the GET requests made
+    with that configuration, e.g. by many dashboard users opening the same
+    device at once.
+    """
+    def __init__(self, remember: bool=False):
+        """SingleFlight's constructor.
+
+        Keyword Arguments:
+            remember {bool} -- if outcomes are kept once calls finish, instead
+                               of only being shared while in flight
+                               (default: {False})
+        """
+        self.remember = remember
+        self.shared = 0
+
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(
+        portia_config: dict,
+        method: str,
+        endpoint: str,
+        params: dict,
+        accept: str
+    ) -> tuple:
+        """Builds the key of a request.
+
+        Arguments:
+            portia_config {dict} -- Portia's configuration arguments
+            method {str} -- HTTP method
+            endpoint {str} -- endpoint of the request
+            params {dict} -- params sent to the service
+            accept {str} -- Accept header of the request
+
+        Returns:
+            tuple -- hashable key
+        """
+        return (method,) + ResponseCache.key(
+            portia_config, endpoint, params, accept
+        )
+
+    def do(
+        self, key: object, function: callable, copy: callable=None
+    ) -> object:
+        """Runs a function, unless a call with the same key is in flight, in
+        which case its outcome is awaited instead.
+
+        When a copy function is given, the caller that ran the function gets
+        its result itself, and every caller that awaited it gets a copy, made
+        before the result is handed out. Outcomes of calls that are copied
+        aren't remembered, as nobody could tell the result was left intact.
+
+        Arguments:
+            key {object} -- hashable key of the call
+            function {callable} -- function to be called
+
+        Keyword Arguments:
+            copy {callable} -- function copying the result for each caller
+                               that awaited it (default: {None})
+
+        Returns:
+            object -- the function's result
+
+        Raises:
+            Exception -- the function's error
+        """
+        remember = self.remember and copy is None
+
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+                call.followers += 1
+
+        if leader:
+            try:
+                call.result = function()
+            except Exception as err:
+                call.error = err
+            finally:
+                if not remember or call.error is not None:
+                    with self._lock:
+                        del self._calls[key]
+
+                # nobody joins the call anymore, so its followers are known
+                if copy is not None and call.error is None:
+                    call.copies = [
+                        copy(call.result) for _ in range(call.followers)
+                    ]
+
+                call.done.set()
+
+            if call.error is not None:
+                raise call.error
+
+            return call.result
+
+        call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+
+        if copy is not None:
+            with self._lock:
+                return call.copies.pop()
+
+        return call.result
+
+
+def share(result: object) -> object:
+    """Copies a shared result, so a caller changing its own copy, even in
+    place, doesn't change anyone else's. Data frames, lists and
+    dictionaries are copied deeply.
+
+    Arguments:
+        result {object} -- shared result
+
+    Returns:
+        object -- caller's copy
+    """
+    if lazy.loaded(pd) and isinstance(result, pd.DataFrame):
+        return result.copy(deep=True)
+
+    if isinstance(result, (list, dict)):
+        return copy.deepcopy(result)
+
+    return result
+
+def convert_once(response: object, key: object, function: callable) -> object:
+    """Converts a response once per key among the callers sharing it that
+    convert it concurrently. The caller converting it gets the result, and
+    each of the others its own copy, so a burst of callers holds one frame
+    each, and a caller converting it later converts it again.
+
+    Arguments:
+        response {object} -- HTTP response object
+        key {object} -- hashable key of the conversion
+        function {callable} -- function converting the response
+
+    Returns:
+        object -- converted response
+    """
+    results = getattr(response, 'portia_results', None)
+
+    if results is None:
+        return function()
+
+    return results.do(key, function, share)
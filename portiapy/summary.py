@@ -4,7 +4,36 @@ dimensions.
 
 from enum import Enum
 
+import portiapy.lazy as lazy
 import portiapy.utils as utils
+import portiapy.history as history
+
+
+np = lazy.load('numpy')
+pd = lazy.load('pandas')
+
+
+SERIES_COLUMNS = [
+    'port',
+    'sensor',
+    'dimension_code',
+    'dimension_unity_code',
+    'dimension_thing_code'
+]
+
+STATISTICS = ['avg', 'min', 'max', 'sum', 'median', 'mode', 'stddev', 'spread']
+
+DEFAULT_STATISTICS = ('avg', 'min', 'max')
+
+AGGREGATIONS = {
+    'number_of_packages': 'count',
+    'avg': 'mean',
+    'min': 'min',
+    'max': 'max',
+    'sum': 'sum',
+    'median': 'median',
+    'stddev': 'std'
+}
 
 
 class SummaryStrategies(Enum):
@@ -18,6 +47,13 @@ class SummaryStrategies(Enum):
     def endpoint(self):
         return self.name.lower().replace('_', '')
 
+    @property
+    def period(self):
+        if self.name in ('PER_MONTH', 'PER_YEAR'):
+            return None
+
+        return pd.Timedelta(1, unit=self.name[4].lower().replace('m', 'min'))
+
 
 def query_by_dimension(
     portia_config: dict,
@@ -82,10 +118,13 @@ def query_by_dimension(
         endpoint,
         { 'devices': devices },
         params=params,
-        optional_headers=header
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.SUMMARY_SCHEMA
+    )
 
 
 def query_device_by_dimension(
@@ -153,10 +192,13 @@ def query_device_by_dimension(
         endpoint,
         { 'series': series },
         params=params,
-        optional_headers=header
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.SUMMARY_SCHEMA
+    )
 
 
 def query_by_port_sensor(
@@ -219,11 +261,35 @@ def query_by_port_sensor(
     endpoint = '/summary/device/{0}/port/{1}/sensor/{2}/{3}/{4}' \
                .format(edge_id, port, sensor, strategy.endpoint, interval)
 
+    if portia_config.get('history') is not None and \
+       strategy.period is not None:
+        return history.query_cached(
+            portia_config,
+            lambda portia_config, params: query_by_port_sensor(
+                portia_config,
+                edge_id,
+                port,
+                sensor,
+                strategy,
+                interval,
+                params
+            ),
+            endpoint,
+            params,
+            strategy.period * interval
+        )
+
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
     )
 
-    return utils.convert(accept_header, portia_config, response)
+    return utils.convert(
+        accept_header, portia_config, response, utils.SUMMARY_SCHEMA
+    )
 
 
 def query_by_port_sensor_dimension(
@@ -295,8 +361,293 @@ def query_by_port_sensor_dimension(
                     interval
                 ))
 
+    if portia_config.get('history') is not None and \
+       strategy.period is not None:
+        return history.query_cached(
+            portia_config,
+            lambda portia_config, params: query_by_port_sensor_dimension(
+                portia_config,
+                edge_id,
+                port,
+                sensor,
+                dimension_code,
+                strategy,
+                interval,
+                params
+            ),
+            endpoint,
+            params,
+            strategy.period * interval
+        )
+
     response = utils.http_get_request(
-        portia_config, endpoint, params=params, optional_headers=header
+        portia_config,
+        endpoint,
+        params=params,
+        optional_headers=header,
+        stream=True
+    )
+
+    return utils.convert(
+        accept_header, portia_config, response, utils.SUMMARY_SCHEMA
     )
 
-    return utils.convert(accept_header, portia_config, response)
+
+def bucket_starts(
+    times: 'pd.Series', strategy: SummaryStrategies, interval: int
+) -> 'pd.Series':
+    """Floors wall clock times to the start of their summarized intervals.
+
+    Arguments:
+        times {pd.Series} -- naive local times
+        strategy {SummaryStrategies} -- strategy to summarize with
+        interval {int} -- number of periods of each interval
+
+    Returns:
+        pd.Series -- naive local start of each time's interval
+    """
+    if strategy.period is not None:
+        return times.dt.floor(strategy.period * interval)
+
+    step = interval if strategy is SummaryStrategies.PER_MONTH \
+           else interval * 12
+    months = (times.dt.year * 12 + times.dt.month - 1) // step * step
+
+    return pd.to_datetime(pd.DataFrame({
+        'year': months // 12, 'month': months % 12 + 1, 'day': 1
+    }))
+
+def bucket_range(
+    start: 'pd.Timestamp',
+    end: 'pd.Timestamp',
+    strategy: SummaryStrategies,
+    interval: int
+) -> 'pd.DatetimeIndex':
+    """Lists the starts of every summarized interval between two others.
+
+    Arguments:
+        start {pd.Timestamp} -- naive local start of the first interval
+        end {pd.Timestamp} -- naive local start of the last interval
+        strategy {SummaryStrategies} -- strategy to summarize with
+        interval {int} -- number of periods of each interval
+
+    Returns:
+        pd.DatetimeIndex -- naive local start of each interval
+    """
+    if strategy.period is not None:
+        frequency = strategy.period * interval
+    elif strategy is SummaryStrategies.PER_MONTH:
+        frequency = '{0}MS'.format(interval)
+    else:
+        frequency = '{0}MS'.format(interval * 12)
+
+    return pd.date_range(start, end, freq=frequency)
+
+def fill_buckets(
+    summarized: 'pd.DataFrame',
+    statistics: list,
+    buckets: 'pd.DatetimeIndex',
+    fill: object
+) -> 'pd.DataFrame':
+    """Adds the intervals without packages to a summary, filling their
+    statistics as the service's 'fill' param does.
+
+    Arguments:
+        summarized {pd.DataFrame} -- summary indexed by series and interval
+        statistics {list} -- summarized statistics
+        buckets {pd.DatetimeIndex} -- every interval of the window
+        fill {object} -- 'null', 'previous', 'linear' or a number
+
+    Returns:
+        pd.DataFrame -- summary with every interval of every series
+
+    Raises:
+        ValueError -- when the fill isn't valid
+    """
+    names = list(summarized.index.names)
+    keys = names[:-1]
+
+    if len(keys) > 0:
+        series = summarized.index.droplevel(-1).unique().to_frame(index=False)
+        index = pd.MultiIndex.from_frame(series.merge(
+            pd.DataFrame({names[-1]: buckets}), how='cross'
+        ))
+    else:
+        index = pd.Index(buckets, name=names[-1])
+
+    summarized = summarized.reindex(index)
+    summarized['number_of_packages'] = \
+        summarized['number_of_packages'].fillna(0).astype('int64')
+
+    if fill == 'null':
+        return summarized
+
+    grouped = summarized[statistics].groupby(level=keys) if len(keys) > 0 \
+              else summarized[statistics]
+
+    if fill == 'previous':
+        summarized[statistics] = grouped.ffill()
+    elif fill == 'linear':
+        if len(keys) > 0:
+            summarized[statistics] = grouped.transform(
+                lambda column: column.interpolate(limit_area='inside')
+            )
+        else:
+            summarized[statistics] = grouped.interpolate(limit_area='inside')
+    else:
+        try:
+            value = float(fill)
+        except (TypeError, ValueError):
+            raise ValueError('unknown fill: {0}'.format(fill))
+
+        summarized[statistics] = summarized[statistics].fillna(value)
+
+    return summarized
+
+def summarize(
+    dataframe: 'pd.DataFrame',
+    strategy: SummaryStrategies=SummaryStrategies.PER_HOUR,
+    interval: int=1,
+    params: dict=None
+) -> 'pd.DataFrame':
+    """Summarizes a raw series locally, as the summary endpoints would, so
+    several summaries can be derived from a single select.
+
+    Intervals are aligned to the wall clock of the params' timezone, and
+    the columns match the service's: the series' codes, 'number_of_packages'
+    and each statistic enabled in the params.
+
+    Arguments:
+        dataframe {pd.DataFrame} -- series returned by a select
+
+    Keyword Arguments:
+        strategy {SummaryStrategies} -- strategy to summarize with
+                                        (default: {SummaryStrategies.PER_HOUR})
+        interval {int} -- number of periods of each interval (default: {1})
+        params {dict} -- summary params: 'from', 'to', 'lower_bound',
+                         'upper_bound', 'fill', 'order', 'limit', the
+                         statistics, 'last_timestamp', 'precision' and
+                         'timezone' (default: {None})
+
+    Returns:
+        pd.DataFrame -- summarized series
+
+    Raises:
+        ValueError -- when the data frame has no values, or the params ask
+                      for an offset, which isn't supported locally
+    """
+    # imported here, as fanout depends on this module
+    import portiapy.chunking as chunking
+
+    params = params or {}
+    precision = params.get('precision') or 'ms'
+    unit = chunking.PRECISION_UNITS.get(precision, 'ms')
+    timezone = params.get('timezone') or 'Etc/UTC'
+
+    if params.get('offset'):
+        raise ValueError('offsets can\'t be summarized locally')
+
+    if 'dimension_value' not in dataframe.columns:
+        raise ValueError('only series with dimension values can be summarized')
+
+    statistics = [
+        statistic for statistic in STATISTICS
+        if params.get(statistic, statistic in DEFAULT_STATISTICS)
+    ]
+    keys = [column for column in SERIES_COLUMNS if column in dataframe.columns]
+
+    timestamps = dataframe['header_timestamp']
+    values = dataframe['dimension_value']
+    mask = values.notna()
+
+    if params.get('from') is not None:
+        mask &= timestamps >= chunking.from_timestamp(
+            chunking.to_timestamp(params['from'], precision), 0, precision
+        )
+    if params.get('to') is not None:
+        mask &= timestamps <= chunking.from_timestamp(
+            chunking.to_timestamp(params['to'], precision), 0, precision
+        )
+    if params.get('lower_bound') is not None:
+        mask &= values >= float(params['lower_bound'])
+    if params.get('upper_bound') is not None:
+        mask &= values <= float(params['upper_bound'])
+
+    data = dataframe.loc[mask, keys + ['header_timestamp', 'dimension_value']]
+    data = data.assign(bucket=bucket_starts(
+        pd.to_datetime(data['header_timestamp'], unit=unit, utc=True) \
+          .dt.tz_convert(timezone).dt.tz_localize(None),
+        strategy,
+        interval
+    ))
+
+    grouped = data.groupby(keys + ['bucket'], sort=True)
+    values = grouped['dimension_value']
+
+    summarized = values.agg(**{
+        name: AGGREGATIONS[name] for name in
+        ['number_of_packages'] + statistics if name in AGGREGATIONS
+    })
+
+    if 'spread' in statistics:
+        summarized['spread'] = values.max() - values.min()
+
+    if 'mode' in statistics:
+        counts = data.groupby(
+            keys + ['bucket', 'dimension_value'], sort=False
+        ).size().rename('count').reset_index()
+
+        # the most frequent value, the smallest one on ties
+        summarized['mode'] = counts.sort_values(
+            ['count', 'dimension_value'],
+            ascending=[False, True],
+            kind='stable'
+        ).drop_duplicates(keys + ['bucket']) \
+         .set_index(keys + ['bucket'])['dimension_value']
+
+    if params.get('last_timestamp'):
+        summarized['last_timestamp'] = grouped['header_timestamp'].max()
+
+    fill = params.get('fill')
+
+    if fill not in (None, 'none') and len(summarized.index) > 0:
+        buckets = summarized.index.get_level_values('bucket')
+        start, end = buckets.min(), buckets.max()
+
+        for param, edge in (('from', 'start'), ('to', 'end')):
+            if params.get(param) is not None:
+                bound = bucket_starts(pd.Series([
+                    chunking.to_timestamp(params[param], precision) \
+                            .tz_convert(timezone).tz_localize(None)
+                ]), strategy, interval)[0]
+
+                if edge == 'start':
+                    start = bound
+                else:
+                    end = bound
+
+        summarized = fill_buckets(
+            summarized,
+            statistics,
+            bucket_range(start, end, strategy, interval),
+            fill
+        )
+
+    # index levels are widened to 64 bits, so codes get their dtypes back
+    summarized = summarized.reset_index().astype({
+        key: dataframe[key].dtype for key in keys
+    })
+    starts = summarized.pop('bucket').dt.tz_localize(
+        timezone,
+        ambiguous=np.ones(len(summarized.index), dtype=bool),
+        nonexistent='shift_forward'
+    )
+    summarized['header_timestamp'] = \
+        (starts - pd.Timestamp(0, tz='UTC')) // pd.Timedelta(1, unit=unit)
+
+    columns = ['header_timestamp'] + keys + ['number_of_packages'] + statistics
+
+    if params.get('last_timestamp'):
+        columns.append('last_timestamp')
+
+    return chunking.stitch([summarized[columns]], params)
@@ -0,0 +1,586 @@
+"""HTTP transport used by all modules to reach Portia's REST API.
+"""
+
+import time
+import asyncio
+import weakref
+import threading
+from email.utils import parsedate_to_datetime
+
+import requests
+import tenacity
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+
+def accept_encodings() -> list:
+    """Lists the content encodings responses can be decompressed from while
+    they're streamed: gzip and deflate always, br when brotli is installed
+    and zstd when zstandard is installed along with urllib3 2 or later.
+
+    Returns:
+        list -- supported content encodings, by order of preference
+    """
+    encodings = ['gzip', 'deflate']
+
+    for encoding in ('br', 'zstd'):
+        if encoding in HTTPResponse.CONTENT_DECODERS:
+            encodings.insert(0, encoding)
+
+    return encodings
+
+
+class RetryPolicy(object):
+    """Retries failed requests with capped exponential backoff and full
+    jitter, honoring the service's Retry-After header, within an optional
+    deadline.
+
+    Only idempotent methods are retried by default; POSTs, which Portia also
+    uses for read-only summaries, can be opted in through methods.
+    """
+    def __init__(
+        self,
+        attempts: int=5,
+        backoff: float=0.5,
+        max_backoff: float=30.0,
+        deadline: float=None,
+        statuses: tuple=(429, 502, 503, 504),
+        methods: tuple=('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'),
+        sleep: callable=time.sleep,
+        clock: callable=time.monotonic
+    ):
+        """RetryPolicy's constructor.
+
+        Keyword Arguments:
+            attempts {int} -- maximum number of attempts, the first included
+                              (default: {5})
+            backoff {float} -- base of the exponential backoff, in seconds
+                               (default: {0.5})
+            max_backoff {float} -- maximum backoff between attempts, in
+                                   seconds (default: {30.0})
+            deadline {float} -- seconds all attempts of a call may take,
+                                each attempt's timeout included, or None for
+                                no deadline, where requests wait for the
+                                service as long as it takes (default: {None})
+            statuses {tuple} -- response statuses that are retried
+                                (default: {(429, 502, 503, 504)})
+            methods {tuple} -- HTTP methods that are retried
+                               (default: {('GET', 'HEAD', 'OPTIONS', 'PUT',
+                               'DELETE')})
+            sleep {callable} -- function sleeping for some seconds
+                                (default: {time.sleep})
+            clock {callable} -- function returning the current time in seconds
+                                (default: {time.monotonic})
+        """
+        self.attempts = attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.statuses = tuple(statuses)
+        self.methods = tuple(method.upper() for method in methods)
+        self.sleep = sleep
+        self.clock = clock
+
+    @staticmethod
+    def retry_after(response: object) -> float:
+        """Parses a response's Retry-After header, given either in seconds or
+        as an HTTP date.
+
+        Arguments:
+            response {object} -- response object
+
+        Returns:
+            float -- seconds to wait, or None when missing or invalid
+        """
+        value = getattr(response, 'headers', {}).get('Retry-After')
+
+        if value is None:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            date = parsedate_to_datetime(value)
+            return max(0.0, date.timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def remaining(self, started_at: float) -> float:
+        """Retrieves the time left before a call's deadline.
+
+        Arguments:
+            started_at {float} -- clock time of the call's first attempt
+
+        Returns:
+            float -- seconds left, or None when there's no deadline
+        """
+        if self.deadline is None:
+            return None
+
+        return max(0.0, self.deadline - (self.clock() - started_at))
+
+    def retrying_arguments(
+        self, method: str, errors: tuple, started_at: float
+    ) -> dict:
+        """Builds the arguments of tenacity's retrying controllers for a
+        call.
+
+        Arguments:
+            method {str} -- HTTP method of the call
+            errors {tuple} -- transport errors that are retried
+            started_at {float} -- clock time of the call's first attempt
+
+        Returns:
+            dict -- keyword arguments of tenacity.Retrying
+        """
+        jitter = tenacity.wait_random_exponential(
+            multiplier=self.backoff, max=self.max_backoff
+        )
+
+        def wait(retry_state):
+            seconds = None
+
+            if not retry_state.outcome.failed:
+                seconds = self.retry_after(retry_state.outcome.result())
+
+            if seconds is None:
+                seconds = jitter(retry_state)
+
+            remaining = self.remaining(started_at)
+
+            if remaining is not None:
+                seconds = min(seconds, remaining)
+
+            return seconds
+
+        def stop(retry_state):
+            return (
+                retry_state.attempt_number >= self.attempts
+                or self.remaining(started_at) == 0.0
+            )
+
+        def before_sleep(retry_state):
+            if not retry_state.outcome.failed:
+                retry_state.outcome.result().close()
+
+        if method.upper() in self.methods:
+            retry = tenacity.retry_if_exception_type(errors) | \
+                    tenacity.retry_if_result(
+                        lambda response: response.status_code in self.statuses
+                    )
+        else:
+            retry = tenacity.retry_never
+
+        return {
+            'sleep': self.sleep,
+            'stop': stop,
+            'wait': wait,
+            'retry': retry,
+            'before_sleep': before_sleep,
+            'reraise': True,
+            'retry_error_callback': lambda retry_state: \
+                retry_state.outcome.result()
+        }
+
+    def call(
+        self, method: str, send: callable, errors: tuple=()
+    ) -> object:
+        """Sends a request, retrying it according to the policy. Once
+        attempts run out, the last response is returned, or the last error
+        raised.
+
+        Arguments:
+            method {str} -- HTTP method of the call
+            send {callable} -- function sending an attempt, receiving its
+                               timeout
+
+        Keyword Arguments:
+            errors {tuple} -- transport errors that are retried
+                              (default: {()})
+
+        Returns:
+            object -- response object, whose portia_attempts tells how many
+                      attempts it took
+        """
+        started_at = self.clock()
+        arguments = self.retrying_arguments(method, errors, started_at)
+        retrying = tenacity.Retrying(**arguments)
+
+        response = retrying(lambda: send(self.remaining(started_at)))
+        response.portia_attempts = retrying.statistics.get('attempt_number', 1)
+
+        return response
+
+    async def acall(
+        self, method: str, send: callable, errors: tuple=()
+    ) -> object:
+        """Sends a request asynchronously, retrying it according to the
+        policy.
+
+        Arguments:
+            method {str} -- HTTP method of the call
+            send {callable} -- coroutine function sending an attempt,
+                               receiving its timeout
+
+        Keyword Arguments:
+            errors {tuple} -- transport errors that are retried
+                              (default: {()})
+
+        Returns:
+            object -- response object, whose portia_attempts tells how many
+                      attempts it took
+        """
+        started_at = self.clock()
+        arguments = self.retrying_arguments(method, errors, started_at)
+
+        # httpx responses are read in full, so there is nothing to release
+        arguments['sleep'] = asyncio.sleep
+        arguments['before_sleep'] = None
+
+        async def attempt():
+            return await send(self.remaining(started_at))
+
+        retrying = tenacity.AsyncRetrying(**arguments)
+
+        response = await retrying(attempt)
+        response.portia_attempts = retrying.statistics.get('attempt_number', 1)
+
+        return response
+
+
+def hold_slot(response: object, limiter: object, slot: object):
+    """Keeps a streamed response's in-flight slot until the response is
+    closed, or collected when it never is, so the limiter's cap bounds open
+    sockets and parsers rather than headers in flight.
+
+    Arguments:
+        response {object} -- streamed response object
+        limiter {RateLimiter} -- limiter the slot was taken from
+        slot {object} -- slot returned by the limiter's acquire
+    """
+    release = weakref.finalize(response, limiter.release, slot)
+    close = response.close
+
+    def close_and_release():
+        try:
+            close()
+        finally:
+            release()
+
+    response.close = close_and_release
+
+
+class PortiaTransport(object):
+    """Pooled, keep-alive HTTP transport backed by a requests session.
+
+    A single transport may be shared by several PortiaApi instances and by
+    many threads, so TCP and TLS connections to Portia are reused instead of
+    being opened on every request.
+    """
+    def __init__(
+        self,
+        pool_connections: int=10,
+        pool_maxsize: int=10,
+        pool_block: bool=False,
+        keep_alive: bool=True,
+        retry: RetryPolicy=None,
+        compress: bool=True
+    ):
+        """PortiaTransport's constructor.
+
+        Keyword Arguments:
+            pool_connections {int} -- number of hosts to keep pools for
+                                      (default: {10})
+            pool_maxsize {int} -- maximum number of connections kept alive per
+                                  host (default: {10})
+            pool_block {bool} -- if requests should wait for a free connection
+                                 when the pool is exhausted (default: {False})
+            keep_alive {bool} -- if connections should be kept alive between
+                                 requests (default: {True})
+            retry {RetryPolicy} -- policy retrying failed requests, or None
+                                   for the default one; RetryPolicy(attempts=1)
+                                   disables retries (default: {None})
+            compress {bool} -- if compressed responses should be requested,
+                               in every supported encoding (default: {True})
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.retry = retry if retry is not None else RetryPolicy()
+
+        self.session = requests.Session()
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        if keep_alive == False:
+            self.session.headers['Connection'] = 'close'
+
+        if compress == True:
+            self.session.headers['Accept-Encoding'] = \
+                ', '.join(accept_encodings())
+        else:
+            self.session.headers['Accept-Encoding'] = 'identity'
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict=None,
+        params: dict=None,
+        payload: dict=None,
+        stream: bool=False,
+        limiter: object=None
+    ) -> object:
+        """Sends an HTTP request through the pooled session, retrying it
+        according to the transport's policy.
+
+        Arguments:
+            method {str} -- HTTP method
+            url {str} -- full URL to make the request to
+
+        Keyword Arguments:
+            headers {dict} -- request headers (default: {None})
+            params {dict} -- params to send to the service (default: {None})
+            payload {dict} -- JSON payload to send to the service
+                              (default: {None})
+            stream {bool} -- if the body should be read lazily
+                             (default: {False})
+            limiter {RateLimiter} -- limiter acquired by every attempt
+                                     (default: {None})
+
+        Returns:
+            object -- response object, whose portia_queued tells how many
+                      seconds its attempts waited for the limiter
+        """
+        queued = 0.0
+
+        def send(timeout):
+            nonlocal queued
+
+            if limiter is not None:
+                queued_at = time.time()
+                slot = limiter.acquire()
+                queued += time.time() - queued_at
+
+            try:
+                response = self.session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=payload,
+                    stream=stream,
+                    timeout=timeout
+                )
+            except BaseException:
+                if limiter is not None:
+                    limiter.release(slot)
+                raise
+
+            if limiter is not None:
+                if stream == True:
+                    hold_slot(response, limiter, slot)
+                else:
+                    limiter.release(slot)
+
+            return response
+
+        response = self.retry.call(
+            method, send, (requests.ConnectionError, requests.Timeout)
+        )
+        response.portia_queued = queued
+
+        return response
+
+    def close(self):
+        """Closes every pooled connection.
+        """
+        self.session.close()
+
+    def __enter__(self) -> 'PortiaTransport':
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+_default_transport = None
+_default_transport_lock = threading.Lock()
+
+
+def default_transport() -> PortiaTransport:
+    """Retrieves the process-wide transport, creating it on first use.
+
+    Returns:
+        PortiaTransport -- shared transport instance
+    """
+    global _default_transport
+
+    if _default_transport is None:
+        with _default_transport_lock:
+            if _default_transport is None:
+                _default_transport = PortiaTransport()
+
+    return _default_transport
+
+def get_transport(portia_config: dict) -> PortiaTransport:
+    """Retrieves the transport configured for a Portia configuration.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+
+    Returns:
+        PortiaTransport -- the configuration's transport, or the shared one
+                           when none is set
+    """
+    transport = portia_config.get('transport')
+
+    if transport is None:
+        transport = default_transport()
+
+    return transport
+
+
+class AsyncPortiaTransport(object):
+    """Pooled, keep-alive asynchronous HTTP transport backed by an httpx
+    client.
+
+    It requires the optional httpx dependency, installable with
+    `pip install portiapy[async]`.
+    """
+    def __init__(
+        self,
+        max_connections: int=100,
+        max_keepalive_connections: int=20,
+        keepalive_expiry: float=5.0,
+        timeout: float=None,
+        retry: RetryPolicy=None
+    ):
+        """AsyncPortiaTransport's constructor.
+
+        Keyword Arguments:
+            max_connections {int} -- maximum number of concurrent connections
+                                     (default: {100})
+            max_keepalive_connections {int} -- maximum number of idle
+                                               connections kept alive
+                                               (default: {20})
+            keepalive_expiry {float} -- seconds an idle connection is kept
+                                        alive (default: {5.0})
+            timeout {float} -- seconds to wait for the service, or None to wait
+                               forever (default: {None})
+            retry {RetryPolicy} -- policy retrying failed requests, or None
+                                   for the default one (default: {None})
+
+        Raises:
+            ImportError -- when httpx is not installed
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError(
+                'AsyncPortiaTransport requires httpx, install it with '
+                '`pip install portiapy[async]`'
+            )
+
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry
+            ),
+            timeout=timeout
+        )
+        self.timeout = timeout
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.errors = (httpx.TransportError,)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: dict=None,
+        params: dict=None,
+        payload: dict=None,
+        limiter: object=None
+    ) -> object:
+        """Sends an HTTP request through the pooled client, retrying it
+        according to the transport's policy.
+
+        Params are encoded the same way requests does, dropping empty values,
+        so both transports hit the exact same URLs.
+
+        Arguments:
+            method {str} -- HTTP method
+            url {str} -- full URL to make the request to
+
+        Keyword Arguments:
+            headers {dict} -- request headers (default: {None})
+            params {dict} -- params to send to the service (default: {None})
+            payload {dict} -- JSON payload to send to the service
+                              (default: {None})
+            limiter {RateLimiter} -- limiter acquired by every attempt
+                                     (default: {None})
+
+        Returns:
+            object -- response object, whose portia_queued tells how many
+                      seconds its attempts waited for the limiter
+        """
+        queued = 0.0
+
+        if params is not None:
+            params = {
+                key: value if isinstance(value, (list, tuple)) else str(value)
+                for key, value in params.items() if value is not None
+            }
+
+        async def send(remaining):
+            nonlocal queued
+            timeout = self.timeout
+
+            if remaining is not None:
+                timeout = min(timeout or remaining, remaining)
+
+            if limiter is not None:
+                queued_at = time.time()
+                slot = await limiter.acquire_async()
+                queued += time.time() - queued_at
+
+            # httpx responses are read in full, so the slot is freed here
+            try:
+                return await self.client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    params=params,
+                    json=payload,
+                    timeout=timeout
+                )
+            finally:
+                if limiter is not None:
+                    limiter.release(slot)
+
+        response = await self.retry.acall(method, send, self.errors)
+        response.portia_queued = queued
+
+        return response
+
+    async def aclose(self):
+        """Closes every pooled connection.
+        """
+        await self.client.aclose()
+
+    async def __aenter__(self) -> 'AsyncPortiaTransport':
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
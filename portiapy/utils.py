@@ -3,14 +3,37 @@
 
 import json
 import time
-from io import StringIO
+import weakref
+import functools
+from io import BytesIO
+
+import importlib
 
-import arrow
 import requests
-import pandas as pd
-from dateutil import tz
-import plotly.offline as plotly
-import plotly.graph_objs as plotlygo
+from urllib3.response import HTTPResponse
+
+import portiapy.lazy as lazy
+import portiapy.metrics as metrics
+import portiapy.singleflight as singleflight
+from portiapy.transport import get_transport
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+np = lazy.load('numpy')
+pd = lazy.load('pandas')
+
+# helpers moved to their own modules, so their dependencies load on first use
+MOVED = {
+    'plot_selection_from_dataframes': 'portiapy.plotting',
+    'plot_summary_from_dataframes': 'portiapy.plotting',
+    'map_device_port_to_dropdown_widget': 'portiapy.widgets',
+    'map_device_port_sensors_to_dropdown_widget': 'portiapy.widgets',
+    'map_device_port_sensor_dimensions_to_dropdown_widget': 'portiapy.widgets'
+}
 
 
 THING_CODES = {
@@ -318,6 +341,40 @@ UNITY_CODES = {
 }
 
 
+CODES_SCHEMA = {
+    'header_timestamp': 'int64',
+    'port': 'int16',
+    'sensor': 'int16',
+    'dimension_code': 'int32',
+    'dimension_unity_code': 'int16',
+    'dimension_thing_code': 'int16'
+}
+
+SELECT_SCHEMA = {
+    **CODES_SCHEMA,
+    'dimension_value': 'float64'
+}
+
+EVENTS_SCHEMA = {
+    **CODES_SCHEMA,
+    'event_code': 'int32'
+}
+
+SUMMARY_SCHEMA = {
+    **CODES_SCHEMA,
+    'avg': 'float64',
+    'min': 'float64',
+    'max': 'float64',
+    'sum': 'float64',
+    'median': 'float64',
+    'mode': 'float64',
+    'stddev': 'float64',
+    'spread': 'float64'
+}
+
+DESCRIBE_SCHEMA = CODES_SCHEMA
+
+
 def humanize_thing_code(thing_code: int) -> str:
     """Translates a thing code into a humanized version of it.
     
@@ -418,6 +475,90 @@ def humanize_unity_code(
     else:
         return translated_unity_code
 
+@functools.lru_cache(maxsize=None)
+def code_table(kind: str, locale: str='en-us') -> 'np.ndarray':
+    """Builds the lookup table of a kind of code in a locale, once.
+
+    Arguments:
+        kind {str} -- 'thing', 'dimension', 'event' or 'unity'
+
+    Keyword Arguments:
+        locale {str} -- which language to use when humanizing, ignored by
+                        thing codes (default: {'en-us'})
+
+    Returns:
+        np.ndarray -- humanized codes at their code's position, or None when
+                      the locale is unknown
+    """
+    if kind == 'thing':
+        return custom_code_table(THING_CODES)
+
+    return custom_code_table({
+        'dimension': DIMENSION_CODES,
+        'event': EVENT_CODES,
+        'unity': UNITY_CODES
+    }[kind].get(locale))
+
+def custom_code_table(codes: dict) -> 'np.ndarray':
+    """Builds the lookup table of a dictionary of codes.
+
+    Arguments:
+        codes {dict} -- humanized codes keyed by code, or None
+
+    Returns:
+        np.ndarray -- humanized codes at their code's position, None where
+                      a code has no translation, or None
+    """
+    if codes is None:
+        return None
+
+    table = np.full(max(codes, default=-1) + 1, None, dtype=object)
+    table[list(codes)] = list(codes.values())
+
+    return table
+
+def humanize_codes(
+    series: 'pd.Series', table: 'np.ndarray', fallback: str, fill: bool=False
+) -> 'pd.Categorical':
+    """Humanizes a column of codes with a lookup table, looking up all unique
+    codes at once and broadcasting the translations.
+
+    Arguments:
+        series {pd.Series} -- column of codes
+        table {np.ndarray} -- lookup table built by code_table, or None
+        fallback {str} -- format of the codes' labels when there's no table,
+                          such as 'Dimension Code {}'
+
+    Keyword Arguments:
+        fill {bool} -- if codes missing from the table should get the
+                       fallback label too (default: {False})
+
+    Returns:
+        pd.Categorical -- humanized column, missing where a code has no
+                          translation
+    """
+    codes, uniques = pd.factorize(series)
+    uniques = np.asarray(uniques, dtype='int64')
+
+    if table is None:
+        labels = np.array([fallback.format(code) for code in uniques], object)
+    else:
+        known = (uniques >= 0) & (uniques < len(table))
+        labels = np.full(len(uniques), None, dtype=object)
+        labels[known] = table[uniques[known]]
+
+        if fill == True:
+            for position in np.flatnonzero(pd.isna(labels)):
+                labels[position] = fallback.format(uniques[position])
+
+    labels = pd.Index(labels, dtype=object)
+    categories = labels.dropna().unique()
+
+    return pd.Categorical.from_codes(
+        np.where(codes < 0, -1, categories.get_indexer(labels)[codes]),
+        categories
+    )
+
 def humanize_dataframe(
     dataframe: 'pd.DataFrame',
     locale: str='en-us',
@@ -426,7 +567,7 @@ def humanize_dataframe(
     custom_unity: list=None
 ) -> 'pd.DataFrame':
     """Humanizes a data frame's dimensions by translating its columns data to
-    actual text.
+    actual text, added as categorical columns.
 
     Arguments:
         dataframe {pd.DataFrame} -- data frame to be humanized
@@ -442,38 +583,44 @@ def humanize_dataframe(
     Returns:
         pd.DataFrame -- humanized data frame
     """
-    if 'dimension_thing_code' in dataframe.columns:
-        dataframe['dimension_thing'] = dataframe['dimension_thing_code'].map(
-            lambda thing_code: humanize_thing_code(int(thing_code))
-        )
+    def table(kind, custom):
+        if custom is None:
+            return code_table(kind, locale)
 
+        return custom_code_table(custom.get(locale))
 
-    if 'dimension_unity_code' in dataframe.columns:
-        dataframe['dimension_unity'] = dataframe['dimension_unity_code'].map(
-            lambda unity_code: humanize_unity_code(
-                unity_code=int(unity_code),
-                locale=locale,
-                custom=custom_unity
+    # adding columns to a slice is intended, so pandas needn't warn about it
+    with metrics.measure(None, 'humanize', rows=len(dataframe.index)), \
+         pd.option_context('mode.chained_assignment', None):
+
+        if 'dimension_thing_code' in dataframe.columns:
+            dataframe['dimension_thing'] = humanize_codes(
+                dataframe['dimension_thing_code'],
+                code_table('thing'),
+                'Thing Code {}',
+                fill=True
             )
-        )
 
-    if 'dimension_code' in dataframe.columns:
-        dataframe['dimension'] = dataframe['dimension_code'].map(
-            lambda dimension_code: humanize_dimension_code(
-                dimension_code=int(dimension_code),
-                locale=locale,
-                custom=custom_dimension
+        if 'dimension_unity_code' in dataframe.columns:
+            dataframe['dimension_unity'] = humanize_codes(
+                dataframe['dimension_unity_code'],
+                table('unity', custom_unity),
+                'Unity Code {}'
             )
-        )
 
-    if 'event_code' in dataframe.columns:
-        dataframe['event'] = dataframe['event_code'].map(
-            lambda event_code: humanize_event_code(
-                event_code=int(event_code),
-                locale=locale,
-                custom=custom_event
+        if 'dimension_code' in dataframe.columns:
+            dataframe['dimension'] = humanize_codes(
+                dataframe['dimension_code'],
+                table('dimension', custom_dimension),
+                'Dimension Code {}'
+            )
+
+        if 'event_code' in dataframe.columns:
+            dataframe['event'] = humanize_codes(
+                dataframe['event_code'],
+                table('event', custom_event),
+                'Event Code {}'
             )
-        )
 
     return dataframe
 
@@ -527,13 +674,140 @@ def humanize_json(
     return json_
 
 
+def request_headers(
+    portia_config: dict, optional_headers: dict=None
+) -> dict:
+    """Builds the headers sent on every request to Portia.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+
+    Keyword Arguments:
+        optional_headers {dict} -- dictionary with other headers
+                                   (default: {None})
+
+    Returns:
+        dict -- request headers
+    """
+    headers = {
+        'Authorization': 'Bearer {0}' \
+        .format(portia_config.get('authorization'))
+    }
+
+    if optional_headers is not None:
+        headers = {**headers, **optional_headers}
+
+    return headers
+
+def _http_request(
+    method: str,
+    portia_config: dict,
+    endpoint: str,
+    payload: dict=None,
+    params: dict=None,
+    optional_headers: dict=None,
+    stream: bool=False
+) -> object:
+    """Makes an HTTP request through the configuration's transport, each of
+    whose attempts waits for the configuration's 'limiter', when set,
+    emitting a 'request' event to the configuration's metrics sinks.
+
+    Arguments:
+        method {str} -- HTTP method
+        portia_config {dict} -- Portia's configuration arguments
+        endpoint {str} -- endpoint to make the request to
+
+    Keyword Arguments:
+        payload {dict} -- payload to send to the service (default: {None})
+        params {dict} -- params to send to the service (default: {None})
+        optional_headers {dict} -- dictionary with other headers
+                                   (default: {None})
+        stream {bool} -- if the body should be read lazily from the socket
+                         (default: {False})
+
+    Returns:
+        object -- response object
+    """
+    labels = metrics.labels(endpoint)
+    url = '{0}{1}'.format(portia_config.get('baseurl'), endpoint)
+    options = {}
+
+    # only given when set, so transports predating limiters keep working
+    if portia_config.get('limiter') is not None:
+        options['limiter'] = portia_config['limiter']
+
+    start = time.time()
+
+    try:
+        response = get_transport(portia_config).request(
+            method,
+            url,
+            headers=request_headers(portia_config, optional_headers),
+            params=params,
+            payload=payload,
+            stream=stream,
+            **options
+        )
+        end = time.time()
+    except Exception as err:
+        metrics.emit(
+            portia_config,
+            'request',
+            method=method,
+            url=url,
+            endpoint=endpoint,
+            seconds=time.time() - start,
+            error=type(err).__name__,
+            **labels
+        )
+        raise
+
+    response.portia_labels = labels
+
+    metrics.emit(
+        portia_config,
+        'request',
+        method=method,
+        url=str(response.url),
+        endpoint=endpoint,
+        status=response.status_code,
+        seconds=end - start,
+        ttfb=time_to_first_byte(response),
+        queued=getattr(response, 'portia_queued', 0.0),
+        retries=getattr(response, 'portia_attempts', 1) - 1,
+        **labels
+    )
+
+    return response
+
+def time_to_first_byte(response: object) -> float:
+    """Retrieves how long a response took to arrive, from sending its request
+    to parsing its headers, which includes resolving and connecting when no
+    pooled connection was reused.
+
+    Arguments:
+        response {object} -- HTTP response object
+
+    Returns:
+        float -- seconds, or None when the response doesn't tell
+    """
+    # httpx only sets it once the body was read, so it's requests' alone
+    if not isinstance(response, requests.Response):
+        return None
+
+    return response.elapsed.total_seconds()
+
 def http_get_request(
     portia_config: dict,
     endpoint: str,
     params: dict=None,
-    optional_headers: dict=None
+    optional_headers: dict=None,
+    stream: bool=False
 ) -> object:
-    """Makes an HTTP GET request.
+    """Makes an HTTP GET request, served from the configuration's 'cache'
+    when it holds a fresh response for it. When the configuration has a
+    'singleflight' group, identical concurrent requests share one response,
+    which is then read in full instead of being streamed.
     
     Arguments:
         portia_config {dict} -- Portia's configuration arguments
@@ -543,32 +817,56 @@ def http_get_request(
         params {dict} -- params to send to the service (default: {None})
         optional_headers {dict} -- dictionary with other headers
                                    (default: {None})
+        stream {bool} -- if the body should be read lazily from the socket
+                         (default: {False})
 
     Returns:
         object -- response object
     """
-    headers = {
-        'Authorization': 'Bearer {0}' \
-        .format(portia_config.get('authorization'))
-    }
+    cache = portia_config.get('cache')
+    group = portia_config.get('singleflight')
+    accept = (optional_headers or {}).get('Accept')
+
+    def fetch(stream):
+        if group is None:
+            return _http_request(
+                'GET',
+                portia_config,
+                endpoint,
+                params=params,
+                optional_headers=optional_headers,
+                stream=stream
+            )
 
-    if optional_headers is not None:
-        headers = {**headers, **optional_headers}
+        def fetch_shared():
+            response = _http_request(
+                'GET',
+                portia_config,
+                endpoint,
+                params=params,
+                optional_headers=optional_headers
+            )
+            response.portia_results = singleflight.SingleFlight()
 
-    start = time.time()
-    response = requests.get(
-        '{0}{1}'.format(portia_config.get('baseurl'), endpoint),
-        headers=headers,
-        params=params
-    )
-    end = time.time()
+            return response
 
-    if portia_config.get('debug') == True:
-        print(
-            '[portia-debug]: status: {0} | {1:.4f} sec. | {2}' \
-            .format(response.status_code, end - start, response.url)
+        return group.do(
+            group.key(portia_config, 'GET', endpoint, params, accept),
+            fetch_shared
         )
 
+    if cache is None or stream == True or not cache.caches(endpoint):
+        return fetch(stream)
+
+    key = cache.key(portia_config, endpoint, params, accept)
+    response = cache.get(key)
+
+    if response is None:
+        response = fetch(False)
+
+        if response.status_code == 200:
+            cache.set(key, endpoint, response)
+
     return response
 
 def http_post_request(
@@ -576,7 +874,8 @@ def http_post_request(
     endpoint: str,
     payload: dict,
     params: dict=None,
-    optional_headers: dict=None
+    optional_headers: dict=None,
+    stream: bool=False
 ) -> object:
     """Makes an HTTP POST request.
     
@@ -589,34 +888,21 @@ def http_post_request(
         params {dict} -- params to send to the service (default: {None})
         optional_headers {dict} -- dictionary with other headers
                                    (default: {None})
+        stream {bool} -- if the body should be read lazily from the socket
+                         (default: {False})
 
     Returns:
         object -- response object
     """
-    headers = {
-        'Authorization': 'Bearer {0}' \
-        .format(portia_config.get('authorization'))
-    }
-
-    if optional_headers is not None:
-        headers = {**headers, **optional_headers}
-
-    start = time.time()
-    response = requests.post(
-        '{0}{1}'.format(portia_config.get('baseurl'), endpoint),
-        headers=headers,
+    return _http_request(
+        'POST',
+        portia_config,
+        endpoint,
+        payload=payload,
         params=params,
-        json=payload
+        optional_headers=optional_headers,
+        stream=stream
     )
-    end = time.time()
-
-    if portia_config.get('debug') == True:
-        print(
-            '[portia-debug]: status: {0} | {1:.4f} sec. | {2}' \
-            .format(response.status_code, end - start, response.url)
-        )
-
-    return response
 
 def http_put_request(
     portia_config: dict,
@@ -640,30 +926,14 @@ def http_put_request(
     Returns:
         object -- response object
     """
-    headers = {
-        'Authorization': 'Bearer {0}' \
-        .format(portia_config.get('authorization'))
-    }
-
-    if optional_headers is not None:
-        headers = {**headers, **optional_headers}
-
-    start = time.time()
-    response = requests.put(
-        '{0}{1}'.format(portia_config.get('baseurl'), endpoint),
-        headers=headers,
+    return _http_request(
+        'PUT',
+        portia_config,
+        endpoint,
+        payload=payload,
         params=params,
-        json=payload
+        optional_headers=optional_headers
     )
-    end = time.time()
-
-    if portia_config.get('debug') == True:
-        print(
-            '[portia-debug]: status: {0} | {1:.4f} sec. | {2}' \
-            .format(response.status_code, end - start, response.url)
-        )
-
-    return response
 
 def http_delete_request(
     portia_config: dict,
@@ -687,397 +957,607 @@ def http_delete_request(
     Returns:
         object -- response object
     """
-    headers = {
-        'Authorization': 'Bearer {0}' \
-        .format(portia_config.get('authorization'))
-    }
-
-    if optional_headers is not None:
-        headers = {**headers, **optional_headers}
-
-    start = time.time()
-    response = requests.delete(
-        '{0}{1}'.format(portia_config.get('baseurl'), endpoint),
-        headers=headers,
+    return _http_request(
+        'DELETE',
+        portia_config,
+        endpoint,
+        payload=payload,
         params=params,
-        json=payload
+        optional_headers=optional_headers
     )
-    end = time.time()
-
-    if portia_config.get('debug') == True:
-        print(
-            '[portia-debug]: status: {0} | {1:.4f} sec. | {2}' \
-            .format(response.status_code, end - start, response.url.encode('utf8'))
-        )
 
-    return response
 
+def is_streamed(response: object) -> bool:
+    """Checks if an HTTP response's body is still to be read from the socket,
+    as happens with responses requested with `stream=True`.
 
-def convert_csv(portia_config: dict, response: object) -> 'pd.DataFrame':
-    """Converts a CSV text file to a data frame.
-    
     Arguments:
-        portia_config {dict} -- Portia's configuration arguments 
         response {object} -- HTTP response object
-    
+
     Returns:
-        pd.DataFrame -- converted dataframe
-    
-    Raises:
-        Exception -- when the conversion goes wrong
+        bool -- if the body is streamed
     """
-    if response.status_code == 200:
+    # requests marks a body that wasn't read yet with `_content = False`
+    return getattr(response, '_content', None) is False
 
-        try:
+class CountingReader(object):
+    """File-like wrapper of a response's body, counting the decoded bytes
+    read from it.
+    """
+    def __init__(self, body: object):
+        self.body = body
+        self.bytes_read = 0
 
-            dataframe = pd.read_csv(StringIO(response.text), sep=';')
+    def read(self, size: int=None) -> bytes:
+        if size is None or size < 0:
+            data = self.body.read()
+        else:
+            data = self.body.read(size)
 
-            if 'port' in dataframe.columns:
-                dataframe['port'] = dataframe['port'].map(int)
+        self.bytes_read += len(data)
+        return data
 
-            if 'sensor' in dataframe.columns:
-                dataframe['sensor'] = dataframe['sensor'].map(int)
+    def readline(self) -> bytes:
+        data = self.body.readline()
+        self.bytes_read += len(data)
+        return data
 
-            if 'event_code' in dataframe.columns:
-                dataframe['event_code'] = dataframe['event_code'].map(int)
+    def readable(self) -> bool:
+        return True
 
-            if 'dimension_code' in dataframe.columns:
-                dataframe['dimension_code'] = dataframe['dimension_code'] \
-                    .map(int)
+    @property
+    def closed(self) -> bool:
+        return getattr(self.body, 'closed', False)
 
-            if 'dimension_thing_code' in dataframe.columns:
-                dataframe['dimension_thing_code'] = dataframe \
-                    ['dimension_thing_code'].map(int)
+    def __iter__(self):
+        return iter(self.readline, b'')
 
-            if 'dimension_unity_code' in dataframe.columns:
-                dataframe['dimension_unity_code'] = dataframe \
-                    ['dimension_unity_code'].map(int)
+def response_body(response: object) -> CountingReader:
+    """Retrieves a readable file-like body of an HTTP response.
 
-            if portia_config.get('debug'):
-                print('[portia-debug]: {0} rows'.format(len(dataframe.index)))
+    Streamed bodies are read straight from the socket, decompressing on the
+    fly, so they are never held in memory as a whole.
 
-            return dataframe
+    Arguments:
+        response {object} -- HTTP response object
 
-        except Exception as err:
-            raise Exception('couldn\'t create data frame: {0}'.format(err))
+    Returns:
+        CountingReader -- file-like object with the response's body
+    """
+    if is_streamed(response):
+        response.raw.decode_content = True
+        return CountingReader(response.raw)
 
-    else:
-        raise Exception("couldn't retrieve data")
+    return CountingReader(BytesIO(response.content))
+
+def transfer_sizes(response: object, body: object) -> dict:
+    """Measures how many bytes of a response were received and how many they
+    were decoded into.
 
-def convert_json(portia_config: dict, response: object) -> dict:
-    """Converts a JSON text file to a data frame.
-    
     Arguments:
-        portia_config {dict} -- Portia's configuration arguments 
         response {object} -- HTTP response object
-    
+        body {object} -- body returned by response_body, read so far
+
     Returns:
-        dict -- converted dictionary
-    
-    Raises:
-        Exception -- when the conversion goes wrong
+        dict -- received and decoded bytes and their encoding
     """
-    if response.status_code == 200:
+    raw = getattr(response, 'raw', None)
 
-        json_ = json.loads(response.text)
-        if portia_config['debug']:
-            print('[portia-debug]: {0}'.format(json_))
+    if isinstance(raw, HTTPResponse):
+        received = raw.tell()
+    elif hasattr(response, 'num_bytes_downloaded'):
+        received = response.num_bytes_downloaded
+    else:
+        received = body.bytes_read
 
-        return json_
+    return {
+        'received': received,
+        'decoded': body.bytes_read,
+        'encoding': response.headers.get('Content-Encoding') or 'identity'
+    }
 
-    else:
-        err = json.loads(response.text)
-        raise Exception(
-            "couldn't retrieve data: {0}".format(err.get('message'))
-        )
+def emit_parse(
+    portia_config: dict,
+    response: object,
+    body: object,
+    format: str,
+    rows: int,
+    seconds: float,
+    **fields
+):
+    """Emits the 'parse' event of a response's conversion.
 
-def convert(type_: str, portia_config: dict, response: object) -> object:
-    """Converts an HTTP response.
-    
     Arguments:
-        type_ {str} -- type of response
-        portia_config {dict} -- Portia's configuration arguments 
+        portia_config {dict} -- Portia's configuration arguments
         response {object} -- HTTP response object
-    
+        body {object} -- body returned by response_body, read so far
+        format {str} -- format the body was converted from
+        rows {int} -- rows converted, or None for JSON
+        seconds {float} -- seconds the conversion took
+
+    Keyword Arguments:
+        **fields -- other fields of the event
+    """
+    targets = metrics.sinks(portia_config)
+
+    if len(targets) > 0:
+        metrics.dispatch(targets, 'parse', {
+            'format': format,
+            **getattr(response, 'portia_labels', {}),
+            'rows': rows,
+            'seconds': seconds,
+            **transfer_sizes(response, body),
+            **fields
+        })
+
+def schema_dtypes(portia_config: dict, schema: dict) -> dict:
+    """Resolves a schema into the dtypes used when parsing, downcasting float
+    columns when the configuration sets 'float32'.
+
+    Arguments:
+        portia_config {dict} -- Portia's configuration arguments
+        schema {dict} -- dtype of each known column
+
     Returns:
-        object -- converted response
+        dict -- dtype of each known column
     """
-    if type_ == 'text/csv':
-        return convert_csv(portia_config, response)
-    elif type_ == 'application/json':
-        return convert_json(portia_config, response)
+    if portia_config.get('float32') == True:
+        return {
+            column: 'float32' if dtype == 'float64' else dtype
+            for column, dtype in schema.items()
+        }
 
+    return schema
+
+def cast_codes(dataframe: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Casts a data frame's code columns to integers.
 
-def plot_selection_from_dataframes(
-    dataframes: list, timezone: str='Etc/GMT-3'
-):
-    """Uses Plotly to plot a chart from a set of dataframes.
-    
     Arguments:
-        dataframes {list} -- list of dataframes
-    
-    Keyword Arguments:
-        timezone {str} -- timezone to convert the timestamp to
-                          (default: {'Etc/GMT-3'})
+        dataframe {pd.DataFrame} -- data frame to be cast
+
+    Returns:
+        pd.DataFrame -- cast data frame
     """
-    lines = []
+    if 'port' in dataframe.columns:
+        dataframe['port'] = dataframe['port'].map(int)
+
+    if 'sensor' in dataframe.columns:
+        dataframe['sensor'] = dataframe['sensor'].map(int)
 
-    for i, dataframe in enumerate(dataframes):
+    if 'event_code' in dataframe.columns:
+        dataframe['event_code'] = dataframe['event_code'].map(int)
 
-        dataframe['header_timestamp'] = pd.to_datetime(
-            dataframe['header_timestamp'],
-            unit='ms'
-        ).dt.tz_localize(timezone)
+    if 'dimension_code' in dataframe.columns:
+        dataframe['dimension_code'] = dataframe['dimension_code'] \
+            .map(int)
 
-        lines.append(plotlygo.Scatter(
-            y=dataframe.dimension_value,
-            x=dataframe.header_timestamp,
-            mode='lines+markers',
-            name="Sensor {0}".format(i)
-        ))
+    if 'dimension_thing_code' in dataframe.columns:
+        dataframe['dimension_thing_code'] = dataframe \
+            ['dimension_thing_code'].map(int)
 
-    data = plotlygo.Data(lines)
-    layout = plotlygo.Layout(width=1100, height=650)
-    plotly.iplot(plotlygo.Figure(data=data, layout=layout))
+    if 'dimension_unity_code' in dataframe.columns:
+        dataframe['dimension_unity_code'] = dataframe \
+            ['dimension_unity_code'].map(int)
+
+    return dataframe
+
+def iterate_csv(
+    portia_config: dict,
+    response: object,
+    reader: object,
+    schema: dict=None,
+    body: object=None
+) -> 'Iterator[pd.DataFrame]':
+    """Yields the data frames of a chunked CSV reader, releasing the
+    response's connection when done, or when the iterator is closed or
+    dropped before that.
 
-def plot_summary_from_dataframes(
-    dataframes: list, timezone: str='Etc/GMT-3'
-):
-    """Uses Plotly to plot a chart from a set of dataframes.
-    
     Arguments:
-        dataframes {list} -- list of dataframes
-    
+        portia_config {dict} -- Portia's configuration arguments
+        response {object} -- HTTP response object
+        reader {object} -- pandas' chunked CSV reader
+
     Keyword Arguments:
-        timezone {str} -- timezone to convert the timestamp to
-                          (default: {'Etc/GMT-3'})
+        schema {dict} -- dtype of each known column, already applied by the
+                         reader (default: {None})
+        body {object} -- body the reader reads from (default: {None})
+
+    Yields:
+        pd.DataFrame -- converted data frame of each chunk
+
+    Raises:
+        Exception -- when a chunk's conversion goes wrong
     """
-    lines = []
-
-    for dataframe in dataframes:
-        dataframe['header_timestamp'] = pd.to_datetime(
-            dataframe['header_timestamp'],
-            unit='ms'
-        ).dt.tz_localize(timezone)
-
-        lines.append(plotlygo.Bar(
-            y=dataframe['number_of_packages'],
-            x=dataframe.header_timestamp,
-            name="Packages",
-            opacity=0.1
-        ))
-
-        if 'max' in dataframe.columns:
-            lines.append(plotlygo.Scatter(
-                y=dataframe['max'],
-                x=dataframe.header_timestamp,
-                mode='lines+markers',
-                name="Max",
-                yaxis='y2'
-            ))
-
-        if 'avg' in dataframe.columns:
-            lines.append(plotlygo.Scatter(
-                y=dataframe['avg'],
-                x=dataframe.header_timestamp,
-                mode='lines+markers',
-                name="Avg",
-                yaxis='y2'
-            ))
-
-        if 'min' in dataframe.columns:
-            lines.append(plotlygo.Scatter(
-                y=dataframe['min'],
-                x=dataframe.header_timestamp,
-                mode='lines+markers',
-                name="Min",
-                yaxis='y2'
-            ))
-
-        if 'median' in dataframe.columns:
-            lines.append(plotlygo.Scatter(
-                y=dataframe['median'],
-                x=dataframe.header_timestamp,
-                mode='lines+markers',
-                name="Median",
-                yaxis='y2'
-            ))
-
-        if 'mode' in dataframe.columns:
-            lines.append(plotlygo.Scatter(
-                y=dataframe['mode'],
-                x=dataframe.header_timestamp,
-                mode='lines+markers',
-                name="Mode",
-                yaxis='y2'
-            ))
-
-        if 'sum' in dataframe.columns:
-            lines.append(plotlygo.Scatter(
-                y=dataframe['sum'],
-                x=dataframe.header_timestamp,
-                mode='lines+markers',
-                name="Sum",
-                yaxis='y2',
-                visible='legendonly'
-            ))
-
-        if 'stddev' in dataframe.columns:
-            lines.append(plotlygo.Scatter(
-                y=dataframe['stddev'],
-                x=dataframe.header_timestamp,
-                mode='lines+markers',
-                name="Stddev",
-                yaxis='y2',
-                visible='legendonly'
-            ))
-
-        if 'spread' in dataframe.columns:
-            lines.append(plotlygo.Scatter(
-                y=dataframe['spread'],
-                x=dataframe.header_timestamp,
-                mode='lines+markers',
-                name="Spread",
-                yaxis='y2',
-                visible='legendonly'
-            ))
-
-    data = plotlygo.Data(lines)
-    layout = plotlygo.Layout(
-        width=1100,
-        height=650,
-        yaxis=dict(title='Number of Packages', side='right'),
-        yaxis2=dict(title='Dimension Value',
-        overlaying='y',
-        side='left'
-    ))
-    plotly.iplot(plotlygo.Figure(data=data, layout=layout))
-
-
-def map_device_port_to_dropdown_widget(edge_id: str) -> dict:
-    """Maps set of device port to a dropdown.
+    try:
+        start = time.perf_counter()
+        chunks = enumerate(reader)
+
+        while True:
+            try:
+                chunk, dataframe = next(chunks)
+
+                if schema is None:
+                    dataframe = cast_codes(dataframe)
+            except StopIteration:
+                break
+            except Exception as err:
+                raise Exception(
+                    'couldn\'t create data frame: {0}'.format(err)
+                ) from err
+
+            if body is not None:
+                emit_parse(
+                    portia_config,
+                    response,
+                    body,
+                    'csv',
+                    len(dataframe.index),
+                    time.perf_counter() - start,
+                    chunk=chunk
+                )
+
+            yield dataframe
+            start = time.perf_counter()
+
+    finally:
+        if is_streamed(response):
+            response.close()
+
+def convert_csv(
+    portia_config: dict, response: object, schema: dict=None
+) -> 'pd.DataFrame':
+    """Converts a CSV text file to a data frame.
+
+    When a schema is given, its columns are typed by the parser itself in a
+    single pass, otherwise code columns are cast to integers afterwards.
+
+    When the configuration sets a 'chunksize', an iterator of data frames
+    with at most that many rows is returned instead, so large responses are
+    parsed in bounded memory.
     
     Arguments:
-        edge_id {str} -- Edge ID that identifies the device
+        portia_config {dict} -- Portia's configuration arguments 
+        response {object} -- HTTP response object
+
+    Keyword Arguments:
+        schema {dict} -- dtype of each known column, such as SELECT_SCHEMA
+                         (default: {None})
     
     Returns:
-        dict -- configuration for the dropdown
+        pd.DataFrame -- converted dataframe
     
     Raises:
-        Exception -- when something goes wrong with the request
+        Exception -- when the conversion goes wrong
     """
-    portMapping = {}
+    if response.status_code == 200:
 
-    response = http_get_request(
-        '/describe/device/{0}/ports/last?precision=ms'.format(edge_id)
-    )
+        chunksize = portia_config.get('chunksize')
+        streamed = is_streamed(response)
 
-    if response.status_code == 200:
-        d = json.loads(response.text)
-
-        for port in d['ports']:
-            label = '{0:3} | {1:25} ({2})'.format(
-                port['port'],
-                humanize_thing_code(port["dimension_thing_code"]),
-                arrow.get(
-                    port["header_timestamp"] / 1000,
-                    tzinfo=tz.gettz('America/Sao_Paulo')
-                ).humanize()
+        if schema is not None:
+            dtype = schema_dtypes(portia_config, schema)
+        else:
+            dtype = None
+
+        try:
+
+            start = time.perf_counter()
+            body = response_body(response)
+            reader = pd.read_csv(
+                body,
+                sep=';',
+                chunksize=chunksize,
+                dtype=dtype
+            )
+
+            if chunksize is not None:
+                dataframes = iterate_csv(
+                    portia_config, response, reader, schema, body
+                )
+
+                # an iterator dropped before it's started never runs its
+                # cleanup, so the response is closed once it's collected
+                if streamed == True:
+                    weakref.finalize(dataframes, response.close)
+
+                return dataframes
+
+            if schema is None:
+                dataframe = cast_codes(reader)
+            else:
+                dataframe = reader
+
+            emit_parse(
+                portia_config,
+                response,
+                body,
+                'csv',
+                len(dataframe.index),
+                time.perf_counter() - start
             )
 
-            portMapping[label] = port['port']
+        except Exception as err:
+            if streamed == True:
+                response.close()
+
+            raise Exception(
+                'couldn\'t create data frame: {0}'.format(err)
+            ) from err
 
-        return portMapping
+        if streamed == True:
+            response.close()
+
+        return dataframe
 
     else:
-        raise Exception('Couldn\'t retrieve data')
+        if is_streamed(response):
+            response.close()
+
+        raise Exception("couldn't retrieve data")
+
+def convert_arrow(
+    portia_config: dict, response: object, schema: dict=None
+) -> 'pyarrow.Table':
+    """Converts a CSV text file to an Arrow table, parsed by Arrow's
+    multithreaded reader straight from the response's body, so no pandas
+    object columns are ever built.
+
+    It requires the optional pyarrow dependency, installable with
+    `pip install portiapy[arrow]`.
 
-def map_device_port_sensors_to_dropdown_widget(edge_id: str, port: int) -> dict:
-    """Maps set of device port sensors to a dropdown.
-    
     Arguments:
-        edge_id {str} -- Edge ID that identifies the device
-        port {int} -- port to fetch
-    
+        portia_config {dict} -- Portia's configuration arguments
+        response {object} -- HTTP response object
+
+    Keyword Arguments:
+        schema {dict} -- dtype of each known column, such as SELECT_SCHEMA
+                         (default: {None})
+
     Returns:
-        dict -- configuration for the dropdown
-    
+        pyarrow.Table -- converted table
+
     Raises:
-        Exception -- when something goes wrong with the request
+        ImportError -- when pyarrow is not installed
+        ValueError -- when the configuration sets a 'chunksize'
+        Exception -- when the conversion goes wrong
     """
-    sensorMapping = {}
+    try:
+        import pyarrow
+        import pyarrow.csv
+    except ImportError:
+        raise ImportError(
+            'the arrow output requires pyarrow, install it with '
+            '`pip install portiapy[arrow]`'
+        )
 
-    response = http_get_request(
-        '/describe/device/{0}/port/{1}/sensors/last?precision=ms' \
-        .format(edge_id, port)
-    )
+    if portia_config.get('chunksize') is not None:
+        raise ValueError('the arrow output can\'t be combined with chunksize')
 
-    if response.status_code == 200:
-        d = json.loads(response.text)
-
-        for sensor in d['sensors']:
-            label = '{0:3} | {1:25} | {2:6}{3:15} ({4})'.format(
-                sensor['sensor'],
-                humanize_dimension_code(sensor["dimension_code"]),
-                sensor["dimension_value"],
-                humanize_unity_code(sensor["dimension_unity_code"]),
-                arrow.get(
-                    sensor["header_timestamp"] / 1000,
-                    tzinfo=tz.gettz('America/Sao_Paulo')
-                ).humanize()
+    if response.status_code != 200:
+        if is_streamed(response):
+            response.close()
+
+        raise Exception("couldn't retrieve data")
+
+    column_types = {}
+
+    if schema is not None:
+        column_types = {
+            column: pyarrow.from_numpy_dtype(np.dtype(dtype))
+            for column, dtype in schema_dtypes(portia_config, schema).items()
+        }
+
+    try:
+
+        start = time.perf_counter()
+        body = response_body(response)
+        table = pyarrow.csv.read_csv(
+            body,
+            read_options=pyarrow.csv.ReadOptions(use_threads=True),
+            parse_options=pyarrow.csv.ParseOptions(delimiter=';'),
+            convert_options=pyarrow.csv.ConvertOptions(
+                column_types=column_types
             )
+        )
 
-            sensorMapping[label] = sensor['sensor']
+        emit_parse(
+            portia_config,
+            response,
+            body,
+            'arrow',
+            table.num_rows,
+            time.perf_counter() - start
+        )
 
-        return sensorMapping
+        return table
 
-    else:
-        raise Exception('Couldn\'t retrieve data')
+    except pyarrow.ArrowInvalid as err:
+        raise Exception('couldn\'t create table: {0}'.format(err))
 
-def map_device_port_sensor_dimensions_to_dropdown_widget(
-    edge_id: str, port: int, sensor: int
-):
-    """Maps set of device port sensor dimensions to a dropdown.
+    finally:
+        if is_streamed(response):
+            response.close()
+
+def to_parquet(result: object, path: str, **kwargs):
+    """Writes a query's result, either an Arrow table, a data frame or an
+    iterator of data frames, to a Parquet file.
+
+    Arguments:
+        result {object} -- result of a select, summary or events query
+        path {str} -- path of the Parquet file
+
+    Keyword Arguments:
+        **kwargs -- arguments of pyarrow.parquet.write_table
+
+    Raises:
+        ImportError -- when pyarrow is not installed
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError(
+            'writing Parquet files requires pyarrow, install it with '
+            '`pip install portiapy[arrow]`'
+        )
+
+    if isinstance(result, pyarrow.Table):
+        pyarrow.parquet.write_table(result, path, **kwargs)
+        return
+
+    if isinstance(result, pd.DataFrame):
+        pyarrow.parquet.write_table(
+            pyarrow.Table.from_pandas(result, preserve_index=False),
+            path,
+            **kwargs
+        )
+        return
+
+    writer = None
+
+    try:
+        for dataframe in result:
+            table = pyarrow.Table.from_pandas(dataframe, preserve_index=False)
+
+            if writer is None:
+                writer = pyarrow.parquet.ParquetWriter(
+                    path, table.schema, **kwargs
+                )
+
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+def loads(content: bytes) -> object:
+    """Parses JSON straight from a response's bytes, with orjson when it's
+    installed, skipping the decoding into a string.
+
+    Arguments:
+        content {bytes} -- JSON document
+
+    Returns:
+        object -- parsed document
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+
+    return json.loads(content)
+
+def convert_json(portia_config: dict, response: object) -> dict:
+    """Converts a JSON text file to a data frame.
     
     Arguments:
-        edge_id {str} -- Edge ID that identifies the device
-        port {int} -- port to fetch
-        sensor {int} -- sensor to fetch
+        portia_config {dict} -- Portia's configuration arguments 
+        response {object} -- HTTP response object
     
     Returns:
-        dict -- configuration for the dropdown
+        dict -- converted dictionary
     
     Raises:
-        Exception -- when something goes wrong with the request
+        Exception -- when the conversion goes wrong
     """
-    dimensionMapping = {}
-
-    response = http_get_request(
-        '/describe/device/{0}/port/{1}/sensor/{2}/dimensions/last'
-        '?precision=ms'.format(edge_id, port, sensor)
-    )
-
     if response.status_code == 200:
-        d = json.loads(response.text)
-
-        for dimension in d['dimensions']:
-            label = '{0:3} | {1:25} | {2:6}{3:15} ({4})'.format(
-                dimension['dimension_code'],
-                humanize_dimension_code(dimension["dimension_code"]),
-                dimension["dimension_value"],
-                humanize_unity_code(dimension["dimension_unity_code"]),
-                arrow.get(
-                    dimension["header_timestamp"] / 1000,
-                    tzinfo=tz.gettz('America/Sao_Paulo')
-                ).humanize()
-            )
 
-            dimensionMapping[label] = dimension['dimension_code']
+        start = time.perf_counter()
+        body = response_body(response)
+
+        try:
+            json_ = loads(body.read())
+        finally:
+            if is_streamed(response):
+                response.close()
+
+        metrics.document(portia_config, response, json_)
+
+        emit_parse(
+            portia_config,
+            response,
+            body,
+            'json',
+            None,
+            time.perf_counter() - start
+        )
 
-        return dimensionMapping
+        return json_
 
     else:
-        raise Exception('Couldn\'t retrieve data')
+        # reading the body doesn't release a streamed response's limiter slot
+        try:
+            err = loads(response.content)
+        finally:
+            response.close()
+
+        raise Exception(
+            "couldn't retrieve data: {0}".format(err.get('message'))
+        )
+
+def convert(
+    type_: str, portia_config: dict, response: object, schema: dict=None
+) -> object:
+    """Converts an HTTP response. CSV responses are converted to data frames,
+    or to Arrow tables when the configuration's 'output' is 'arrow'.
+
+    A response shared by coalesced requests is converted once, each caller
+    getting its own copy of the result.
+    
+    Arguments:
+        type_ {str} -- type of response
+        portia_config {dict} -- Portia's configuration arguments 
+        response {object} -- HTTP response object
+
+    Keyword Arguments:
+        schema {dict} -- dtype of each known CSV column (default: {None})
+    
+    Returns:
+        object -- converted response
+    """
+    if type_ == 'text/csv':
+        if portia_config.get('output') == 'arrow':
+            converter = convert_arrow
+        else:
+            converter = convert_csv
+
+        if portia_config.get('chunksize') is not None:
+            return converter(portia_config, response, schema)
+
+        return singleflight.convert_once(
+            response,
+            (
+                type_,
+                str(schema),
+                portia_config.get('float32'),
+                portia_config.get('output')
+            ),
+            lambda: converter(portia_config, response, schema)
+        )
+    elif type_ == 'application/json':
+        return singleflight.convert_once(
+            response,
+            (type_,),
+            lambda: convert_json(portia_config, response)
+        )
+
+
+def __getattr__(name: str) -> object:
+    """Resolves the helpers moved out of this module, importing their module
+    on first use.
+
+    Arguments:
+        name {str} -- name of the attribute
+
+    Returns:
+        object -- the moved helper
+
+    Raises:
+        AttributeError -- when the attribute doesn't exist
+    """
+    if name in MOVED:
+        return getattr(importlib.import_module(MOVED[name]), name)
+
+    raise AttributeError(
+        'module {0!r} has no attribute {1!r}'.format(__name__, name)
+    )
 
 
 # Maintaining compatibility with old versions
@@ -0,0 +1,136 @@
+"""Widget tools to map a device's ports, sensors and dimensions to dropdowns,
+kept apart from utils so arrow is only imported when a widget is built.
+"""
+
+import json
+
+import arrow
+from dateutil import tz
+
+import portiapy.utils as utils
+
+
+def map_device_port_to_dropdown_widget(edge_id: str) -> dict:
+    """Maps set of device port to a dropdown.
+    
+    Arguments:
+        edge_id {str} -- Edge ID that identifies the device
+    
+    Returns:
+        dict -- configuration for the dropdown
+    
+    Raises:
+        Exception -- when something goes wrong with the request
+    """
+    portMapping = {}
+
+    response = utils.http_get_request(
+        '/describe/device/{0}/ports/last?precision=ms'.format(edge_id)
+    )
+
+    if response.status_code == 200:
+        d = json.loads(response.text)
+
+        for port in d['ports']:
+            label = '{0:3} | {1:25} ({2})'.format(
+                port['port'],
+                utils.humanize_thing_code(port["dimension_thing_code"]),
+                arrow.get(
+                    port["header_timestamp"] / 1000,
+                    tzinfo=tz.gettz('America/Sao_Paulo')
+                ).humanize()
+            )
+
+            portMapping[label] = port['port']
+
+        return portMapping
+
+    else:
+        raise Exception('Couldn\'t retrieve data')
+
+def map_device_port_sensors_to_dropdown_widget(edge_id: str, port: int) -> dict:
+    """Maps set of device port sensors to a dropdown.
+    
+    Arguments:
+        edge_id {str} -- Edge ID that identifies the device
+        port {int} -- port to fetch
+    
+    Returns:
+        dict -- configuration for the dropdown
+    
+    Raises:
+        Exception -- when something goes wrong with the request
+    """
+    sensorMapping = {}
+
+    response = utils.http_get_request(
+        '/describe/device/{0}/port/{1}/sensors/last?precision=ms' \
+        .format(edge_id, port)
+    )
+
+    if response.status_code == 200:
+        d = json.loads(response.text)
+
+        for sensor in d['sensors']:
+            label = '{0:3} | {1:25} | {2:6}{3:15} ({4})'.format(
+                sensor['sensor'],
+                utils.humanize_dimension_code(sensor["dimension_code"]),
+                sensor["dimension_value"],
+                utils.humanize_unity_code(sensor["dimension_unity_code"]),
+                arrow.get(
+                    sensor["header_timestamp"] / 1000,
+                    tzinfo=tz.gettz('America/Sao_Paulo')
+                ).humanize()
+            )
+
+            sensorMapping[label] = sensor['sensor']
+
+        return sensorMapping
+
+    else:
+        raise Exception('Couldn\'t retrieve data')
+
+def map_device_port_sensor_dimensions_to_dropdown_widget(
+    edge_id: str, port: int, sensor: int
+):
+    """Maps set of device port sensor dimensions to a dropdown.
+    
+    Arguments:
+        edge_id {str} -- Edge ID that identifies the device
+        port {int} -- port to fetch
+        sensor {int} -- sensor to fetch
+    
+    Returns:
+        dict -- configuration for the dropdown
+    
+    Raises:
+        Exception -- when something goes wrong with the request
+    """
+    dimensionMapping = {}
+
+    response = utils.http_get_request(
+        '/describe/device/{0}/port/{1}/sensor/{2}/dimensions/last'
+        '?precision=ms'.format(edge_id, port, sensor)
+    )
+
+    if response.status_code == 200:
+        d = json.loads(response.text)
+
+        for dimension in d['dimensions']:
+            label = '{0:3} | {1:25} | {2:6}{3:15} ({4})'.format(
+                dimension['dimension_code'],
+                utils.humanize_dimension_code(dimension["dimension_code"]),
+                dimension["dimension_value"],
+                utils.humanize_unity_code(dimension["dimension_unity_code"]),
+                arrow.get(
+                    dimension["header_timestamp"] / 1000,
+                    tzinfo=tz.gettz('America/Sao_Paulo')
+                ).humanize()
+            )
+
+            dimensionMapping[label] = dimension['dimension_code']
+
+        return dimensionMapping
+
+    else:
+        raise Exception('Couldn\'t retrieve data')
@@ -29,8 +29,18 @@ setup(
         'python-dateutil>=2.8.2',
         'python-dotenv>=1.0.0',
         'pytz>=2022.7.1',
-        'requests>=2.28.2'
+        'requests>=2.28.2',
+        'tenacity>=8.2.1'
     ],
+    extras_require={
+        'arrow': ['pyarrow>=14.0.0'],
+        'async': ['httpx>=0.24.0'],
+        'compression': ['brotli>=1.0.9'],
+        'history': ['pyarrow>=14.0.0'],
+        'json': ['orjson>=3.8.0'],
+        'otel': ['opentelemetry-api>=1.0.0'],
+        'widgets': ['ipywidgets>=7.6.0']
+    },
     classifiers=(
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
@@ -0,0 +1 @@
+"""Benchmarks of the application against a local mock of Portia."""
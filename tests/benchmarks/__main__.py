@@ -0,0 +1,158 @@
+"""Runs the benchmarks and prints how long each of them takes, optionally
+saving the timings or comparing them with previously saved ones.
+
+	python3 -m tests.benchmarks [-k PATTERN] [--save FILE] [--compare FILE]
+"""
+
+import argparse
+import inspect
+import itertools
+import json
+import statistics
+import sys
+import timeit
+
+from tests.benchmarks import benchmarks
+
+
+def combinations(benchmark: type) -> list:
+	"""Lists the param combinations of a benchmark class, as asv does.
+
+	Arguments:
+		benchmark {type} -- benchmark class
+
+	Returns:
+		list -- tuples of params
+	"""
+	params = getattr(benchmark, 'params', None)
+
+	if params is None:
+		return [()]
+
+	if len(getattr(benchmark, 'param_names', ())) > 1:
+		return list(itertools.product(*params))
+
+	return [(param,) for param in params]
+
+def measure(function: callable, repeat: int) -> list:
+	"""Times a function, calling it enough times per sample for the timer's
+	resolution not to matter.
+
+	Arguments:
+		function {callable} -- function to be timed
+		repeat {int} -- number of samples
+
+	Returns:
+		list -- seconds per call of each sample
+	"""
+	timer = timeit.Timer(function)
+	number, _ = timer.autorange()
+
+	return [
+		seconds / number for seconds in timer.repeat(repeat, number)
+	]
+
+def run(pattern: str=None, repeat: int=5) -> dict:
+	"""Runs every benchmark whose name contains the pattern.
+
+	Keyword Arguments:
+		pattern {str} -- part of the benchmarks' names (default: {None})
+		repeat {int} -- number of samples of each benchmark (default: {5})
+
+	Returns:
+		dict -- median and minimum seconds per call, keyed by name
+	"""
+	timings = {}
+
+	for class_name, benchmark in inspect.getmembers(
+		benchmarks, inspect.isclass
+	):
+		if benchmark.__module__ != benchmarks.__name__:
+			continue
+
+		methods = [
+			name for name in dir(benchmark) if name.startswith('time_')
+		]
+
+		for params in combinations(benchmark):
+			for method_name in methods:
+				name = '{0}.{1}({2})'.format(
+					class_name,
+					method_name,
+					', '.join(map(str, params))
+				)
+
+				if pattern is not None and pattern not in name:
+					continue
+
+				instance = benchmark()
+				method = getattr(instance, method_name)
+
+				try:
+					if hasattr(instance, 'setup'):
+						instance.setup(*params)
+					if hasattr(method, 'setup'):
+						method.setup(instance, *params)
+				except NotImplementedError as err:
+					print('{0:<60} skipped: {1}'.format(name, err))
+					continue
+
+				try:
+					samples = measure(lambda: method(*params), repeat)
+				finally:
+					if hasattr(instance, 'teardown'):
+						instance.teardown(*params)
+
+				timings[name] = {
+					'median': statistics.median(samples),
+					'min': min(samples)
+				}
+				print('{0:<60} {1:>10.3f} ms (min {2:.3f} ms)'.format(
+					name,
+					timings[name]['median'] * 1000,
+					timings[name]['min'] * 1000
+				))
+
+	return timings
+
+def compare(timings: dict, baseline: dict):
+	"""Prints how the timings changed from a baseline.
+
+	Arguments:
+		timings {dict} -- timings returned by run
+		baseline {dict} -- timings saved by a previous run
+	"""
+	print()
+	for name, timing in timings.items():
+		if name not in baseline:
+			continue
+
+		ratio = timing['median'] / baseline[name]['median']
+		print('{0:<60} {1:>7.2f}x {2}'.format(
+			name, ratio, 'slower' if ratio > 1 else 'faster'
+		))
+
+
+def main(arguments: list=None) -> int:
+	parser = argparse.ArgumentParser(prog='python3 -m tests.benchmarks')
+	parser.add_argument('-k', dest='pattern', help='run matching benchmarks')
+	parser.add_argument('--repeat', type=int, default=5)
+	parser.add_argument('--save', help='file to save the timings to')
+	parser.add_argument('--compare', help='file with timings to compare to')
+	arguments = parser.parse_args(arguments)
+
+	timings = run(arguments.pattern, arguments.repeat)
+
+	if arguments.compare is not None:
+		with open(arguments.compare) as file:
+			compare(timings, json.load(file))
+
+	if arguments.save is not None:
+		with open(arguments.save, 'w') as file:
+			json.dump(timings, file, indent=2, sort_keys=True)
+
+	return 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,199 @@
+"""Benchmarks of PortiaPy's client-side costs against a local MockPortia.
+
+They follow asv's conventions: each class sets up its state in setup, which
+raises NotImplementedError to skip a benchmark, and is timed through its
+time_* methods, once per combination of its params.
+"""
+
+import numpy
+import requests
+
+from portiapy import (
+	describe, fanout, plotting, select, summary, transport, utils
+)
+from tests.benchmarks.server import MockPortia, parse_route
+
+
+EDGE_ID = 'AAAABBBBCCCC'
+
+PORTIA_CONFIG = {
+	'baseurl': 'http://localhost',
+	'authorization': 'token',
+	'debug': False,
+	'Accept': 'text/csv'
+}
+
+SELECT_PARAMS = {
+	'from': None,
+	'to': None,
+	'order': None,
+	'precision': 'ms',
+	'timezone': 'Etc/UTC'
+}
+
+
+def select_body(rows: int) -> bytes:
+	"""Generates the CSV body of a sensor's select.
+	"""
+	return MockPortia(rows=rows).series(
+		parse_route('/select/device/{0}/port/1/sensor/1'.format(EDGE_ID)), {}
+	).encode()
+
+def build_response(body: bytes) -> requests.Response:
+	"""Builds an in-memory response, so parsing is timed without the
+	network.
+	"""
+	response = requests.Response()
+	response.url = 'http://localhost/select'
+	response.status_code = 200
+	response._content = body
+
+	return response
+
+
+class RequestOverhead(object):
+	"""Round trip of the smallest requests, dominated by the client's own
+	overhead: connection reuse, headers and conversion setup.
+	"""
+	def setup(self):
+		self.server = MockPortia(rows=1).start()
+		self.portia_config = self.server.portia_config(
+			transport=transport.PortiaTransport()
+		)
+
+	def teardown(self):
+		self.portia_config['transport'].close()
+		self.server.stop()
+
+	def time_describe_ports(self):
+		describe.device_ports(self.portia_config, EDGE_ID)
+
+	def time_select_last(self):
+		select.query_by_port_sensor(
+			self.portia_config, EDGE_ID, 1, 1, last=True
+		)
+
+
+class CsvParse(object):
+	"""Parse of select responses already in memory.
+	"""
+	params = [1000, 100000]
+	param_names = ['rows']
+
+	def setup(self, rows):
+		self.body = select_body(rows)
+		self.portia_config = PORTIA_CONFIG
+
+	def time_convert_csv(self, rows):
+		utils.convert_csv(
+			self.portia_config,
+			build_response(self.body),
+			utils.SELECT_SCHEMA
+		)
+
+	def time_convert_csv_float32(self, rows):
+		utils.convert_csv(
+			{**self.portia_config, 'float32': True},
+			build_response(self.body),
+			utils.SELECT_SCHEMA
+		)
+
+	def time_convert_arrow(self, rows):
+		utils.convert_arrow(
+			self.portia_config,
+			build_response(self.body),
+			utils.SELECT_SCHEMA
+		)
+
+	def setup_arrow(self, rows):
+		try:
+			import pyarrow
+		except ImportError:
+			raise NotImplementedError('pyarrow is not installed')
+
+	time_convert_arrow.setup = setup_arrow
+
+
+class Humanize(object):
+	"""Humanization of a parsed select.
+	"""
+	params = [1000, 100000]
+	param_names = ['rows']
+
+	def setup(self, rows):
+		self.dataframe = utils.convert_csv(
+			PORTIA_CONFIG, build_response(select_body(rows)), utils.SELECT_SCHEMA
+		)
+
+	def time_humanize_dataframe(self, rows):
+		utils.humanize_dataframe(self.dataframe)
+
+	def time_humanize_dataframe_pt_br(self, rows):
+		utils.humanize_dataframe(self.dataframe, locale='pt-br')
+
+
+class LocalSummary(object):
+	"""Summaries derived locally from a parsed select.
+	"""
+	params = [1000, 100000]
+	param_names = ['rows']
+
+	def setup(self, rows):
+		self.dataframe = utils.convert_csv(
+			PORTIA_CONFIG, build_response(select_body(rows)), utils.SELECT_SCHEMA
+		)
+
+	def time_summarize_per_hour(self, rows):
+		summary.summarize(self.dataframe)
+
+	def time_summarize_every_statistic(self, rows):
+		summary.summarize(self.dataframe, params={
+			statistic: True for statistic in summary.STATISTICS
+		})
+
+
+class Downsampling(object):
+	"""Downsampling of a long series to a chart's budget of points.
+	"""
+	params = [100000, 1000000]
+	param_names = ['rows']
+
+	def setup(self, rows):
+		self.x = numpy.arange(rows, dtype='int64') * 60000
+		self.y = numpy.random.default_rng(0).standard_normal(rows).cumsum()
+
+	def time_lttb(self, rows):
+		plotting.lttb(self.x, self.y, plotting.MAX_POINTS)
+
+	def time_min_max(self, rows):
+		plotting.min_max(self.x, self.y, plotting.MAX_POINTS)
+
+
+class FanOutThroughput(object):
+	"""Concurrent selects of many sensors, each answered after 20ms.
+	"""
+	params = [1, 8, 32]
+	param_names = ['max_workers']
+
+	def setup(self, max_workers):
+		self.server = MockPortia(rows=500, latency=0.02).start()
+		self.portia_config = self.server.portia_config(
+			transport=transport.PortiaTransport(pool_maxsize=32)
+		)
+		self.targets = [
+			(EDGE_ID, port, sensor)
+			for port in range(8) for sensor in range(1, 9)
+		]
+
+	def teardown(self, max_workers):
+		self.portia_config['transport'].close()
+		self.server.stop()
+
+	def time_select_many(self, max_workers):
+		fanout.select_many(
+			self.portia_config,
+			self.targets,
+			params=SELECT_PARAMS,
+			max_workers=max_workers,
+			concat=True
+		)
@@ -0,0 +1,581 @@
+"""Local stand-in for Portia's HTTP API, serving synthetic series of
+configurable size, latency and error rate, or responses recorded from the
+live service, so client-side performance can be measured reproducibly.
+"""
+
+import gzip
+import json
+import math
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+import requests
+
+
+CODES_COLUMNS = [
+	'header_timestamp',
+	'port',
+	'sensor',
+	'dimension_code',
+	'dimension_unity_code',
+	'dimension_thing_code'
+]
+
+STATISTICS = ['avg', 'min', 'max', 'sum', 'median', 'mode', 'stddev', 'spread']
+
+STRATEGY_STEPS = {
+	'perminute': 60000,
+	'perhour': 3600000,
+	'perday': 86400000,
+	'permonth': 2592000000,
+	'peryear': 31536000000
+}
+
+PRECISIONS = {'s': 1000, 'ms': 1, 'us': 0.001, 'ns': 0.000001}
+
+# epoch, in milliseconds, taken as the current time, so bodies never change
+NOW = 1609459200000
+
+
+def parse_route(path: str) -> dict:
+	"""Parses a request path into its family and the codes it addresses.
+
+	Arguments:
+		path {str} -- path of the request, without the base URL's path
+
+	Returns:
+		dict -- family, keyed codes, strategy, interval and if it's a /last
+				request
+	"""
+	segments = [segment for segment in path.split('/') if segment]
+	route = {'family': segments.pop(0) if segments else None, 'last': False}
+
+	if segments and segments[-1] == 'last':
+		route['last'] = True
+		segments.pop()
+
+	if route['family'] in ('summary', 'profile') and len(segments) >= 2 \
+	   and segments[-1].isdigit() and not segments[-2].isdigit():
+		route['interval'] = int(segments.pop())
+		route['strategy'] = segments.pop()
+
+	while len(segments) >= 2:
+		route[segments[0]] = segments[1]
+		segments = segments[2:]
+
+	if segments:
+		route['listing'] = segments[0]
+
+	return route
+
+
+class MockPortia(object):
+	"""Threaded HTTP server implementing the /select, /summary, /events,
+	/describe and /profile routes.
+
+	Series have one package every minute, or every summarized interval,
+	ending at NOW or at the 'to' param, and are generated once per distinct
+	request, so serving them costs as little as possible of the client's
+	measured time.
+	"""
+	def __init__(
+		self,
+		rows: int=1000,
+		latency: float=0.0,
+		error_rate: float=0.0,
+		ports: int=4,
+		sensors: int=2,
+		dimensions: tuple=(1, 2),
+		fixtures: str=None,
+		seed: int=0
+	):
+		"""MockPortia's constructor.
+
+		Keyword Arguments:
+			rows {int} -- packages of each series (default: {1000})
+			latency {float} -- seconds each response is delayed
+							   (default: {0.0})
+			error_rate {float} -- share of requests answered with a 503
+								  (default: {0.0})
+			ports {int} -- ports of each device (default: {4})
+			sensors {int} -- sensors of each port (default: {2})
+			dimensions {tuple} -- dimension codes of each sensor
+								  (default: {(1, 2)})
+			fixtures {str} -- directory with responses saved by record,
+							  served instead of synthetic ones
+							  (default: {None})
+			seed {int} -- seed of the injected errors (default: {0})
+		"""
+		self.rows = rows
+		self.latency = latency
+		self.error_rate = error_rate
+		self.ports = ports
+		self.sensors = sensors
+		self.dimensions = tuple(dimensions)
+		self.fixtures = fixtures
+
+		self.requests = 0
+		self.errors = 0
+
+		self._random = random.Random(seed)
+		self._lock = threading.Lock()
+		self._bodies = {}
+		self._server = None
+		self._thread = None
+
+	@property
+	def baseurl(self) -> str:
+		host, port = self._server.server_address[:2]
+		return 'http://{0}:{1}'.format(host, port)
+
+	def portia_config(self, **kwargs) -> dict:
+		"""Builds a Portia configuration pointing to this server.
+
+		Keyword Arguments:
+			**kwargs -- other configuration arguments
+
+		Returns:
+			dict -- Portia's configuration arguments
+		"""
+		return {
+			'baseurl': self.baseurl,
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv',
+			**kwargs
+		}
+
+	def start(self) -> 'MockPortia':
+		"""Starts serving on a free local port, in a background thread.
+
+		Returns:
+			MockPortia -- this server
+		"""
+		server = self
+
+		class Handler(MockPortiaHandler):
+			mock = server
+
+		self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+		self._server.daemon_threads = True
+		self._thread = threading.Thread(
+			target=self._server.serve_forever,
+			kwargs={'poll_interval': 0.05},
+			daemon=True
+		)
+		self._thread.start()
+
+		return self
+
+	def stop(self):
+		"""Stops serving.
+		"""
+		if self._server is not None:
+			self._server.shutdown()
+			self._server.server_close()
+			self._thread.join()
+			self._server = None
+
+	def __enter__(self) -> 'MockPortia':
+		return self.start()
+
+	def __exit__(self, *args):
+		self.stop()
+
+	def fail(self) -> bool:
+		"""Counts a request and draws if it's answered with an error.
+
+		Returns:
+			bool -- if the request fails
+		"""
+		with self._lock:
+			self.requests += 1
+			failed = self._random.random() < self.error_rate
+			self.errors += int(failed)
+
+			return failed
+
+	def respond(self, method: str, url: str) -> tuple:
+		"""Builds the response of a request, once per distinct request.
+
+		Arguments:
+			method {str} -- HTTP method
+			url {str} -- path and query string of the request
+
+		Returns:
+			tuple -- status code, content type and body
+		"""
+		key = (method, url)
+		response = self._bodies.get(key)
+
+		if response is None:
+			parts = urlsplit(url)
+			params = {
+				name: values[-1]
+				for name, values in parse_qs(parts.query).items()
+			}
+			response = self.build(method, parts.path, params)
+			self._bodies[key] = response
+
+		return response
+
+	def build(self, method: str, path: str, params: dict) -> tuple:
+		"""Builds the response of a request.
+
+		Arguments:
+			method {str} -- HTTP method
+			path {str} -- path of the request
+			params {dict} -- query string params
+
+		Returns:
+			tuple -- status code, content type and body
+		"""
+		if self.fixtures is not None:
+			fixture = load_fixture(self.fixtures, method, path, params)
+
+			if fixture is not None:
+				return fixture
+
+		route = parse_route(path)
+		family = route['family']
+
+		if family in ('select', 'events', 'summary'):
+			return 200, 'text/csv', self.series(route, params).encode()
+
+		if family == 'describe':
+			body = self.describe(route)
+		elif family == 'profile':
+			body = self.profile(route)
+		else:
+			body = None
+
+		if body is None:
+			return 404, 'application/json', b'{"message": "not found"}'
+
+		return 200, 'application/json', json.dumps(body).encode()
+
+	def series(self, route: dict, params: dict) -> str:
+		"""Generates the CSV of a series.
+
+		Arguments:
+			route {dict} -- parsed route of the request
+			params {dict} -- query string params
+
+		Returns:
+			str -- CSV body
+		"""
+		family = route['family']
+		step = STRATEGY_STEPS.get(route.get('strategy'), 60000) \
+			   * route.get('interval', 1)
+		scale = PRECISIONS.get(params.get('precision') or 'ms', 1)
+
+		end = NOW
+		if params.get('to') is not None:
+			end = int(float(params['to']) * scale)
+
+		rows = self.rows
+		if params.get('from') is not None:
+			start = int(float(params['from']) * scale)
+			rows = min(rows, max(0, (end - start) // step + 1))
+
+		if route['last'] == True:
+			rows = min(rows, 1)
+		elif params.get('limit') is not None:
+			rows = min(rows, int(params['limit']))
+
+		if family == 'summary':
+			values = [
+				statistic for statistic in STATISTICS
+				if params.get(statistic) == 'True'
+			] or ['avg', 'min', 'max']
+		elif family == 'events':
+			values = ['event_code']
+		else:
+			values = ['dimension_value']
+
+		port = int(route.get('port', 1))
+		sensor = int(route.get('sensor', 1))
+		dimensions = [int(route['dimension'])] if 'dimension' in route \
+					 else list(self.dimensions)
+		generator = random.Random(zlib.crc32(
+			'{0}/{1}/{2}'.format(route.get('device'), port, sensor).encode()
+		))
+
+		lines = [';'.join(CODES_COLUMNS + values)]
+
+		for index in range(rows - 1, -1, -1):
+			timestamp = end - index * step
+			dimension = dimensions[index % len(dimensions)]
+			codes = [
+				str(int(timestamp / scale)), str(port), str(sensor),
+				str(dimension), str(dimension), str(14 + dimension)
+			]
+
+			if family == 'events':
+				fields = [str(generator.randint(1, 8))]
+			else:
+				value = 20 + 5 * math.sin(index / 60) \
+						+ generator.gauss(0, 0.5)
+				fields = [
+					'{0:.2f}'.format(value + offset)
+					for offset in range(len(values))
+				]
+
+			lines.append(';'.join(codes + fields))
+
+		return '\n'.join(lines) + '\n'
+
+	def describe(self, route: dict) -> dict:
+		"""Generates the description of a device, port or sensor.
+
+		Arguments:
+			route {dict} -- parsed route of the request
+
+		Returns:
+			dict -- JSON body, or None when the route is unknown
+		"""
+		listing = route.get('listing')
+		sensors = range(1, self.sensors + 1)
+
+		if listing == 'ports':
+			codes = list(range(self.ports))
+			rows = [
+				{'header_timestamp': NOW, 'port': port,
+				 'dimension_thing_code': 15}
+				for port in codes
+			]
+		elif listing == 'sensors':
+			codes = list(sensors)
+			rows = [
+				{'header_timestamp': NOW, 'sensor': sensor,
+				 'dimension_value': 24.5, 'dimension_code': dimension,
+				 'dimension_unity_code': dimension,
+				 'dimension_thing_code': 15}
+				for sensor in codes for dimension in self.dimensions
+			]
+		elif listing == 'dimensions':
+			codes = list(self.dimensions)
+			rows = [
+				{'header_timestamp': NOW, 'sensor': sensor,
+				 'dimension_value': 24.5, 'dimension_code': dimension,
+				 'dimension_unity_code': dimension,
+				 'dimension_thing_code': 15}
+				for sensor in ([int(route['sensor'])] if 'sensor' in route
+							   else sensors)
+				for dimension in codes
+			]
+		else:
+			return None
+
+		return {listing: rows if route['last'] == True else codes}
+
+	def profile(self, route: dict) -> dict:
+		"""Generates the profile of a device, port or sensor.
+
+		Arguments:
+			route {dict} -- parsed route of the request
+
+		Returns:
+			dict -- JSON body
+		"""
+		def dimensions(port, sensor):
+			return [
+				{'dimension_code': dimension,
+				 'dimension_unity_code': dimension,
+				 'dimension_thing_code': 15,
+				 'dimension_value': 24.5,
+				 'header_timestamp': NOW}
+				for dimension in self.dimensions
+			]
+
+		def sensors(port):
+			return [
+				{'sensor': sensor, 'dimensions': dimensions(port, sensor)}
+				for sensor in range(1, self.sensors + 1)
+			]
+
+		if 'sensor' in route:
+			port, sensor = int(route['port']), int(route['sensor'])
+			return {
+				'port': port,
+				'sensor': sensor,
+				'dimensions': dimensions(port, sensor)
+			}
+
+		if 'port' in route:
+			port = int(route['port'])
+			return {'port': port, 'sensors': sensors(port)}
+
+		return {
+			'device': route.get('device'),
+			'channel_id': 'MOCKCHANNEL0',
+			'channel_code': 14,
+			'thing_code': 69,
+			'ports': [
+				{'port': port, 'sensors': sensors(port)}
+				for port in range(self.ports)
+			]
+		}
+
+
+class MockPortiaHandler(BaseHTTPRequestHandler):
+	"""Request handler of a MockPortia server, set as its mock attribute.
+	"""
+	protocol_version = 'HTTP/1.1'
+	# headers and body are written separately, which Nagle's algorithm would
+	# hold back until the client's delayed ACK
+	disable_nagle_algorithm = True
+	mock = None
+
+	def handle(self):
+		# clients that time out or are closed mid-response, as benchmarks do,
+		# aren't the server's errors
+		try:
+			super().handle()
+		except (ConnectionResetError, BrokenPipeError):
+			self.close_connection = True
+
+	def handle_request(self, method: str):
+		length = int(self.headers.get('Content-Length') or 0)
+		if length > 0:
+			self.rfile.read(length)
+
+		if self.mock.latency > 0:
+			time.sleep(self.mock.latency)
+
+		if self.mock.fail():
+			status, content_type, body = 503, 'application/json', \
+										 b'{"message": "unavailable"}'
+		else:
+			status, content_type, body = self.mock.respond(method, self.path)
+
+		self.send_response(status)
+		self.send_header('Content-Type', content_type)
+
+		if 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+			body = gzip.compress(body, compresslevel=1)
+			self.send_header('Content-Encoding', 'gzip')
+
+		self.send_header('Content-Length', str(len(body)))
+		self.end_headers()
+		self.wfile.write(body)
+
+	def do_GET(self):
+		self.handle_request('GET')
+
+	def do_POST(self):
+		self.handle_request('POST')
+
+	def log_message(self, format, *args):
+		pass
+
+
+def fixture_path(directory: str, method: str, path: str, params: dict) -> str:
+	"""Builds the path where the response of a request is recorded.
+
+	Arguments:
+		directory {str} -- directory of the fixtures
+		method {str} -- HTTP method
+		path {str} -- path of the request, without the base URL's path
+		params {dict} -- query string params
+
+	Returns:
+		str -- path of the fixture's file
+	"""
+	query = '&'.join(
+		'{0}={1}'.format(name, params[name]) for name in sorted(params)
+		if params[name] is not None
+	)
+
+	return os.path.join(
+		directory,
+		method.lower(),
+		quote(path.strip('/'), safe='') + (
+			'@' + quote(query, safe='') if query else ''
+		)
+	)
+
+def load_fixture(
+	directory: str, method: str, path: str, params: dict
+) -> tuple:
+	"""Loads the recorded response of a request.
+
+	Arguments:
+		directory {str} -- directory of the fixtures
+		method {str} -- HTTP method
+		path {str} -- path of the request, without the base URL's path
+		params {dict} -- query string params
+
+	Returns:
+		tuple -- status code, content type and body, or None when missing
+	"""
+	base = fixture_path(directory, method, path, params)
+
+	for extension, content_type in (('.csv', 'text/csv'),
+									('.json', 'application/json')):
+		if os.path.exists(base + extension):
+			with open(base + extension, 'rb') as file:
+				return 200, content_type, file.read()
+
+	return None
+
+def record(
+	portia_config: dict,
+	endpoint: str,
+	directory: str,
+	params: dict=None
+) -> str:
+	"""Records a live response of Portia, to be served by MockPortia when
+	its fixtures directory is set.
+
+	Arguments:
+		portia_config {dict} -- Portia's configuration arguments
+		endpoint {str} -- endpoint of the request
+		directory {str} -- directory of the fixtures
+
+	Keyword Arguments:
+		params {dict} -- params to send to the service (default: {None})
+
+	Returns:
+		str -- path of the recorded fixture
+
+	Raises:
+		Exception -- when the request goes wrong
+	"""
+	params = {
+		name: value for name, value in (params or {}).items()
+		if value is not None
+	}
+	response = requests.get(
+		'{0}{1}'.format(portia_config.get('baseurl'), endpoint),
+		headers={
+			'Authorization': 'Bearer {0}' \
+			.format(portia_config.get('authorization')),
+			'Accept': portia_config.get('Accept') or 'text/csv'
+		},
+		params=params
+	)
+
+	if response.status_code != 200:
+		raise Exception("couldn't retrieve data")
+
+	# the fixture is keyed as MockPortia sees the query string
+	params = {
+		name: values[-1]
+		for name, values in parse_qs(urlsplit(response.url).query).items()
+	}
+	extension = '.json' if 'json' in response.headers.get(
+		'Content-Type', ''
+	) else '.csv'
+	path = fixture_path(directory, 'GET', endpoint, params) + extension
+
+	os.makedirs(os.path.dirname(path), exist_ok=True)
+	with open(path, 'wb') as file:
+		file.write(response.content)
+
+	return path
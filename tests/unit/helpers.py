@@ -0,0 +1,178 @@
+"""Stand-ins shared by PortiaPy's unit tests.
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+
+from portiapy import transport
+
+
+MINUTE = 60 * 1000
+DAY = 24 * 60 * MINUTE
+
+# a sensor's select, and a device's, which also tells each row's sensor
+SELECT_CSV = (
+	'header_timestamp;dimension_code;dimension_unity_code;'
+	'dimension_thing_code;dimension_value\n'
+	'1565634220016;1;1;15;24.5\n'
+	'1565634280016;1;1;15;24.7\n'
+	'1565634340016;2;2;16;60.2\n'
+)
+DEVICE_SELECT_CSV = (
+	'header_timestamp;port;sensor;dimension_code;dimension_unity_code;'
+	'dimension_thing_code;dimension_value\n'
+	'1565634220016;1;1;1;1;15;24.5\n'
+	'1565634280016;1;1;1;1;15;24.7\n'
+	'1565634340016;1;2;2;2;16;60.2\n'
+)
+
+
+class FakeClock(object):
+	"""Clock that only moves when it's slept on, or when told to, recording
+	every sleep.
+	"""
+	def __init__(self, now=0.0):
+		self.now = now
+		self.sleeps = []
+
+	def __call__(self):
+		return self.now
+
+	def sleep(self, seconds):
+		self.sleeps.append(seconds)
+		self.now += seconds
+
+
+class SequenceAdapter(BaseAdapter):
+	"""Adapter answering each request with the next status, or raising the
+	next error, of a sequence.
+	"""
+	def __init__(self, outcomes):
+		super().__init__()
+		self.outcomes = list(outcomes)
+		self.timeouts = []
+
+	def send(self, request, stream=False, timeout=None, **kwargs):
+		self.timeouts.append(timeout)
+		outcome = self.outcomes.pop(0)
+
+		if isinstance(outcome, Exception):
+			raise outcome
+
+		status_code, headers = outcome
+
+		response = requests.Response()
+		response.url = request.url
+		response.request = request
+		response.status_code = status_code
+		response.headers.update(headers)
+		response._content = b''
+		response._content_consumed = True
+
+		return response
+
+	def close(self):
+		pass
+
+
+def hourly_csv(params, now):
+	"""Builds one package per hour between the requested 'from' and 'to',
+	both inclusive, 'to' being now when it's missing.
+	"""
+	to = params.get('to') or now
+	lines = ['header_timestamp;dimension_code;dimension_value'] + [
+		'{0};1;{1}'.format(timestamp, timestamp // 1000)
+		for timestamp in range(params['from'], to + 1, DAY // 24)
+	]
+
+	return '\n'.join(lines)
+
+def minutely_csv(params, now):
+	"""Builds two dimensions per minute, from the requested 'from' on, both
+	inclusive, up to now.
+	"""
+	lines = ['header_timestamp;dimension_code;dimension_value']
+	first = -(-params['from'] // MINUTE) * MINUTE
+
+	for timestamp in range(first, now + 1, MINUTE):
+		lines.append('{0};1;{1}'.format(timestamp, timestamp // MINUTE))
+		lines.append('{0};2;{1}'.format(timestamp, timestamp // MINUTE))
+
+	return '\n'.join(lines)
+
+
+class StubTransport(transport.PortiaTransport):
+	"""Transport whose session answers every request with the same body, or
+	the one a function builds from the request's params and the stub's now,
+	recording the arguments of each request and how many were in flight at
+	most. Requests go through the transport's limiter, but aren't retried.
+	"""
+	def __init__(
+		self,
+		body,
+		now=None,
+		status_code=200,
+		dead_sensors=(),
+		gate=None,
+		delay=0.0
+	):
+		super().__init__(retry=transport.RetryPolicy(attempts=1))
+		self.body = body
+		self.now = now
+		self.status_code = status_code
+		self.dead_sensors = dead_sensors
+		self.gate = gate
+		self.delay = delay
+		self.calls = []
+		self.in_flight = 0
+		self.max_in_flight = 0
+		self.lock = threading.Lock()
+		self.session.request = self.answer
+
+	@property
+	def count(self):
+		return len(self.calls)
+
+	@property
+	def windows(self):
+		return [
+			(call['params']['from'], call['params'].get('to'))
+			for call in self.calls
+		]
+
+	def answer(self, method, url, params=None, **kwargs):
+		params = dict(params or {})
+
+		with self.lock:
+			self.calls.append(
+				{'method': method, 'url': url, 'params': params, **kwargs}
+			)
+			self.in_flight += 1
+			self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+		try:
+			if self.gate is not None:
+				self.gate.wait(5)
+
+			if self.delay > 0:
+				time.sleep(self.delay)
+		finally:
+			with self.lock:
+				self.in_flight -= 1
+
+		body = self.body(params, self.now) if callable(self.body) \
+			else self.body
+
+		response = requests.Response()
+		response.url = url
+		response.status_code = self.status_code
+		response._content = body.encode()
+
+		for sensor in self.dead_sensors:
+			if url.endswith('/sensor/{0}'.format(sensor)):
+				response.status_code = 500
+
+		return response
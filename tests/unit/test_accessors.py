@@ -0,0 +1,88 @@
+"""Unit testing of PortiaPy's accessors module.
+"""
+
+import unittest
+import warnings
+
+import pandas as pd
+
+from portiapy import accessors, portia
+from portiapy.summary import SummaryStrategies
+from tests.unit.helpers import SELECT_CSV, StubTransport
+
+
+# the last package comes from a thing without a name
+UNKNOWN_THING_CSV = SELECT_CSV.replace(';16;', ';999;')
+
+
+class TestAccessors(unittest.TestCase):
+	"""Set of unit tests for the data frame accessors.
+	"""
+	def setUp(self):
+		self.sensor = portia.PortiaApi({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv'
+		}, transport=StubTransport(UNKNOWN_THING_CSV)).device('AAAABBBBCCCC') \
+			.port(1).sensor(2)
+
+	def test_humanize(self):
+		dataframe = self.sensor.select()
+
+		self.assertListEqual(
+			dataframe.portia.humanize()['dimension_thing'] \
+				.astype(object).tolist(),
+			['Sensor_Inobram_T', 'Sensor_Inobram_T', 'Thing Code 999']
+		)
+		self.assertListEqual(
+			dataframe.portia.humanize(locale='pt-br')['dimension'] \
+				.astype(object).tolist(),
+			['Temperatura Pontual', 'Temperatura Pontual', 'Temperatura Média']
+		)
+
+	def test_kept_through_transformations(self):
+		dataframe = self.sensor.select()
+
+		for derived in (
+			dataframe.copy(),
+			dataframe.iloc[1:],
+			dataframe[dataframe['dimension_code'] == 1],
+			pd.concat([dataframe, dataframe], ignore_index=True)
+		):
+			self.assertIn('dimension', derived.portia.humanize().columns)
+
+	def test_summarize(self):
+		summarized = self.sensor.select().portia.summarize(
+			SummaryStrategies.PER_HOUR
+		)
+
+		self.assertListEqual(summarized['number_of_packages'].tolist(), [2, 1])
+		self.assertListEqual(summarized['dimension_code'].tolist(), [1, 2])
+
+	def test_register_once(self):
+		with warnings.catch_warnings():
+			warnings.simplefilter('error')
+			accessors.register()
+			accessors.register()
+
+		self.assertIs(pd.DataFrame.portia, accessors.PortiaAccessor)
+		self.assertFalse(hasattr(pd.DataFrame, 'humanize'))
+		self.assertFalse(hasattr(pd.DataFrame(), 'humanize'))
+
+	def test_deprecated_humanize_method(self):
+		dataframe = self.sensor.select()
+
+		with self.assertWarns(DeprecationWarning):
+			humanized = dataframe.humanize()
+
+		pd.testing.assert_frame_equal(humanized, dataframe.portia.humanize())
+
+	def test_json_not_copied(self):
+		profile = {'ports': []}
+
+		self.assertIs(portia.add_humanize_method(profile), profile)
+
+
+if __name__ == '__main__':
+	unittest.main()
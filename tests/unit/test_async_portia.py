@@ -0,0 +1,136 @@
+"""Unit testing of PortiaPy's async_portia module.
+"""
+
+import asyncio
+import subprocess
+import sys
+import unittest
+
+try:
+	import httpx
+except ImportError:
+	httpx = None
+
+from portiapy import async_portia, summary
+from tests.unit.helpers import DEVICE_SELECT_CSV
+
+
+# a fresh interpreter, so pandas is first imported by the executor's threads
+FRESH_SELECT_SCRIPT = '''
+import asyncio
+from portiapy import async_portia
+from tests.benchmarks.server import MockPortia
+
+async def main(server):
+	async with async_portia.AsyncPortiaApi(server.portia_config()) as api:
+		return await asyncio.gather(*[
+			api.device('AAAABBBBCCCC').port(port).sensor(sensor).select()
+			for port in (0, 1) for sensor in (1, 2) for _ in (0, 1)
+		], return_exceptions=True)
+
+with MockPortia(rows=50, ports=2, sensors=2) as server:
+	print([
+		len(result.index) if hasattr(result, 'index') else repr(result)
+		for result in asyncio.run(main(server))
+	])
+'''
+
+
+@unittest.skipIf(httpx is None, 'httpx is not installed')
+class TestAsyncPortiaApi(unittest.TestCase):
+	"""Set of unit tests for all functions concerning the asynchronous API.
+	"""
+	def setUp(self):
+		self.requests = []
+
+		def handler(request):
+			self.requests.append(request)
+
+			if '/describe/' in request.url.path:
+				return httpx.Response(200, json={'ports': ['0', '1']})
+
+			return httpx.Response(200, text=DEVICE_SELECT_CSV)
+
+		self.transport = async_portia.AsyncPortiaTransport()
+		self.transport.client = httpx.AsyncClient(
+			transport=httpx.MockTransport(handler)
+		)
+		self.portia_api = async_portia.AsyncPortiaApi({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv'
+		}, transport=self.transport)
+
+	def run_coroutine(self, coroutine):
+		return asyncio.run(coroutine)
+
+	def test_select(self):
+		dataframe = self.run_coroutine(
+			self.portia_api.device('AAAABBBBCCCC').port(1).sensor(1).select(
+				params={'from': 1565634000000, 'to': None, 'sort': True}
+			)
+		)
+
+		request = self.requests[0]
+		self.assertEqual(
+			request.url.path, '/select/device/AAAABBBBCCCC/port/1/sensor/1'
+		)
+		self.assertEqual(
+			request.url.query.decode(), 'from=1565634000000&sort=True'
+		)
+		self.assertEqual(request.headers['Authorization'], 'Bearer token')
+		self.assertListEqual(dataframe['port'].tolist(), [1, 1, 1])
+		self.assertEqual(
+			dataframe.portia.humanize().iloc[0]['dimension'],
+			'Point Temperature'
+		)
+
+	def test_summary_and_events_endpoints(self):
+		sensor = self.portia_api.device('AAAABBBBCCCC').port(1).sensor(1)
+
+		self.run_coroutine(sensor.dimension(1).summary(
+			strategy=summary.SummaryStrategies.PER_DAY, interval=2
+		))
+		self.run_coroutine(sensor.dimension(1).event(3).events(last=True))
+		self.run_coroutine(
+			self.portia_api.device('AAAABBBBCCCC').dimension(1).summary(
+				series=[[1, 1]]
+			)
+		)
+
+		self.assertEqual(
+			self.requests[0].url.path,
+			'/summary/device/AAAABBBBCCCC/port/1/sensor/1/dimension/1/perday/2'
+		)
+		self.assertEqual(
+			self.requests[1].url.path,
+			'/events/device/AAAABBBBCCCC/port/1/sensor/1/dimension/1/event/3'
+			'/last'
+		)
+		self.assertEqual(self.requests[2].method, 'POST')
+		self.assertEqual(self.requests[2].content, b'{"series":[[1,1]]}')
+
+	def test_ports(self):
+		ports = self.run_coroutine(
+			self.portia_api.device('AAAABBBBCCCC').ports()
+		)
+
+		self.assertEqual(
+			self.requests[0].url.path, '/describe/device/AAAABBBBCCCC/ports'
+		)
+		self.assertListEqual(ports, [0, 1])
+
+	def test_concurrent_selects_in_fresh_process(self):
+		output = subprocess.run(
+			[sys.executable, '-c', FRESH_SELECT_SCRIPT],
+			capture_output=True,
+			check=True,
+			text=True
+		).stdout.split('\n')
+
+		self.assertEqual(output[0], str([50] * 8))
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,66 @@
+"""Unit testing of PortiaPy's cache module.
+"""
+
+import unittest
+
+from portiapy import cache, describe
+from tests.unit.helpers import FakeClock, StubTransport
+
+
+class TestResponseCache(unittest.TestCase):
+	"""Set of unit tests for all functions concerning the response cache.
+	"""
+	def setUp(self):
+		self.clock = FakeClock()
+		self.transport = StubTransport('{"ports": ["0", "1", "2"]}')
+		self.portia_config = {
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'transport': self.transport,
+			'cache': cache.ResponseCache(
+				ttl={'describe': 60}, maxsize=2, clock=self.clock
+			)
+		}
+
+	def test_key_normalizes_params(self):
+		self.assertEqual(
+			cache.ResponseCache.key(
+				self.portia_config, '/describe', {'b': True, 'a': None}, None
+			),
+			cache.ResponseCache.key(
+				self.portia_config, '/describe', {'b': 'True'}, None
+			)
+		)
+
+	def test_hit_and_expiry(self):
+		ports = describe.device_ports(self.portia_config, 'AAAABBBBCCCC')
+		cached_ports = describe.device_ports(self.portia_config, 'AAAABBBBCCCC')
+
+		self.assertListEqual(ports, cached_ports)
+		self.assertEqual(self.transport.count, 1)
+		self.assertDictEqual(
+			self.portia_config['cache'].stats(),
+			{'hits': 1, 'misses': 1, 'size': 1}
+		)
+
+		self.clock.now = 61
+		describe.device_ports(self.portia_config, 'AAAABBBBCCCC')
+		self.assertEqual(self.transport.count, 2)
+
+	def test_lru_eviction(self):
+		for edge_id in ['AAAABBBBCCCC', 'DDDDEEEEFFFF', 'AAAABBBBCCCC',
+						'GGGGHHHHIIII', 'AAAABBBBCCCC', 'DDDDEEEEFFFF']:
+			describe.device_ports(self.portia_config, edge_id)
+
+		self.assertEqual(len(self.portia_config['cache']), 2)
+		self.assertEqual(self.transport.count, 4)
+
+	def test_uncached_family(self):
+		self.assertFalse(
+			self.portia_config['cache'].caches('/select/device/AAAABBBBCCCC')
+		)
+
+
+if __name__ == '__main__':
+	unittest.main()
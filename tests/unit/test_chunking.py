@@ -0,0 +1,97 @@
+"""Unit testing of PortiaPy's chunking module.
+"""
+
+import unittest
+
+import pandas as pd
+
+from portiapy import chunking, portia
+from tests.unit.helpers import DAY, StubTransport, hourly_csv
+
+
+class TestChunking(unittest.TestCase):
+	"""Set of unit tests for all functions concerning chunked queries.
+	"""
+	def test_split_window_epoch(self):
+		slices = chunking.split_window(
+			{'from': 0, 'to': 10 * DAY, 'precision': 'ms'}, '4d'
+		)
+
+		self.assertListEqual(
+			[(s['from'], s['to']) for s in slices],
+			[(0, 4 * DAY), (4 * DAY, 8 * DAY), (8 * DAY, 10 * DAY)]
+		)
+		self.assertEqual(slices[0]['precision'], 'ms')
+
+	def test_split_window_strings(self):
+		slices = chunking.split_window(
+			{'from': '2021-01-01', 'to': '2021-01-03T12:00:00Z'}, '1d'
+		)
+
+		self.assertListEqual([s['from'] for s in slices], [
+			'2021-01-01T00:00:00+00:00',
+			'2021-01-02T00:00:00+00:00',
+			'2021-01-03T00:00:00+00:00'
+		])
+		self.assertEqual(slices[-1]['to'], '2021-01-03T12:00:00+00:00')
+
+	def test_split_window_epoch_strings(self):
+		slices = chunking.split_window(
+			{'from': '0', 'to': str(3 * DAY // 1000), 'precision': 's'}, '2d'
+		)
+
+		self.assertListEqual(
+			[(s['from'], s['to']) for s in slices],
+			[('0', str(2 * DAY // 1000)), (str(2 * DAY // 1000), '259200')]
+		)
+		self.assertEqual(
+			chunking.to_timestamp('1700000000000'),
+			pd.Timestamp(1700000000000, unit='ms', tz='UTC')
+		)
+
+	def test_split_window_without_from(self):
+		self.assertListEqual(
+			chunking.split_window({'from': None}, '1d'), [{'from': None}]
+		)
+
+	def test_stitch(self):
+		dataframe = chunking.stitch([
+			pd.DataFrame({'header_timestamp': [1, 2, 3], 'value': [1, 2, 3]}),
+			pd.DataFrame({'header_timestamp': [3, 4], 'value': [3, 4]})
+		], {'order': 'desc', 'limit': 3})
+
+		self.assertListEqual(dataframe['header_timestamp'].tolist(), [4, 3, 2])
+
+	def test_stitch_keeps_identical_packages(self):
+		dataframe = chunking.stitch([
+			pd.DataFrame({'header_timestamp': [1, 1, 2, 2], 'value': 0}),
+			pd.DataFrame({'header_timestamp': [2, 2, 3, 3], 'value': 0}),
+			pd.DataFrame({'header_timestamp': [], 'value': []}),
+			pd.DataFrame({'header_timestamp': [3, 4], 'value': 0})
+		], {})
+
+		# identical packages are only dropped when repeated on a boundary
+		self.assertListEqual(
+			dataframe['header_timestamp'].tolist(), [1, 1, 2, 2, 3, 3, 4]
+		)
+
+	def test_chunked_select(self):
+		transport_ = StubTransport(hourly_csv, now=10 * DAY)
+		portia_api = portia.PortiaApi({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv'
+		}, transport=transport_)
+
+		dataframe = portia_api.device('AAAABBBBCCCC').port(1).sensor(1) \
+			.select(params={'from': 0, 'to': 3 * DAY}, chunk='1d')
+
+		self.assertEqual(len(transport_.windows), 3)
+		self.assertEqual(len(dataframe.index), 3 * 24 + 1)
+		self.assertTrue(dataframe['header_timestamp'].is_monotonic_increasing)
+		self.assertTrue(dataframe['header_timestamp'].is_unique)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,140 @@
+"""Unit testing of PortiaPy's fanout module.
+"""
+
+import subprocess
+import sys
+import unittest
+
+try:
+	import pyarrow
+except ImportError:
+	pyarrow = None
+
+from portiapy import fanout, portia
+from tests.unit.helpers import SELECT_CSV, StubTransport
+
+
+# a fresh interpreter, so pandas is first imported by the fanned out threads
+FRESH_SELECT_SCRIPT = '''
+from portiapy import portia, transport
+from tests.benchmarks.server import MockPortia
+
+with MockPortia(rows=50, ports=2, sensors=2) as server:
+	portia_api = portia.PortiaApi(
+		server.portia_config(), transport=transport.PortiaTransport()
+	)
+	results, errors = portia_api.select_many([
+		('AAAABBBBCCCC', port, sensor, dimension)
+		for port in (0, 1) for sensor in (1, 2) for dimension in (1, 2)
+	], max_workers=8)
+
+	print(sorted(len(dataframe.index) for dataframe in results.values()))
+	print(errors)
+'''
+
+
+class TestFanOut(unittest.TestCase):
+	"""Set of unit tests for all functions concerning concurrent queries.
+	"""
+	def setUp(self):
+		self.portia_api = portia.PortiaApi({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv'
+		}, transport=StubTransport(SELECT_CSV, dead_sensors=[2]))
+
+	def test_to_target(self):
+		self.assertEqual(
+			fanout.to_target(('AAAABBBBCCCC', 1, 2)),
+			fanout.Target('AAAABBBBCCCC', 1, 2, None)
+		)
+		self.assertEqual(
+			fanout.to_target({
+				'edge_id': 'AAAABBBBCCCC',
+				'port': 1,
+				'sensor': 2,
+				'dimension_code': 3
+			}),
+			fanout.Target('AAAABBBBCCCC', 1, 2, 3)
+		)
+
+	def test_select_many_collects_errors(self):
+		results, errors = self.portia_api.select_many(
+			[('AAAABBBBCCCC', 1, 1), ('AAAABBBBCCCC', 1, 2)], max_workers=2
+		)
+
+		self.assertListEqual(
+			list(results), [fanout.Target('AAAABBBBCCCC', 1, 1)]
+		)
+		self.assertListEqual(
+			list(errors), [fanout.Target('AAAABBBBCCCC', 1, 2)]
+		)
+		self.assertEqual(
+			results[fanout.Target('AAAABBBBCCCC', 1, 1)].portia.humanize() \
+				.iloc[0]['dimension'],
+			'Point Temperature'
+		)
+
+	def test_summary_many_concat(self):
+		dataframe, errors = self.portia_api.summary_many(
+			[('AAAABBBBCCCC', 1, 1, 1), ('DDDDEEEEFFFF', 3, 1)], concat=True
+		)
+
+		self.assertDictEqual(errors, {})
+		self.assertListEqual(
+			list(dataframe.columns[:3]), ['edge_id', 'port', 'sensor']
+		)
+		self.assertListEqual(
+			dataframe['edge_id'].tolist(),
+			['AAAABBBBCCCC'] * 3 + ['DDDDEEEEFFFF'] * 3
+		)
+		self.assertListEqual(
+			dataframe['dimension_code'].tolist(), [1, 1, 2] * 2
+		)
+
+	def test_concat_leaves_other_results(self):
+		self.portia_api.portia_config['chunksize'] = 2
+
+		results, errors = self.portia_api.select_many(
+			[('AAAABBBBCCCC', 1, 1), ('DDDDEEEEFFFF', 3, 1)], concat=True
+		)
+
+		self.assertDictEqual(errors, {})
+		self.assertListEqual(
+			[len(list(chunks)) for chunks in results.values()], [2, 2]
+		)
+
+		documents = {fanout.Target('AAAABBBBCCCC', 1, 1): {'ports': []}}
+		self.assertIs(fanout.concat_results(documents), documents)
+
+	def test_select_many_in_fresh_process(self):
+		output = subprocess.run(
+			[sys.executable, '-c', FRESH_SELECT_SCRIPT],
+			capture_output=True,
+			check=True,
+			text=True
+		).stdout.split('\n')
+
+		self.assertEqual(output[0], str([50] * 8))
+		self.assertEqual(output[1], '{}')
+
+	@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+	def test_select_many_arrow_concat(self):
+		self.portia_api.portia_config['output'] = 'arrow'
+
+		table, errors = self.portia_api.select_many(
+			[('AAAABBBBCCCC', 1, 1), ('DDDDEEEEFFFF', 3, 1)], concat=True
+		)
+
+		self.assertIsInstance(table, pyarrow.Table)
+		self.assertListEqual(
+			table.column_names[:3], ['edge_id', 'port', 'sensor']
+		)
+		self.assertListEqual(
+			table.column('port').to_pylist(), [1, 1, 1, 3, 3, 3]
+		)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,104 @@
+"""Unit testing of PortiaPy's fleet module.
+"""
+
+import os
+import tempfile
+import unittest
+
+from portiapy import fanout, fleet, portia, transport
+from tests.benchmarks.server import MockPortia
+
+
+class TestFleet(unittest.TestCase):
+	"""Set of unit tests for the topology crawler, against the mock server.
+	"""
+	def setUp(self):
+		self.server = MockPortia(ports=2, sensors=2, dimensions=(1, 2)).start()
+		self.portia_api = portia.PortiaApi(
+			self.server.portia_config(), transport=transport.PortiaTransport()
+		)
+
+	def tearDown(self):
+		self.portia_api.transport.close()
+		self.server.stop()
+
+	def test_crawl(self):
+		fleet_ = self.portia_api.fleet(['AAAABBBBCCCC', 'DDDDEEEEFFFF'])
+
+		self.assertEqual(len(fleet_), 16)
+		self.assertEqual(self.server.requests, 2 + 4 + 8)
+		self.assertListEqual(fleet_.edge_ids, ['AAAABBBBCCCC', 'DDDDEEEEFFFF'])
+		self.assertListEqual(list(fleet_.index.index.names), fleet.INDEX)
+		self.assertListEqual(list(fleet_.index.columns), fleet.COLUMNS)
+		self.assertEqual(
+			fleet_.index.loc[('AAAABBBBCCCC', 1, 2, 2), 'dimension_unity_code'],
+			2
+		)
+		self.assertEqual(fleet_.index.dtypes['dimension_thing_code'], 'int16')
+		self.assertDictEqual(fleet_.errors, {})
+
+	def test_targets(self):
+		fleet_ = self.portia_api.fleet(['AAAABBBBCCCC'])
+
+		targets = fleet_.targets(dimension_code=2, port=[1])
+		self.assertListEqual(targets, [
+			fanout.Target('AAAABBBBCCCC', 1, 1, 2),
+			fanout.Target('AAAABBBBCCCC', 1, 2, 2)
+		])
+		self.assertListEqual(fleet_.targets(dimension=False, port=0), [
+			fanout.Target('AAAABBBBCCCC', 0, 1),
+			fanout.Target('AAAABBBBCCCC', 0, 2)
+		])
+
+		results, errors = self.portia_api.select_many(
+			fleet_.targets(dimension_code=1), last=True
+		)
+		self.assertEqual(len(results), 4)
+		self.assertDictEqual(errors, {})
+
+	def test_refresh(self):
+		fleet_ = self.portia_api.fleet(['AAAABBBBCCCC'])
+		self.server.sensors = 1
+		self.server.dimensions = (1, 2, 3)
+
+		fleet_.refresh()
+
+		# sensor 2 went quiet, so it's kept, while dimension 3 is new
+		self.assertEqual(len(fleet_), 10)
+		self.assertIn(('AAAABBBBCCCC', 1, 1, 3), fleet_.index.index)
+		self.assertIn(('AAAABBBBCCCC', 1, 2, 2), fleet_.index.index)
+		self.assertTrue(fleet_.index.index.is_monotonic_increasing)
+
+		# the mock caches bodies by URL, which the new topology invalidates
+		self.server._bodies.clear()
+		fleet_.crawl(['AAAABBBBCCCC'])
+		self.assertEqual(len(fleet_), 6)
+
+	def test_errors(self):
+		self.server.error_rate = 1.0
+		self.portia_api.transport.retry = transport.RetryPolicy(attempts=1)
+
+		fleet_ = self.portia_api.fleet(['AAAABBBBCCCC'])
+
+		self.assertEqual(len(fleet_), 0)
+		self.assertListEqual(list(fleet_.errors), [('AAAABBBBCCCC',)])
+
+	def test_save_and_load(self):
+		fleet_ = self.portia_api.fleet(['AAAABBBBCCCC'])
+
+		with tempfile.TemporaryDirectory() as directory:
+			for format in ('parquet', 'pickle'):
+				path = os.path.join(directory, 'fleet.' + format)
+				fleet_.save(path, format)
+
+				loaded = fleet.Fleet.load(
+					self.portia_api.portia_config, path, format
+				)
+				self.assertTrue(loaded.index.equals(fleet_.index))
+
+			with self.assertRaises(ValueError):
+				fleet_.save(path, 'csv')
+
+
+if __name__ == '__main__':
+	unittest.main()
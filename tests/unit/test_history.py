@@ -0,0 +1,133 @@
+"""Unit testing of PortiaPy's history module.
+"""
+
+import tempfile
+import unittest
+
+import pandas as pd
+
+from portiapy import history, select, summary
+from tests.unit.helpers import DAY, StubTransport, hourly_csv
+
+
+class TestHistoryCache(unittest.TestCase):
+	"""Set of unit tests for all functions concerning the history cache.
+	"""
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.transport = StubTransport(hourly_csv, now=10 * DAY)
+		self.portia_config = {
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv',
+			'transport': self.transport,
+			'history': history.HistoryCache(
+				self.directory.name,
+				clock=lambda: pd.Timestamp(10 * DAY, unit='ms', tz='UTC')
+			)
+		}
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def select(self, portia_config, params):
+		return select.query_by_port_sensor(
+			portia_config, 'AAAABBBBCCCC', 1, 1, params=params
+		)
+
+	def test_buckets(self):
+		buckets = self.portia_config['history'].buckets(
+			pd.Timestamp(DAY // 2, unit='ms', tz='UTC'),
+			pd.Timestamp(10 * DAY, unit='ms', tz='UTC')
+		)
+
+		self.assertEqual(len(buckets), 8)
+		self.assertEqual(buckets[0], pd.Timestamp(0, tz='UTC'))
+
+	def test_rerun_fetches_tail_only(self):
+		params = {'from': DAY // 2, 'to': 9 * DAY, 'precision': 'ms'}
+
+		dataframe = self.select(self.portia_config, params)
+		self.assertEqual(len(self.transport.windows), 9)
+
+		self.transport.calls = []
+		cached_dataframe = self.select(self.portia_config, params)
+		self.assertListEqual(self.transport.windows, [(8 * DAY, 9 * DAY)])
+
+		expected = self.select({**self.portia_config, 'history': None}, params)
+		pd.testing.assert_frame_equal(dataframe, expected)
+		pd.testing.assert_frame_equal(cached_dataframe, expected)
+
+	def test_order_and_limit(self):
+		dataframe = self.select(self.portia_config, {
+			'from': 0, 'to': 9 * DAY, 'order': 'desc', 'limit': 5
+		})
+
+		self.assertListEqual(
+			dataframe['header_timestamp'].tolist(),
+			[9 * DAY - hour * DAY // 24 for hour in range(5)]
+		)
+
+	def test_pickle_format(self):
+		self.portia_config['history'] = history.HistoryCache(
+			self.directory.name,
+			format='pickle',
+			clock=self.portia_config['history'].clock
+		)
+		params = {'from': 0, 'to': 3 * DAY}
+
+		self.select(self.portia_config, params)
+		self.transport.calls = []
+		self.select(self.portia_config, params)
+
+		self.assertListEqual(self.transport.windows, [])
+
+	def test_uncacheable_summaries(self):
+		for strategy, params in [
+			(summary.SummaryStrategies.PER_MONTH, {'from': 0}),
+			(summary.SummaryStrategies.PER_HOUR,
+				{'from': 0, 'timezone': 'America/Sao_Paulo'})
+		]:
+			self.transport.calls = []
+			summary.query_by_port_sensor(
+				self.portia_config, 'AAAABBBBCCCC', 1, 1, strategy, 1, params
+			)
+			self.assertListEqual(self.transport.windows, [(0, None)])
+
+	def test_filled_summaries_are_uncached(self):
+		params = {'from': 0, 'to': 3 * DAY, 'fill': 'previous'}
+
+		def summarize(portia_config):
+			return summary.query_by_port_sensor(
+				portia_config, 'AAAABBBBCCCC', 1, 1,
+				summary.SummaryStrategies.PER_HOUR, 1, params
+			)
+
+		cached = summarize(self.portia_config)
+		self.assertListEqual(self.transport.windows, [(0, 3 * DAY)])
+
+		pd.testing.assert_frame_equal(
+			cached, summarize({**self.portia_config, 'history': None})
+		)
+
+	def test_configurations_have_own_buckets(self):
+		params = {'from': 0, 'to': 3 * DAY}
+
+		for portia_config in (
+			self.portia_config,
+			{**self.portia_config, 'baseurl': 'http://other'},
+			{**self.portia_config, 'authorization': 'other'},
+			{**self.portia_config, 'float32': True}
+		):
+			self.transport.calls = []
+			self.select(portia_config, params)
+			self.assertEqual(len(self.transport.windows), 3)
+
+		self.transport.calls = []
+		self.select(self.portia_config, params)
+		self.assertListEqual(self.transport.windows, [])
+
+
+if __name__ == '__main__':
+	unittest.main()
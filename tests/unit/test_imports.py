@@ -0,0 +1,105 @@
+"""Unit testing of PortiaPy's imports, guarding heavy dependencies from
+being loaded before they're needed. How long imports take is profiled by the
+Makefile's import-time target instead.
+"""
+
+import json
+import subprocess
+import sys
+import unittest
+
+
+HEAVY_MODULES = ('arrow', 'numpy', 'pandas', 'plotly', 'pyarrow')
+
+CONVERSION_SCRIPT = '''
+import requests
+from portiapy import fanout, utils
+
+def convert(i):
+	response = requests.Response()
+	response.status_code = 200
+	response._content = b'header_timestamp;dimension_value\\n1;2.5\\n'
+	return utils.convert_csv({{'debug': False}}, response)
+
+results, errors = fanout.fan_out(convert, range({0}), {0})
+print(sum(len(dataframe.index) for dataframe in results.values()))
+print(len(errors))
+'''
+
+IMPORT_SCRIPT = '''
+import json
+import sys
+import types
+
+{0}
+
+print(json.dumps({{'loaded': [
+	name for name in {1!r}
+	if type(sys.modules.get(name)) is types.ModuleType
+]}}))
+'''
+
+
+def run_script(statements):
+	"""Runs statements in a fresh interpreter, returning the heavy modules
+	they loaded.
+	"""
+	output = subprocess.run(
+		[sys.executable, '-c', IMPORT_SCRIPT.format(statements, HEAVY_MODULES)],
+		capture_output=True,
+		check=True,
+		text=True
+	).stdout
+
+	return json.loads(output.splitlines()[-1])['loaded']
+
+
+class TestImports(unittest.TestCase):
+	"""Set of unit tests for all functions concerning lazy imports.
+	"""
+	def test_import_loads_no_heavy_module(self):
+		self.assertListEqual(run_script('import portiapy.portia'), [])
+
+	def test_describe_loads_no_heavy_module(self):
+		loaded = run_script('\n'.join([
+			'import requests',
+			'from portiapy import describe, transport',
+			'class JsonTransport(transport.PortiaTransport):',
+			'	def request(self, *args, **kwargs):',
+			'		response = requests.Response()',
+			'		response.status_code = 200',
+			'		response._content = b\'{"ports": ["1", "2"]}\'',
+			'		return response',
+			'describe.device_ports({',
+			'	"baseurl": "http://localhost",',
+			'	"authorization": "token",',
+			'	"debug": False,',
+			'	"transport": JsonTransport()',
+			'}, "AAAABBBBCCCC")'
+		]))
+
+		self.assertListEqual(loaded, [])
+
+	def test_concurrent_first_use(self):
+		for _ in range(3):
+			output = subprocess.run(
+				[sys.executable, '-c', CONVERSION_SCRIPT.format(16)],
+				capture_output=True,
+				check=True,
+				text=True
+			).stdout.split('\n')
+
+			# every thread waits for pandas, none sees it half-imported
+			self.assertListEqual(output[:2], ['16', '0'])
+
+	def test_moved_helpers(self):
+		loaded = run_script('\n'.join([
+			'from portiapy import utils',
+			'utils.plot_selection_from_dataframes'
+		]))
+
+		self.assertIn('plotly', loaded)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,175 @@
+"""Unit testing of PortiaPy's limiter module.
+"""
+
+import asyncio
+import os
+import tempfile
+import unittest
+
+from portiapy import fanout, limiter, transport, utils
+from tests.unit.helpers import FakeClock, SequenceAdapter, StubTransport
+
+
+class TestRateLimiter(unittest.TestCase):
+	"""Set of unit tests for all functions concerning the rate limiter.
+	"""
+	def setUp(self):
+		self.clock = FakeClock(1000.0)
+		self.directory = tempfile.TemporaryDirectory()
+		self.path = os.path.join(self.directory.name, 'limiter')
+
+	def tearDown(self):
+		self.directory.cleanup()
+
+	def test_token_bucket(self):
+		limiter_ = limiter.RateLimiter(
+			rate=2, burst=2, clock=self.clock, sleep=self.clock.sleep
+		)
+
+		for _ in range(4):
+			with limiter_:
+				pass
+
+		self.assertListEqual(self.clock.sleeps, [0.5, 0.5])
+
+	def test_invalid_arguments(self):
+		for arguments in (
+			{'rate': 0},
+			{'rate': -1},
+			{'rate': 1, 'burst': 0},
+			{'max_in_flight': 0}
+		):
+			with self.assertRaises(ValueError):
+				limiter.RateLimiter(**arguments)
+
+	def test_max_in_flight(self):
+		transport_ = StubTransport('', delay=0.02)
+		portia_config = {
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'transport': transport_,
+			'limiter': limiter.RateLimiter(max_in_flight=2)
+		}
+
+		results, errors = fanout.fan_out(
+			lambda index: utils.http_get_request(portia_config, '/describe'),
+			range(6),
+			max_workers=6
+		)
+
+		self.assertEqual(len(results), 6)
+		self.assertEqual(transport_.max_in_flight, 2)
+
+	def test_tokens_shared_through_file(self):
+		first = limiter.RateLimiter(
+			rate=1, burst=1, path=self.path, clock=self.clock,
+			sleep=self.clock.sleep
+		)
+		second = limiter.RateLimiter(
+			rate=1, burst=1, path=self.path, clock=self.clock,
+			sleep=self.clock.sleep
+		)
+
+		first.acquire()
+		second.acquire()
+
+		self.assertListEqual(self.clock.sleeps, [1.0])
+
+	def test_slots_shared_through_file(self):
+		first = limiter.RateLimiter(max_in_flight=1, path=self.path)
+		second = limiter.RateLimiter(max_in_flight=1, path=self.path)
+
+		slot = first.acquire()
+		self.assertIsNone(second._take_slot())
+
+		first.release(slot)
+		slot = second._take_slot()
+		self.assertIsNotNone(slot)
+		second.release(slot)
+
+	def test_slots_of_interleaved_tasks(self):
+		limiter_ = limiter.RateLimiter(max_in_flight=2, path=self.path)
+		other = limiter.RateLimiter(max_in_flight=2, path=self.path)
+
+		async def hold(entered, leave):
+			async with limiter_:
+				entered.set()
+				await leave.wait()
+
+		async def interleave():
+			events = [asyncio.Event() for _ in range(4)]
+			tasks = [
+				asyncio.create_task(hold(events[0], events[1])),
+				asyncio.create_task(hold(events[2], events[3]))
+			]
+			await events[0].wait()
+			await events[2].wait()
+
+			# the first task leaves while the second one still holds its slot
+			events[1].set()
+			await tasks[0]
+			slot = other._take_slot()
+
+			events[3].set()
+			await tasks[1]
+
+			return slot
+
+		slot = asyncio.run(interleave())
+
+		self.assertTrue(slot.name.endswith('.slot0'))
+		other.release(slot)
+
+	def test_token_per_attempt(self):
+		transport_ = transport.PortiaTransport(retry=transport.RetryPolicy(
+			sleep=self.clock.sleep, clock=self.clock
+		))
+		transport_.session.mount('http://', SequenceAdapter([
+			(503, {'Retry-After': '0'}), (200, {})
+		]))
+
+		response = utils.http_get_request({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'transport': transport_,
+			'limiter': limiter.RateLimiter(
+				rate=1, burst=1, clock=self.clock, sleep=self.clock.sleep
+			)
+		}, '/describe')
+
+		# the retry waits for Retry-After, then for a new token
+		self.assertEqual(response.status_code, 200)
+		self.assertListEqual(self.clock.sleeps, [0.0, 1.0])
+
+	def test_streamed_response_keeps_its_slot(self):
+		limiter_ = limiter.RateLimiter(max_in_flight=1)
+		transport_ = transport.PortiaTransport()
+		transport_.session.mount('http://', SequenceAdapter([(200, {})]))
+
+		response = utils.http_get_request({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'transport': transport_,
+			'limiter': limiter_
+		}, '/select', stream=True)
+
+		self.assertIsNone(limiter_._take_slot())
+
+		response.close()
+		slot = limiter_._take_slot()
+		self.assertIsNotNone(slot)
+		limiter_.release(slot)
+
+	def test_for_token(self):
+		self.assertIs(
+			limiter.for_token('token', rate=10),
+			limiter.for_token('token', rate=20)
+		)
+		self.assertIsNot(
+			limiter.for_token('token', rate=10),
+			limiter.for_token('other token', rate=10)
+		)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,210 @@
+"""Unit testing of PortiaPy's metrics module.
+"""
+
+import unittest
+import warnings
+from contextlib import redirect_stdout
+from io import StringIO
+
+import requests
+
+try:
+	from opentelemetry.sdk.trace import TracerProvider
+	from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+	from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+		InMemorySpanExporter
+	)
+except ImportError:
+	TracerProvider = None
+
+from portiapy import metrics, portia, transport, utils
+from tests.unit.helpers import SELECT_CSV, StubTransport
+
+
+def build_response(status_code):
+	response = requests.Response()
+	response.status_code = status_code
+	response._content = b''
+	response._content_consumed = True
+
+	return response
+
+
+class TestMetrics(unittest.TestCase):
+	"""Set of unit tests for all functions concerning instrumentation.
+	"""
+	def setUp(self):
+		self.events = []
+		self.portia_config = {
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv',
+			'metrics': self.events.append
+		}
+		self.sensor = portia.PortiaApi(
+			self.portia_config, transport=StubTransport(SELECT_CSV)
+		).device('AAAABBBBCCCC').port(1).sensor(2)
+
+	def test_labels(self):
+		self.assertDictEqual(
+			metrics.labels('/select/device/AAAABBBBCCCC/port/1/sensor/2'),
+			{'family': 'select', 'edge_id': 'AAAABBBBCCCC'}
+		)
+		self.assertDictEqual(
+			metrics.labels('/summary/dimension/1/perhour/1'),
+			{'family': 'summary', 'edge_id': None}
+		)
+
+	def test_request_and_parse_events(self):
+		self.sensor.select()
+
+		request, parse = self.events
+		self.assertEqual(request['event'], 'request')
+		self.assertEqual(request['family'], 'select')
+		self.assertEqual(request['edge_id'], 'AAAABBBBCCCC')
+		self.assertEqual(request['status'], 200)
+		self.assertEqual(request['retries'], 0)
+		self.assertGreaterEqual(request['seconds'], 0)
+
+		self.assertEqual(parse['event'], 'parse')
+		self.assertEqual(parse['format'], 'csv')
+		self.assertEqual(parse['family'], 'select')
+		self.assertEqual(parse['rows'], 3)
+		self.assertEqual(parse['decoded'], len(SELECT_CSV))
+
+	def test_debug_prints(self):
+		output = StringIO()
+
+		with redirect_stdout(output):
+			self.sensor.portia_config['debug'] = True
+			self.sensor.select()
+
+		lines = output.getvalue().splitlines()
+		self.assertTrue(lines[0].startswith('[portia-debug]: status: 200 | '))
+		self.assertEqual(lines[1], '[portia-debug]: 3 rows')
+
+	def test_debug_prints_errors_and_documents(self):
+		class FailingTransport(transport.PortiaTransport):
+			def request(self, *args, **kwargs):
+				raise requests.ConnectionError('reset')
+
+		self.portia_config['debug'] = True
+		device = portia.PortiaApi(
+			self.portia_config, transport=StubTransport('{"ports": ["1"]}')
+		).device('AAAABBBBCCCC')
+		failing = portia.PortiaApi(
+			self.portia_config, transport=FailingTransport()
+		).device('AAAABBBBCCCC')
+		output = StringIO()
+
+		with redirect_stdout(output), warnings.catch_warnings():
+			warnings.simplefilter('error')
+			device.ports()
+
+			with self.assertRaises(requests.ConnectionError):
+				failing.ports()
+
+		lines = output.getvalue().splitlines()
+		self.assertEqual(lines[1], "[portia-debug]: ['1']")
+		self.assertTrue(
+			lines[2].startswith('[portia-debug]: status: ConnectionError | ')
+		)
+		self.assertEqual(self.events[1]['event'], 'document')
+		self.assertEqual(self.events[1]['family'], 'describe')
+
+	def test_failing_sink(self):
+		def fail(event):
+			raise RuntimeError('down')
+
+		self.sensor.portia_config['metrics'] = [fail, self.events.append]
+
+		with self.assertWarns(UserWarning):
+			dataframe = self.sensor.select()
+
+		self.assertEqual(len(dataframe.index), 3)
+		self.assertEqual(len(self.events), 2)
+
+	def test_registered_sink_and_humanize(self):
+		events = []
+		metrics.register(events.append)
+
+		try:
+			utils.humanize_dataframe(self.sensor.select())
+		finally:
+			metrics.unregister(events.append)
+
+		self.assertListEqual(
+			[event['event'] for event in events],
+			['request', 'parse', 'humanize']
+		)
+		self.assertEqual(events[-1]['rows'], 3)
+
+	def test_retries(self):
+		responses = iter([build_response(503), build_response(200)])
+		policy = transport.RetryPolicy(sleep=lambda seconds: None)
+
+		response = policy.call('GET', lambda timeout: next(responses))
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(response.portia_attempts, 2)
+
+	def test_stats_sink(self):
+		stats = metrics.StatsSink(buckets=(0.1, 1))
+		stats({'event': 'request', 'family': 'select', 'edge_id': 'A',
+			   'status': 200, 'seconds': 0.05})
+		stats({'event': 'request', 'family': 'select', 'edge_id': 'A',
+			   'status': 200, 'seconds': 0.5, 'retries': 1})
+		stats({'event': 'request', 'family': 'describe', 'edge_id': 'B',
+			   'status': 500, 'seconds': 2})
+
+		self.assertListEqual(
+			stats.hot_spots(by='edge_id'), [('B', 2.0, 1), ('A', 0.55, 2)]
+		)
+
+		exposition = stats.exposition()
+		self.assertIn(
+			'portia_request_seconds_bucket{family="select",edge_id="A",'
+			'status="200",le="0.1"} 1', exposition
+		)
+		self.assertIn(
+			'portia_request_seconds_bucket{family="select",edge_id="A",'
+			'status="200",le="+Inf"} 2', exposition
+		)
+		self.assertIn(
+			'portia_request_errors_total{family="describe",edge_id="B",'
+			'status="500"} 1', exposition
+		)
+
+	def test_logging_sink(self):
+		with self.assertLogs('portiapy', 'INFO') as logs:
+			metrics.LoggingSink()({
+				'event': 'request', 'timestamp': 0, 'status': 200
+			})
+
+		self.assertEqual(
+			logs.records[0].getMessage(), 'portia request status=200'
+		)
+		self.assertEqual(logs.records[0].portia['status'], 200)
+
+	@unittest.skipIf(TracerProvider is None, 'opentelemetry-sdk is missing')
+	def test_opentelemetry_sink(self):
+		exporter = InMemorySpanExporter()
+		provider = TracerProvider()
+		provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+		self.sensor.portia_config['metrics'] = metrics.OpenTelemetrySink(
+			provider.get_tracer('test')
+		)
+		self.sensor.select()
+
+		request, parse = exporter.get_finished_spans()
+		self.assertEqual(request.name, 'portia.request')
+		self.assertEqual(request.attributes['http.response.status_code'], 200)
+		self.assertEqual(request.attributes['portia.family'], 'select')
+		self.assertEqual(parse.attributes['portia.rows'], 3)
+		self.assertLessEqual(request.start_time, request.end_time)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,154 @@
+"""Unit testing of the mock Portia server used by the benchmarks.
+"""
+
+import socket
+import struct
+import tempfile
+import time
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+
+from portiapy import describe, events, profile, select, summary, transport
+from tests.benchmarks.server import MockPortia, parse_route, record
+
+
+class TestMockPortia(unittest.TestCase):
+	"""Set of unit tests for the mock server, queried through the client.
+	"""
+	def setUp(self):
+		self.server = MockPortia(rows=100).start()
+		self.portia_config = self.server.portia_config(
+			transport=transport.PortiaTransport()
+		)
+
+	def tearDown(self):
+		self.portia_config['transport'].close()
+		self.server.stop()
+
+	def test_parse_route(self):
+		self.assertDictEqual(
+			parse_route('/summary/device/AAAABBBBCCCC/port/1/sensor/2/perhour/1'),
+			{
+				'family': 'summary',
+				'last': False,
+				'device': 'AAAABBBBCCCC',
+				'port': '1',
+				'sensor': '2',
+				'strategy': 'perhour',
+				'interval': 1
+			}
+		)
+		self.assertDictEqual(
+			parse_route('/describe/device/AAAABBBBCCCC/port/1/sensors/last'),
+			{
+				'family': 'describe',
+				'last': True,
+				'device': 'AAAABBBBCCCC',
+				'port': '1',
+				'listing': 'sensors'
+			}
+		)
+
+	def test_select(self):
+		dataframe = select.query_by_port_sensor(
+			self.portia_config, 'AAAABBBBCCCC', 1, 2, params={
+				'from': None, 'to': None, 'precision': 'ms'
+			}
+		)
+		self.assertEqual(len(dataframe.index), 100)
+		self.assertTrue(dataframe['header_timestamp'].is_monotonic_increasing)
+		self.assertListEqual(dataframe['sensor'].unique().tolist(), [2])
+
+		window = select.query_by_port_sensor_dimension(
+			self.portia_config, 'AAAABBBBCCCC', 1, 2, 1, params={
+				'from': 1609458600, 'to': 1609459200, 'precision': 's'
+			}
+		)
+		self.assertEqual(len(window.index), 11)
+		self.assertListEqual(window['dimension_code'].unique().tolist(), [1])
+
+	def test_summary_and_events(self):
+		summarized = summary.query_by_port_sensor(
+			self.portia_config, 'AAAABBBBCCCC', 1, 1, params={
+				'avg': True, 'max': True, 'limit': 10
+			}
+		)
+		self.assertEqual(len(summarized.index), 10)
+		self.assertIn('avg', summarized.columns)
+		self.assertNotIn('min', summarized.columns)
+
+		events_ = events.query_by_port_sensor(
+			self.portia_config, 'AAAABBBBCCCC', 1, 1, last=True
+		)
+		self.assertEqual(len(events_.index), 1)
+		self.assertIn('event_code', events_.columns)
+
+	def test_describe_and_profile(self):
+		self.assertListEqual(
+			describe.device_ports(self.portia_config, 'AAAABBBBCCCC'),
+			[0, 1, 2, 3]
+		)
+
+		dimensions = describe.device_port_sensor_dimensions(
+			self.portia_config, 'AAAABBBBCCCC', 1, 1, last=True
+		)
+		self.assertListEqual(dimensions['dimension_code'].tolist(), [1, 2])
+
+		device = profile.device_profile(self.portia_config, 'AAAABBBBCCCC')
+		self.assertEqual(device.get('device'), 'AAAABBBBCCCC')
+		self.assertEqual(len(device.get('ports')), 4)
+
+	def test_errors(self):
+		self.server.error_rate = 1.0
+		self.portia_config['transport'].retry = transport.RetryPolicy(
+			attempts=1
+		)
+
+		with self.assertRaises(Exception):
+			describe.device_ports(self.portia_config, 'AAAABBBBCCCC')
+
+		self.assertEqual(self.server.errors, 1)
+
+	def test_reset_connections_are_silent(self):
+		output = StringIO()
+		self.server.latency = 0.1
+
+		with redirect_stderr(output):
+			for _ in range(2):
+				connection = socket.create_connection(
+					('127.0.0.1', self.server._server.server_port)
+				)
+				# resets the connection on close, before the response is sent
+				connection.setsockopt(
+					socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0)
+				)
+				connection.sendall(
+					b'GET /describe/device/AAAABBBBCCCC/ports HTTP/1.1\r\n'
+					b'Host: localhost\r\n\r\n'
+				)
+				connection.close()
+
+			time.sleep(0.3)
+
+		self.assertEqual(output.getvalue(), '')
+
+	def test_record_fixtures(self):
+		endpoint = '/select/device/AAAABBBBCCCC/port/1/sensor/1'
+
+		with tempfile.TemporaryDirectory() as directory:
+			record(self.portia_config, endpoint, directory, {'limit': 5})
+
+			with MockPortia(rows=1, fixtures=directory) as replay:
+				dataframe = select.query_by_port_sensor(
+					replay.portia_config(transport=self.portia_config[
+						'transport'
+					]),
+					'AAAABBBBCCCC', 1, 1, params={'limit': 5}
+				)
+
+		self.assertEqual(len(dataframe.index), 5)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,203 @@
+"""Unit testing of PortiaPy's plotting module.
+"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objs as plotlygo
+
+try:
+	import ipywidgets
+except ImportError:
+	ipywidgets = None
+
+from portiapy import plotting
+
+
+def build_selection(rows):
+	"""Builds a select's series of a sine wave, with a spike in the middle.
+	"""
+	values = np.sin(np.linspace(0, 20, rows))
+	values[rows // 2] = 10
+
+	return pd.DataFrame({
+		'header_timestamp': 1609459200000 + np.arange(rows) * 60000,
+		'dimension_code': 1,
+		'dimension_value': values
+	})
+
+
+class TestDownsampling(unittest.TestCase):
+	"""Set of unit tests for the downsampling algorithms.
+	"""
+	def setUp(self):
+		self.selection = build_selection(100000)
+		self.x = self.selection['header_timestamp'].to_numpy()
+		self.y = self.selection['dimension_value'].to_numpy()
+
+	def test_lttb(self):
+		positions = plotting.lttb(self.x, self.y, 1000)
+
+		self.assertEqual(len(positions), 1000)
+		self.assertEqual(positions[0], 0)
+		self.assertEqual(positions[-1], 99999)
+		self.assertTrue((np.diff(positions) > 0).all())
+		self.assertIn(50000, positions)
+
+	def test_min_max(self):
+		positions = plotting.min_max(self.x, self.y, 1000)
+
+		self.assertLessEqual(len(positions), 1002)
+		self.assertIn(50000, positions)
+		self.assertAlmostEqual(self.y[positions].min(), self.y.min())
+		self.assertTrue((np.diff(positions) > 0).all())
+
+	def test_small_series_are_kept(self):
+		for method in plotting.DOWNSAMPLERS.values():
+			self.assertListEqual(
+				method(self.x[:10], self.y[:10], 100).tolist(), list(range(10))
+			)
+
+	def test_downsample(self):
+		y = self.y.copy()
+		y[:50] = np.nan
+
+		positions = plotting.downsample(self.x, y, 500, 'minmax')
+		self.assertGreaterEqual(positions.min(), 50)
+
+		self.assertEqual(len(plotting.downsample(self.x, y, None)), 99950)
+
+		with self.assertRaises(ValueError):
+			plotting.downsample(self.x, self.y, 500, 'average')
+
+	def test_resample(self):
+		start, end = self.x[1000], self.x[1999]
+		x, y = plotting.resample(self.x, self.y, start, end, 5000)
+
+		# every point within the range, plus one on each side
+		self.assertEqual(len(x), 1002)
+		self.assertEqual(x[1], start)
+		self.assertEqual(x[-2], end)
+
+
+class TestFigures(unittest.TestCase):
+	"""Set of unit tests for the figures' builders.
+	"""
+	def test_selection_figure(self):
+		selection = build_selection(100000)
+		figure = plotting.build_selection_figure(
+			[selection, build_selection(100)], max_points=2000
+		)
+
+		self.assertIsInstance(figure.data[0], plotlygo.Scatter)
+		self.assertEqual(len(figure.data[0].x), 2000)
+		self.assertEqual(len(figure.data[1].x), 100)
+		self.assertEqual(figure.data[0].y.max(), 10)
+		self.assertEqual(selection['header_timestamp'].dtype, 'int64')
+
+		webgl = plotting.build_selection_figure(
+			[selection], max_points=None, webgl_threshold=5000
+		)
+		self.assertIsInstance(webgl.data[0], plotlygo.Scattergl)
+
+	def test_frame_axis_cache(self):
+		selection = build_selection(1000).iloc[::-1]
+		columns = list(selection.columns)
+
+		axis = plotting.frame_axis(selection)
+		self.assertTrue((np.diff(axis['milliseconds']) > 0).all())
+		self.assertIs(plotting.frame_axis(selection), axis)
+
+		first = plotting.build_figure([selection], max_points=None)
+		second = plotting.build_figure([selection], max_points=None)
+		self.assertTrue((first.data[0].x == second.data[0].x).all())
+		self.assertIn('Etc/GMT-3', axis['datetimes'])
+		self.assertListEqual(list(selection.columns), columns)
+		self.assertEqual(selection['header_timestamp'].iat[0], 1609519140000)
+
+		selection['header_timestamp'] = selection['header_timestamp'] + 60000
+		self.assertIsNot(plotting.frame_axis(selection), axis)
+		self.assertEqual(
+			plotting.frame_axis(selection)['milliseconds'][0], 1609459260000
+		)
+
+	def test_long_frame(self):
+		selection = pd.concat([
+			build_selection(500).assign(sensor=sensor, dimension_code=code)
+			for sensor in (2, 1) for code in (1, 2)
+		]).sample(frac=1, random_state=0)
+
+		figure = plotting.build_figure(selection, max_points=100)
+
+		self.assertEqual(len(figure.data), 4)
+		self.assertListEqual(
+			[trace.name for trace in figure.data], ['1 1', '1 2', '2 1', '2 2']
+		)
+		for trace in figure.data:
+			self.assertEqual(len(trace.x), 100)
+			self.assertTrue(pd.DatetimeIndex(trace.x).is_monotonic_increasing)
+
+	def test_frame_axis_keys_cache(self):
+		selection = pd.concat([
+			build_selection(10).assign(sensor=sensor) for sensor in (1, 2)
+		], ignore_index=True)
+
+		axis = plotting.frame_axis(selection, ['sensor'])
+		self.assertIs(plotting.frame_axis(selection, ['sensor']), axis)
+
+		selection['sensor'] = 3 - selection['sensor']
+		self.assertIsNot(plotting.frame_axis(selection, ['sensor']), axis)
+
+		selection['sensor'] = pd.Categorical(selection['sensor'])
+		axis = plotting.frame_axis(selection, ['sensor'])
+		self.assertIs(plotting.frame_axis(selection, ['sensor']), axis)
+
+	def test_summary_figure(self):
+		summary = pd.DataFrame({
+			'header_timestamp': 1609459200000 + np.arange(48) * 3600000,
+			'number_of_packages': 60,
+			'max': 2.0,
+			'avg': 1.0,
+			'min': 0.0
+		})
+
+		figure = plotting.build_figure([summary])
+		self.assertListEqual(
+			[trace.name for trace in figure.data],
+			['Packages', 'Max', 'Avg', 'Min']
+		)
+		self.assertIsInstance(figure.data[0], plotlygo.Bar)
+		self.assertEqual(figure.data[1].yaxis, 'y2')
+
+		figure = plotting.build_figure({'sensor': summary, 'copy': summary})
+		self.assertEqual(figure.data[4].name, 'copy Packages')
+
+	def test_range_milliseconds(self):
+		self.assertEqual(
+			plotting.to_range_milliseconds('2021-01-01 00:01:00.5'),
+			1609459260500
+		)
+
+	@unittest.skipIf(ipywidgets is None, 'ipywidgets is missing')
+	def test_selection_widget(self):
+		fetched = []
+
+		def fetch(index, start, end):
+			fetched.append((index, start, end))
+			return build_selection(100)
+
+		widget = plotting.plot_selection_widget(
+			[build_selection(100000)], max_points=1000, fetch=fetch
+		)
+		self.assertEqual(len(widget.data[0].x), 1000)
+
+		widget.layout.xaxis.range = [
+			'2021-01-01 00:00:00', '2021-01-01 01:00:00'
+		]
+		self.assertListEqual(fetched, [(0, 1609459200000, 1609462800000)])
+		self.assertEqual(len(widget.data[0].x), 62)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,75 @@
+"""Unit testing of PortiaPy's poller module.
+"""
+
+import unittest
+
+import pandas as pd
+
+from portiapy import poller, portia
+from tests.unit.helpers import MINUTE, StubTransport, minutely_csv
+
+
+class TestPoller(unittest.TestCase):
+	"""Set of unit tests for all functions concerning incremental polling.
+	"""
+	def setUp(self):
+		self.transport = StubTransport(minutely_csv, now=10 * MINUTE)
+		self.received = []
+		self.poller = portia.PortiaApi({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv'
+		}, transport=self.transport).device('AAAABBBBCCCC').port(1).sensor(1) \
+			.poller(since=0, max_age='5min', callback=self.received.append)
+
+	def test_polls_only_the_delta(self):
+		first = self.poller.poll()
+		self.assertEqual(len(first.index), 2 * 11)
+
+		self.transport.now = 12 * MINUTE
+		second = self.poller.poll()
+
+		self.assertEqual(
+			self.transport.calls[-1]['params']['from'], 10 * MINUTE
+		)
+		self.assertListEqual(
+			second['header_timestamp'].tolist(),
+			[11 * MINUTE] * 2 + [12 * MINUTE] * 2
+		)
+		self.assertEqual(len(self.received), 2)
+
+	def test_empty_poll(self):
+		self.poller.poll()
+		self.assertEqual(len(self.poller.poll().index), 0)
+		self.assertEqual(len(self.received), 1)
+
+	def test_buffer_max_age(self):
+		self.poller.poll()
+		self.transport.now = 20 * MINUTE
+		self.poller.poll()
+
+		self.assertEqual(
+			self.poller.buffer['header_timestamp'].min(), 15 * MINUTE
+		)
+		self.assertTrue(self.poller.buffer['header_timestamp'] \
+			.is_monotonic_increasing)
+
+	def test_stream(self):
+		polls = list(self.poller.stream(interval=0, count=3))
+
+		self.assertEqual(len(polls), 3)
+		self.assertEqual(len(self.transport.windows), 3)
+
+	def test_default_since(self):
+		standalone = poller.Poller(
+			lambda params: None,
+			max_age='1min',
+			clock=lambda: pd.Timestamp(2 * MINUTE, unit='ms', tz='UTC')
+		)
+
+		self.assertEqual(standalone.since, MINUTE)
+
+
+if __name__ == '__main__':
+	unittest.main()
@@ -0,0 +1,117 @@
+"""Unit testing of PortiaPy's portia module.
+"""
+
+import pickle
+import unittest
+
+from portiapy import cache, limiter, portia, transport
+
+
+class TestEdgeHandles(unittest.TestCase):
+	"""Set of unit tests for the handles of the device tree.
+	"""
+	def setUp(self):
+		self.portia_api = portia.PortiaApi({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv'
+		})
+
+	def test_memoized_children(self):
+		sensor = self.portia_api.device('AAAABBBBCCCC').port(1).sensor(2)
+
+		self.assertIs(
+			self.portia_api.device('AAAABBBBCCCC').port(1).sensor(2), sensor
+		)
+		self.assertIs(
+			sensor.dimension(1).event(3), sensor.dimension(1).event(3)
+		)
+		self.assertIsNot(sensor.dimension(1), sensor.dimension(2))
+		self.assertTupleEqual(sensor.key, ('AAAABBBBCCCC', 1, 2))
+
+	def test_immutable_and_slotted(self):
+		port = self.portia_api.device('AAAABBBBCCCC').port(1)
+
+		with self.assertRaises(AttributeError):
+			port.port = 2
+
+		with self.assertRaises(AttributeError):
+			port.extra = True
+
+		self.assertFalse(hasattr(port, '__dict__'))
+
+	def test_hashable(self):
+		portia_config = self.portia_api.portia_config
+		sensor = portia.EdgeDeviceSensor(
+			portia.EdgeDevicePort(
+				portia.EdgeDevice('AAAABBBBCCCC', portia_config),
+				1,
+				portia_config
+			),
+			2,
+			portia_config
+		)
+		same = self.portia_api.device('AAAABBBBCCCC').port(1).sensor(2)
+
+		self.assertEqual(sensor, same)
+		self.assertEqual(len({sensor, same}), 1)
+		self.assertNotEqual(
+			sensor, self.portia_api.device('AAAABBBBCCCC').port(2).sensor(1)
+		)
+		self.assertNotEqual(
+			self.portia_api.device('AAAABBBBCCCC').port(1).dimension(2),
+			self.portia_api.device('AAAABBBBCCCC').port(1).sensor(2)
+		)
+
+	def test_pickle(self):
+		event = self.portia_api.device('AAAABBBBCCCC').port(1).sensor(2) \
+			.dimension(3).event(4)
+
+		restored = pickle.loads(pickle.dumps(event))
+
+		self.assertIsInstance(
+			restored, portia.EdgeDeviceEventFromSensorDimension
+		)
+		self.assertEqual(restored, event)
+		self.assertEqual(repr(restored), repr(event))
+		self.assertDictEqual(restored.portia_config, event.portia_config)
+
+	def test_pickle_leaves_resources_out(self):
+		portia_api = portia.PortiaApi({
+			**self.portia_api.portia_config,
+			'limiter': limiter.RateLimiter(rate=10),
+			'cache': cache.ResponseCache()
+		}, transport=transport.PortiaTransport())
+		sensor = portia_api.device('AAAABBBBCCCC').port(1).sensor(2)
+
+		restored = pickle.loads(pickle.dumps(sensor))
+
+		self.assertEqual(restored, sensor)
+		self.assertEqual(hash(restored), hash(sensor))
+		self.assertDictEqual(
+			restored.portia_config, self.portia_api.portia_config
+		)
+		self.assertEqual(
+			sensor, self.portia_api.device('AAAABBBBCCCC').port(1).sensor(2)
+		)
+
+	def test_bounded_memos(self):
+		device = self.portia_api.device('AAAABBBBCCCC')
+
+		for port in range(portia.MAX_CHILDREN + 10):
+			device.port(port)
+
+		for edge_id in range(portia.MAX_DEVICES + 10):
+			self.portia_api.device(str(edge_id))
+
+		self.assertEqual(len(device._children), portia.MAX_CHILDREN)
+		self.assertEqual(len(self.portia_api._devices), portia.MAX_DEVICES)
+		self.assertNotIn((portia.EdgeDevicePort, 0), device._children)
+		self.assertIs(
+			device.port(portia.MAX_CHILDREN), device.port(portia.MAX_CHILDREN)
+		)
+
+
+if __name__ == '__main__':
+	unittest.main()
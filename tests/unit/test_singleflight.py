@@ -0,0 +1,116 @@
+"""Unit testing of PortiaPy's singleflight module.
+"""
+
+import threading
+import time
+import unittest
+
+from portiapy import fanout, portia, singleflight
+from tests.unit.helpers import SELECT_CSV, StubTransport
+
+
+class TestSingleFlight(unittest.TestCase):
+	"""Set of unit tests for all functions concerning request coalescing.
+	"""
+	def setUp(self):
+		self.group = singleflight.SingleFlight()
+		self.transport = StubTransport(SELECT_CSV, gate=threading.Event())
+		self.sensor = portia.PortiaApi({
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'debug': False,
+			'Accept': 'text/csv',
+			'singleflight': self.group
+		}, transport=self.transport).device('AAAABBBBCCCC').port(1).sensor(1)
+
+	def run_concurrently(self, function, callers=5):
+		def release():
+			while self.group.shared < callers - 1:
+				time.sleep(0.001)
+
+			self.transport.gate.set()
+
+		threading.Thread(target=release).start()
+
+		return fanout.fan_out(
+			lambda index: function(), range(callers), max_workers=callers
+		)
+
+	def test_identical_queries_share_one_call(self):
+		results, errors = self.run_concurrently(
+			lambda: self.sensor.select(last=True)
+		)
+
+		self.assertDictEqual(errors, {})
+		self.assertEqual(self.transport.count, 1)
+
+		dataframes = [results[index] for index in range(5)]
+		dataframes[0]['dimension_value'] = 0.0
+
+		for dataframe in dataframes[1:]:
+			self.assertIsNot(dataframe, dataframes[0])
+			self.assertEqual(dataframe['dimension_value'].iloc[0], 24.5)
+
+	def test_errors_are_shared(self):
+		self.transport.status_code = 503
+
+		results, errors = self.run_concurrently(
+			lambda: self.sensor.select(last=True)
+		)
+
+		self.assertEqual(len(errors), 5)
+		self.assertEqual(self.transport.count, 1)
+
+	def test_sequential_queries_are_not_shared(self):
+		self.transport.gate.set()
+
+		self.sensor.select(last=True)
+		self.sensor.select(last=True)
+
+		self.assertEqual(self.transport.count, 2)
+
+	def test_share(self):
+		shared = [{'ports': [1, 2]}]
+
+		self.assertListEqual(singleflight.share(shared), shared)
+		self.assertIsNot(singleflight.share(shared)[0], shared[0])
+
+	def test_only_followers_get_copies(self):
+		original = {'ports': [1, 2]}
+
+		def leader():
+			while self.group.shared < 2:
+				time.sleep(0.001)
+
+			return original
+
+		results, errors = fanout.fan_out(
+			lambda index: self.group.do('key', leader, singleflight.share),
+			range(3),
+			max_workers=3
+		)
+
+		self.assertDictEqual(errors, {})
+		self.assertEqual(
+			[result is original for result in results.values()].count(True), 1
+		)
+		self.assertEqual(
+			len({id(result['ports']) for result in results.values()}), 3
+		)
+
+	def test_callers_mutating_their_results(self):
+		results, errors = self.run_concurrently(self.sensor.select)
+		dataframes = list(results.values())
+
+		dataframes[0].loc[0, 'dimension_value'] = 0.0
+		dataframes[1]['dimension_value'] *= 2
+
+		self.assertEqual(self.transport.count, 1)
+		self.assertListEqual(
+			[dataframe.at[0, 'dimension_value'] for dataframe in dataframes],
+			[0.0, 49.0, 24.5, 24.5, 24.5]
+		)
+
+
+if __name__ == '__main__':
+	unittest.main()
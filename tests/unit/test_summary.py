@@ -0,0 +1,190 @@
+"""Unit testing of PortiaPy's summary module.
+"""
+
+import unittest
+
+import pandas as pd
+
+from portiapy import summary
+from portiapy.summary import SummaryStrategies
+
+
+HOUR = 3600000
+
+
+def build_series(timestamps, values, dimension_codes=None):
+	"""Builds a select's series of port 1, sensor 1.
+	"""
+	if dimension_codes is None:
+		dimension_codes = [1] * len(values)
+
+	return pd.DataFrame({
+		'header_timestamp': pd.Series(timestamps, dtype='int64'),
+		'port': pd.Series([1] * len(values), dtype='int16'),
+		'sensor': pd.Series([1] * len(values), dtype='int16'),
+		'dimension_code': pd.Series(dimension_codes, dtype='int32'),
+		'dimension_unity_code': pd.Series([1] * len(values), dtype='int16'),
+		'dimension_thing_code': pd.Series([15] * len(values), dtype='int16'),
+		'dimension_value': pd.Series(values, dtype='float64')
+	})
+
+
+class TestSummarize(unittest.TestCase):
+	"""Set of unit tests for the local summarizer.
+	"""
+	def setUp(self):
+		# 2021-01-01 00:00 UTC, then every 20 minutes for three hours
+		self.start = 1609459200000
+		self.series = build_series(
+			[self.start + index * HOUR // 3 for index in range(9)],
+			[1, 2, 2, 4, 4, 5, 10, 11, 12]
+		)
+
+	def test_per_hour(self):
+		summarized = summary.summarize(self.series)
+
+		self.assertListEqual(list(summarized.columns), [
+			'header_timestamp', 'port', 'sensor', 'dimension_code',
+			'dimension_unity_code', 'dimension_thing_code',
+			'number_of_packages', 'avg', 'min', 'max'
+		])
+		self.assertListEqual(
+			summarized['header_timestamp'].tolist(),
+			[self.start, self.start + HOUR, self.start + 2 * HOUR]
+		)
+		self.assertListEqual(
+			summarized['number_of_packages'].tolist(), [3, 3, 3]
+		)
+		self.assertListEqual(summarized['avg'].tolist(), [5 / 3, 13 / 3, 11])
+		self.assertListEqual(summarized['min'].tolist(), [1, 4, 10])
+		self.assertListEqual(summarized['max'].tolist(), [2, 5, 12])
+		self.assertEqual(summarized['port'].dtype, 'int16')
+		self.assertEqual(summarized['dimension_code'].dtype, 'int32')
+
+	def test_statistics(self):
+		summarized = summary.summarize(self.series, params={
+			'avg': False, 'min': False, 'max': False, 'sum': True,
+			'median': True, 'mode': True, 'stddev': True, 'spread': True,
+			'last_timestamp': True
+		})
+
+		self.assertListEqual(list(summarized.columns[6:]), [
+			'number_of_packages', 'sum', 'median', 'mode', 'stddev', 'spread',
+			'last_timestamp'
+		])
+		self.assertListEqual(summarized['sum'].tolist(), [5, 13, 33])
+		self.assertListEqual(summarized['median'].tolist(), [2, 4, 11])
+		self.assertListEqual(summarized['mode'].tolist(), [2, 4, 10])
+		self.assertAlmostEqual(summarized['stddev'].iloc[2], 1.0)
+		self.assertListEqual(summarized['spread'].tolist(), [1, 1, 2])
+		self.assertEqual(
+			summarized['last_timestamp'].iloc[0], self.start + 2 * HOUR // 3
+		)
+
+	def test_timezone(self):
+		# 02:00 UTC is still the previous day in São Paulo, at UTC-3
+		series = build_series(
+			[self.start + 2 * HOUR, self.start + 4 * HOUR], [1, 3]
+		)
+		summarized = summary.summarize(
+			series,
+			SummaryStrategies.PER_DAY,
+			params={'timezone': 'America/Sao_Paulo'}
+		)
+
+		self.assertListEqual(
+			summarized['header_timestamp'].tolist(),
+			[self.start - 21 * HOUR, self.start + 3 * HOUR]
+		)
+
+	def test_intervals(self):
+		summarized = summary.summarize(
+			self.series, SummaryStrategies.PER_HOUR, 2
+		)
+		self.assertListEqual(summarized['number_of_packages'].tolist(), [6, 3])
+
+		monthly = summary.summarize(
+			build_series([self.start, self.start + 40 * 24 * HOUR], [1, 3]),
+			SummaryStrategies.PER_MONTH
+		)
+		self.assertListEqual(
+			monthly['header_timestamp'].tolist(),
+			[self.start, self.start + 31 * 24 * HOUR]
+		)
+
+		yearly = summary.summarize(
+			build_series([self.start, self.start + 40 * 24 * HOUR], [1, 3]),
+			SummaryStrategies.PER_YEAR
+		)
+		self.assertListEqual(yearly['number_of_packages'].tolist(), [2])
+
+	def test_series_are_summarized_apart(self):
+		series = build_series(
+			[self.start, self.start, self.start + 1],
+			[1, 10, 3],
+			dimension_codes=[1, 2, 1]
+		)
+		summarized = summary.summarize(series)
+
+		self.assertListEqual(summarized['dimension_code'].tolist(), [1, 2])
+		self.assertListEqual(summarized['avg'].tolist(), [2, 10])
+
+	def test_window_and_bounds(self):
+		summarized = summary.summarize(self.series, params={
+			'from': self.start + HOUR,
+			'to': self.start + 2 * HOUR,
+			'upper_bound': 10
+		})
+
+		self.assertListEqual(summarized['number_of_packages'].tolist(), [3, 1])
+		self.assertListEqual(summarized['max'].tolist(), [5, 10])
+
+	def test_fill(self):
+		series = self.series[
+			(self.series['header_timestamp'] < self.start + HOUR) |
+			(self.series['header_timestamp'] >= self.start + 2 * HOUR)
+		]
+		window = {'from': self.start - HOUR, 'to': self.start + 3 * HOUR - 1}
+
+		nulls = summary.summarize(series, params={**window, 'fill': 'null'})
+		self.assertListEqual(
+			nulls['number_of_packages'].tolist(), [0, 3, 0, 3]
+		)
+		self.assertTrue(pd.isna(nulls['avg'].iloc[2]))
+
+		previous = summary.summarize(
+			series, params={**window, 'fill': 'previous'}
+		)
+		self.assertEqual(previous['max'].iloc[2], 2)
+		self.assertTrue(pd.isna(previous['max'].iloc[0]))
+
+		zeros = summary.summarize(series, params={**window, 'fill': 0})
+		self.assertListEqual(zeros['min'].tolist(), [0, 1, 0, 10])
+
+		with self.assertRaises(ValueError):
+			summary.summarize(series, params={'fill': 'sideways'})
+
+	def test_order_and_limit(self):
+		summarized = summary.summarize(
+			self.series, params={'order': 'desc', 'limit': 2}
+		)
+
+		self.assertListEqual(
+			summarized['header_timestamp'].tolist(),
+			[self.start + 2 * HOUR, self.start + HOUR]
+		)
+
+	def test_unsupported(self):
+		with self.assertRaises(ValueError):
+			summary.summarize(self.series, params={'offset': 60})
+
+		with self.assertRaises(ValueError):
+			summary.summarize(
+				self.series.drop(columns='dimension_value').assign(
+					event_code=1
+				)
+			)
+
+
+if __name__ == '__main__':
+	unittest.main()
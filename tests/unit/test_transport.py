@@ -0,0 +1,176 @@
+"""Unit testing of PortiaPy's transport module.
+"""
+
+import asyncio
+import unittest
+
+import requests
+
+try:
+	import httpx
+except ImportError:
+	httpx = None
+
+from portiapy import portia, transport, utils
+from tests.unit.helpers import FakeClock, SequenceAdapter, StubTransport
+
+
+class TestPortiaTransport(unittest.TestCase):
+	"""Set of unit tests for all functions concerning the HTTP transport.
+	"""
+	def test_pool_size(self):
+		with transport.PortiaTransport(pool_maxsize=32) as transport_:
+			adapter = transport_.session.get_adapter('https://localhost')
+			self.assertEqual(adapter._pool_maxsize, 32)
+
+	def test_accept_encoding(self):
+		with transport.PortiaTransport() as transport_:
+			self.assertIn('gzip', transport_.session.headers['Accept-Encoding'])
+
+		with transport.PortiaTransport(compress=False) as transport_:
+			self.assertEqual(
+				transport_.session.headers['Accept-Encoding'], 'identity'
+			)
+
+	def test_default_transport_is_shared(self):
+		self.assertIs(
+			transport.get_transport({}), transport.get_transport({})
+		)
+
+	def test_portia_api_transport(self):
+		transport_ = transport.PortiaTransport()
+		portia_config = {'baseurl': 'http://localhost'}
+
+		portia_api = portia.PortiaApi(portia_config, transport=transport_)
+		self.assertIs(portia_api.transport, transport_)
+		self.assertNotIn('transport', portia_config)
+
+		portia_api = portia.PortiaApi(portia_config)
+		self.assertIs(portia_api.transport, transport.default_transport())
+
+	def test_http_requests_use_transport(self):
+		transport_ = StubTransport('')
+		portia_config = {
+			'baseurl': 'http://localhost',
+			'authorization': 'token',
+			'transport': transport_
+		}
+
+		utils.http_get_request(
+			portia_config, '/describe', optional_headers={'Accept': 'text/csv'}
+		)
+		utils.http_post_request(portia_config, '/summary', {'series': []})
+
+		self.assertEqual(transport_.calls[0]['method'], 'GET')
+		self.assertEqual(
+			transport_.calls[0]['url'], 'http://localhost/describe'
+		)
+		self.assertDictEqual(transport_.calls[0]['headers'], {
+			'Authorization': 'Bearer token',
+			'Accept': 'text/csv'
+		})
+		self.assertEqual(transport_.calls[1]['method'], 'POST')
+		self.assertDictEqual(transport_.calls[1]['json'], {'series': []})
+
+
+
+class TestRetryPolicy(unittest.TestCase):
+	"""Set of unit tests for all functions concerning retried requests.
+	"""
+	def setUp(self):
+		self.clock = FakeClock()
+
+	def build_transport(self, outcomes, **kwargs):
+		transport_ = transport.PortiaTransport(retry=transport.RetryPolicy(
+			sleep=self.clock.sleep, clock=self.clock, **kwargs
+		))
+		transport_.adapter = SequenceAdapter(outcomes)
+		transport_.session.mount('http://', transport_.adapter)
+
+		return transport_
+
+	def test_retries_transient_statuses(self):
+		transport_ = self.build_transport(
+			[(503, {}), (502, {}), (200, {})], backoff=1, max_backoff=4
+		)
+
+		response = transport_.request('GET', 'http://localhost/select')
+
+		self.assertEqual(response.status_code, 200)
+		self.assertEqual(len(self.clock.sleeps), 2)
+		self.assertTrue(all(0 <= sleep <= 4 for sleep in self.clock.sleeps))
+
+	def test_retry_after(self):
+		transport_ = self.build_transport(
+			[(429, {'Retry-After': '7'}), (200, {})]
+		)
+
+		transport_.request('GET', 'http://localhost/select')
+
+		self.assertListEqual(self.clock.sleeps, [7.0])
+		self.assertListEqual(transport_.adapter.timeouts, [None, None])
+
+	def test_retry_after_date(self):
+		response = requests.Response()
+		response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+		self.assertEqual(transport.RetryPolicy.retry_after(response), 0.0)
+
+	def test_post_is_not_retried(self):
+		transport_ = self.build_transport([(503, {}), (200, {})])
+
+		response = transport_.request('POST', 'http://localhost/summary')
+
+		self.assertEqual(response.status_code, 503)
+		self.assertListEqual(self.clock.sleeps, [])
+
+	def test_attempts_run_out(self):
+		transport_ = self.build_transport([(503, {})] * 3, attempts=3)
+
+		response = transport_.request('GET', 'http://localhost/select')
+
+		self.assertEqual(response.status_code, 503)
+		self.assertEqual(len(self.clock.sleeps), 2)
+
+	def test_deadline(self):
+		transport_ = self.build_transport(
+			[(503, {'Retry-After': '30'})] * 3, deadline=10
+		)
+
+		response = transport_.request('GET', 'http://localhost/select')
+
+		self.assertEqual(response.status_code, 503)
+		self.assertListEqual(self.clock.sleeps, [10])
+		self.assertEqual(transport_.adapter.timeouts[0], 10)
+
+	def test_connection_errors(self):
+		transport_ = self.build_transport(
+			[requests.ConnectionError('reset')] * 2, attempts=2
+		)
+
+		with self.assertRaises(requests.ConnectionError):
+			transport_.request('GET', 'http://localhost/select')
+
+		self.assertEqual(len(self.clock.sleeps), 1)
+
+	@unittest.skipIf(httpx is None, 'httpx is not installed')
+	def test_async_retries(self):
+		statuses = [503, 200]
+
+		transport_ = transport.AsyncPortiaTransport(
+			retry=transport.RetryPolicy(backoff=0.001)
+		)
+		transport_.client = httpx.AsyncClient(transport=httpx.MockTransport(
+			lambda request: httpx.Response(statuses.pop(0))
+		))
+
+		response = asyncio.run(
+			transport_.request('GET', 'http://localhost/select')
+		)
+
+		self.assertEqual(response.status_code, 200)
+		self.assertListEqual(statuses, [])
+
+
+if __name__ == '__main__':
+	unittest.main()
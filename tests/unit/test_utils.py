@@ -1,11 +1,50 @@
 """Unit testing of PortiaPy's utils module.
 """
 
+import gzip
+import os
+import tempfile
 import unittest
+from contextlib import redirect_stdout
+from io import BytesIO, StringIO
 
 import pandas as pd
+import requests
+from urllib3.response import HTTPResponse
+
+try:
+	import pyarrow
+except ImportError:
+	pyarrow = None
 
 from portiapy import utils
+from tests.unit.helpers import DEVICE_SELECT_CSV
+
+
+def build_response(body, stream=False, encoding=None):
+	"""Builds a response object as returned by requests, with its body
+	compressed on the wire when an encoding is given.
+	"""
+	response = requests.Response()
+	response.url = 'http://localhost/select'
+	response.status_code = 200
+
+	content = body.encode()
+
+	if encoding == 'gzip':
+		content = gzip.compress(content)
+		response.headers['Content-Encoding'] = encoding
+
+	if stream == True:
+		response.raw = HTTPResponse(
+			body=BytesIO(content),
+			headers=response.headers,
+			preload_content=False
+		)
+	else:
+		response._content = content
+
+	return response
 
 
 class TestHumanization(unittest.TestCase):
@@ -102,6 +141,28 @@ class TestHumanization(unittest.TestCase):
 		)
 		self.assertEqual(h_dataframe.iloc[1].get('dimension_unity'), '%')
 
+	def test_humanize_dataframe_categorical(self):
+		dataframe = pd.DataFrame({
+			'dimension_code': [1, 1, 3, 999, 1],
+			'dimension_thing_code': [15, 15, 16, 16, 15]
+		})
+
+		h_dataframe = utils.humanize_dataframe(dataframe, locale='pt-br')
+		self.assertEqual(h_dataframe['dimension'].dtype, 'category')
+		self.assertListEqual(
+			h_dataframe['dimension'].astype(object).fillna('Unknown').tolist(), [
+				'Temperatura Pontual',
+				'Temperatura Pontual',
+				'Umidade Pontual',
+				'Unknown',
+				'Temperatura Pontual'
+			]
+		)
+		self.assertListEqual(
+			list(h_dataframe['dimension_thing'].cat.categories),
+			['Sensor_Inobram_T', 'Sensor_Inobram_TU']
+		)
+
 	def test_humanize_json(self):
 		json_ = {
 			'device': 'AAAABBBBCCCC',
@@ -154,5 +215,205 @@ class TestHumanization(unittest.TestCase):
 		})
 
 
+class TestConversion(unittest.TestCase):
+	"""Set of unit tests for all functions concerning conversion of responses.
+	"""
+	def test_convert_csv(self):
+		dataframe = utils.convert_csv(
+			{'debug': False}, build_response(DEVICE_SELECT_CSV)
+		)
+
+		self.assertEqual(len(dataframe.index), 3)
+		self.assertListEqual(dataframe['sensor'].tolist(), [1, 1, 2])
+
+	def test_convert_csv_schema(self):
+		dataframe = utils.convert_csv(
+			{'debug': False, 'float32': True},
+			build_response(DEVICE_SELECT_CSV),
+			utils.SELECT_SCHEMA
+		)
+
+		self.assertEqual(dataframe['header_timestamp'].dtype, 'int64')
+		self.assertEqual(dataframe['port'].dtype, 'int16')
+		self.assertEqual(dataframe['dimension_code'].dtype, 'int32')
+		self.assertEqual(dataframe['dimension_value'].dtype, 'float32')
+		self.assertEqual(
+			utils.humanize_dataframe(dataframe).iloc[2]['dimension'],
+			'Average Temperature'
+		)
+
+	def test_convert_csv_streamed(self):
+		response = build_response(DEVICE_SELECT_CSV, stream=True)
+		dataframe = utils.convert_csv({'debug': False}, response)
+
+		self.assertListEqual(
+			dataframe['dimension_value'].tolist(), [24.5, 24.7, 60.2]
+		)
+		self.assertTrue(response.raw.closed)
+
+	def test_convert_csv_error(self):
+		response = build_response(
+			DEVICE_SELECT_CSV.replace('1565634280016', 'never'), stream=True
+		)
+
+		with self.assertRaises(Exception) as context:
+			utils.convert_csv({'debug': False}, response, utils.SELECT_SCHEMA)
+
+		self.assertIn('couldn\'t create data frame', str(context.exception))
+		self.assertIsInstance(context.exception.__cause__, ValueError)
+		self.assertTrue(response.raw.closed)
+
+	def test_convert_csv_chunksize(self):
+		dataframes = list(utils.convert_csv(
+			{'debug': False, 'chunksize': 2},
+			build_response(DEVICE_SELECT_CSV, stream=True)
+		))
+
+		self.assertListEqual(
+			[len(dataframe.index) for dataframe in dataframes], [2, 1]
+		)
+		self.assertListEqual(dataframes[1]['port'].tolist(), [1])
+
+	def test_convert_csv_chunk_error(self):
+		response = build_response(
+			DEVICE_SELECT_CSV.replace('1565634340016', 'never'), stream=True
+		)
+		dataframes = utils.convert_csv(
+			{'debug': False, 'chunksize': 2}, response, utils.SELECT_SCHEMA
+		)
+
+		self.assertEqual(len(next(dataframes).index), 2)
+
+		with self.assertRaises(Exception) as context:
+			next(dataframes)
+
+		self.assertIn('couldn\'t create data frame', str(context.exception))
+		self.assertIsInstance(context.exception.__cause__, ValueError)
+		self.assertTrue(response.raw.closed)
+
+	def test_convert_csv_chunks_dropped(self):
+		response = build_response(DEVICE_SELECT_CSV, stream=True)
+		dataframes = utils.convert_csv(
+			{'debug': False, 'chunksize': 2}, response
+		)
+
+		self.assertFalse(response.raw.closed)
+		del dataframes
+		self.assertTrue(response.raw.closed)
+
+	def test_convert_csv_compressed(self):
+		body = DEVICE_SELECT_CSV + DEVICE_SELECT_CSV.split('\n', 1)[1] * 100
+		output = StringIO()
+
+		with redirect_stdout(output):
+			dataframe = utils.convert_csv(
+				{'debug': True},
+				build_response(body, stream=True, encoding='gzip'),
+				utils.SELECT_SCHEMA
+			)
+
+		self.assertEqual(len(dataframe.index), 303)
+		self.assertIn(
+			'{0} bytes decoded (gzip)'.format(len(body)), output.getvalue()
+		)
+		self.assertLess(
+			int(output.getvalue().split(' bytes received')[0].split()[-1]),
+			len(body) // 10
+		)
+
+	def test_loads(self):
+		orjson = utils.orjson
+
+		try:
+			for utils.orjson in (orjson, None):
+				self.assertDictEqual(
+					utils.loads(b'{"ports": [1, 2]}'), {'ports': [1, 2]}
+				)
+		finally:
+			utils.orjson = orjson
+
+	def test_convert_json_debug_is_bounded(self):
+		output = StringIO()
+		body = '{{"ports": [{0}]}}'.format(', '.join(map(str, range(1000))))
+
+		with redirect_stdout(output):
+			json_ = utils.convert_json({'debug': True}, build_response(body))
+
+		self.assertEqual(len(json_['ports']), 1000)
+		self.assertLess(len(output.getvalue()), 200)
+
+	def test_convert_json_streamed(self):
+		response = build_response('{"ports": [1, 2]}', stream=True)
+
+		self.assertDictEqual(
+			utils.convert_json({'debug': False}, response), {'ports': [1, 2]}
+		)
+		self.assertTrue(response.raw.closed)
+
+
+	def test_convert_json_error_closes(self):
+		response = build_response('{"message": "unknown device"}', stream=True)
+		response.status_code = 404
+		closed = []
+		response.close = lambda: closed.append(True)
+
+		with self.assertRaises(Exception) as context:
+			utils.convert_json({'debug': False}, response)
+
+		self.assertIn('unknown device', str(context.exception))
+		self.assertListEqual(closed, [True])
+
+@unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+class TestArrowConversion(unittest.TestCase):
+	"""Set of unit tests for all functions concerning the Arrow output.
+	"""
+	def test_convert_arrow(self):
+		table = utils.convert(
+			'text/csv',
+			{'debug': False, 'output': 'arrow', 'float32': True},
+			build_response(DEVICE_SELECT_CSV, stream=True),
+			utils.SELECT_SCHEMA
+		)
+
+		self.assertIsInstance(table, pyarrow.Table)
+		self.assertEqual(table.num_rows, 3)
+		self.assertEqual(table.schema.field('port').type, pyarrow.int16())
+		self.assertEqual(
+			table.schema.field('dimension_value').type, pyarrow.float32()
+		)
+
+	def test_convert_arrow_error(self):
+		response = build_response(DEVICE_SELECT_CSV)
+		response.status_code = 500
+
+		with self.assertRaises(Exception):
+			utils.convert_arrow({'debug': False}, response)
+
+	def test_to_parquet(self):
+		with tempfile.TemporaryDirectory() as directory:
+			path = os.path.join(directory, 'select.parquet')
+
+			utils.to_parquet(
+				utils.convert_arrow(
+					{'debug': False},
+					build_response(DEVICE_SELECT_CSV),
+					utils.SELECT_SCHEMA
+				),
+				path
+			)
+			self.assertListEqual(
+				pd.read_parquet(path)['sensor'].tolist(), [1, 1, 2]
+			)
+
+			utils.to_parquet(
+				utils.convert_csv(
+					{'debug': False, 'chunksize': 2},
+					build_response(DEVICE_SELECT_CSV)
+				),
+				path
+			)
+			self.assertEqual(len(pd.read_parquet(path).index), 3)
+
+
 if __name__ == '__main__':
 	unittest.main()